@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Archive Writer Latency Benchmark
+Compares archiving quests inline on the event loop against the background
+AsyncArchiveWriter, with a simulated slow disk.
+
+Usage: python benchmarks/bench_archive_writer.py --quests 200 --disk-latency 0.01
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from oracle_archive import AsyncArchiveWriter, SegmentArchive
+
+
+class SlowSegmentArchive(SegmentArchive):
+    """SegmentArchive whose block writes take ``disk_latency`` seconds"""
+
+    disk_latency = 0.0
+
+    def _write_block(self):
+        if self._pending:
+            time.sleep(self.disk_latency)
+        super()._write_block()
+
+
+def sample_quest(i: int) -> dict:
+    return {
+        "quest_id": f"quest-{i}",
+        "intention_seed": "I want to create a piece of music that captures the feeling of rain on autumn leaves",
+        "sacred_dialogue": [{"speaker": "Oracle Guardian", "message": "Welcome, creator"}] * 6
+    }
+
+
+async def probe_loop_latency(stop: asyncio.Event, interval: float = 0.005) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def measure(label: str, archive_quest, quests: int, finish=None):
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_latency(stop))
+    await asyncio.sleep(0)
+
+    latencies = []
+    started = time.perf_counter()
+    for i in range(quests):
+        call_started = time.perf_counter()
+        await archive_quest(sample_quest(i))
+        latencies.append(time.perf_counter() - call_started)
+        await asyncio.sleep(0)
+    if finish is not None:
+        await finish()
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    worst_stall = await probe
+    print(f"{label:<12} archive call p50 {statistics.median(latencies) * 1000:7.2f}ms  "
+          f"max {max(latencies) * 1000:7.2f}ms  worst loop stall {worst_stall * 1000:7.1f}ms  "
+          f"total {elapsed:6.2f}s")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quests", type=int, default=200)
+    parser.add_argument("--disk-latency", type=float, default=0.01)
+    args = parser.parse_args()
+    SlowSegmentArchive.disk_latency = args.disk_latency
+
+    print(f"🗄️ {args.quests} quests, {args.disk_latency * 1000:.0f}ms simulated disk latency per write")
+    with tempfile.TemporaryDirectory() as archive_dir:
+        inline = SlowSegmentArchive(archive_dir, "inline", flush_records=1)
+
+        async def archive_inline(quest):
+            # Old behaviour: blocking write inside the coroutine
+            inline.append(quest, key=quest["quest_id"])
+
+        await measure("inline", archive_inline, args.quests)
+        inline.close()
+
+        writer = AsyncArchiveWriter(SlowSegmentArchive(archive_dir, "background"))
+
+        async def archive_background(quest):
+            await writer.submit(quest, key=quest["quest_id"])
+
+        await measure("background", archive_background, args.quests, finish=writer.drain)
+        print(f"background writer: {writer.stats()['batches']} batched writes, "
+              f"last quest readable: {writer.get(f'quest-{args.quests - 1}') is not None}")
+        await writer.aclose()
+        writer.close()
+        writer.archive.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
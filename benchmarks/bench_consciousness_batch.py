@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Consciousness Stream Batch Benchmark
+Streams/sec for one-at-a-time generate_consciousness_stream versus
+ConsciousnessStreamGenerator.generate_batch, plus a reproducibility check.
+
+Usage: python benchmarks/bench_consciousness_batch.py --streams 20000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "consciousness_streams"))
+
+from consciousness_stream_generator import ConsciousnessStreamGenerator
+
+SAMPLE_QUESTS = [
+    ("I seek guidance for my creative vision: I want to write a song that captures the feeling of rain", "musical"),
+    ("I seek guidance for my creative vision: I want to design a garden connected to natural cycles", "architectural"),
+    ("I seek guidance for my creative vision: I want to paint the experience of swimming through light", "visual"),
+    ("I seek guidance for my creative vision: I want to write a poem about the weight of moonlight", "literary"),
+]
+
+
+async def one_at_a_time(count: int) -> float:
+    generator = ConsciousnessStreamGenerator()
+    started = time.perf_counter()
+    for i in range(count):
+        quest, domain = SAMPLE_QUESTS[i % len(SAMPLE_QUESTS)]
+        await generator.generate_consciousness_stream(quest, domain)
+    return time.perf_counter() - started
+
+
+def batched(count: int, seed: int) -> float:
+    generator = ConsciousnessStreamGenerator()
+    quests = [SAMPLE_QUESTS[i % len(SAMPLE_QUESTS)] for i in range(count)]
+    started = time.perf_counter()
+    generator.generate_batch([q for q, _ in quests], [d for _, d in quests], seed=seed)
+    return time.perf_counter() - started
+
+
+def batch_fingerprint(seed: int) -> str:
+    generator = ConsciousnessStreamGenerator()
+    streams = generator.generate_batch(
+        [q for q, _ in SAMPLE_QUESTS], [d for _, d in SAMPLE_QUESTS],
+        seed=seed, timestamp="2025-01-01T00:00:00"
+    )
+    return json.dumps([asdict(stream) for stream in streams], sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    sequential = asyncio.run(one_at_a_time(args.streams))
+    batch = batched(args.streams, args.seed)
+
+    print(f"🌊 {args.streams} consciousness streams")
+    print(f"one-at-a-time {args.streams / sequential:10.0f} streams/s")
+    print(f"generate_batch {args.streams / batch:9.0f} streams/s  ({sequential / batch:.2f}x)")
+
+    reproducible = batch_fingerprint(args.seed) == batch_fingerprint(args.seed)
+    print(f"reproducible for seed {args.seed}: {'✅' if reproducible else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Generation Pool Throughput Benchmark
+Compares inline blocking Gemini calls against the bounded GenerationPool
+using the offline FakeGenerativeModel.
+
+Usage: python benchmarks/bench_generation_pool.py --queries 32 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from oracle_generation import FakeGenerativeModel, GenerationPool
+
+
+async def probe_loop_latency(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """Worst delay seen by a cheap coroutine (stand-in for /health)"""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def run_inline(model, queries: int):
+    """Old behaviour: call the blocking SDK directly inside the coroutine"""
+    async def query(i):
+        return model.generate_content(f"question {i}").text
+
+    return await asyncio.gather(*(query(i) for i in range(queries)))
+
+
+async def run_pooled(model, queries: int, concurrency: int):
+    pool = GenerationPool(model, max_concurrency=concurrency, timeout=60, max_queue=0)
+    try:
+        return await asyncio.gather(*(pool.generate(f"question {i}") for i in range(queries)))
+    finally:
+        pool.shutdown()
+
+
+async def measure(label: str, runner, queries: int):
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_latency(stop))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await runner()
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    worst_stall = await probe
+
+    print(f"{label:<10} {elapsed:8.2f}s  {queries / elapsed:8.1f} queries/s  "
+          f"worst loop stall {worst_stall * 1000:8.1f}ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    model = FakeGenerativeModel(latency=args.latency)
+
+    print(f"🔮 {args.queries} queries, {args.latency}s fake model latency, "
+          f"pool concurrency {args.concurrency}")
+    await measure("inline", lambda: run_inline(model, args.queries), args.queries)
+    await measure("pooled", lambda: run_pooled(model, args.queries, args.concurrency), args.queries)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Stream History Soak Test
+Generates a large number of consciousness streams and samples resident
+memory, showing the bounded history stays flat while older streams spill
+to disk.
+
+Usage: python benchmarks/bench_history_soak.py --streams 1000000 --ring 1000
+"""
+
+import argparse
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "consciousness_streams"))
+
+from consciousness_stream_generator import ConsciousnessStreamGenerator
+
+
+def current_rss_mb() -> float:
+    """Resident set size from /proc, falling back to the peak on other platforms"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / (1024 * 1024)
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=1000000)
+    parser.add_argument("--ring", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=10000)
+    parser.add_argument("--no-spill", action="store_true", help="drop old streams instead of spilling")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+        spill_path = None if args.no_spill else str(Path(spill_dir) / "consciousness_streams.jsonl")
+        generator = ConsciousnessStreamGenerator(history_size=args.ring, history_spill_path=spill_path)
+        quests = ["I seek guidance for my creative vision: I want to write a song that captures the feeling of rain"] * args.batch
+
+        print(f"🌊 soak: {args.streams} streams, ring {args.ring}, spill {'off' if args.no_spill else 'on'}")
+        started = time.perf_counter()
+        generated = 0
+        report_every = max(args.batch, args.streams // 10)
+        while generated < args.streams:
+            count = min(args.batch, args.streams - generated)
+            generator.generate_batch(quests[:count], "musical", seed=generated)
+            generated += count
+            if generated % report_every == 0 or generated == args.streams:
+                print(f"{generated:>9} streams  rss {current_rss_mb():8.1f} MB  "
+                      f"{generated / (time.perf_counter() - started):8.0f} streams/s")
+
+        history = generator.stream_history
+        print(f"history: {history.stats()}")
+        oldest = generator.get_stream_history(0, 1)
+        print(f"oldest readable: {bool(oldest)}  newest readable: {bool(generator.get_stream_history(len(history) - 1, 1))}")
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
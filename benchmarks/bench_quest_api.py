@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Quest API Load Benchmark
+Drives many concurrent quests through the full HTTP lifecycle of the cloud
+app (initiate, intention, deepening answers, finalize, oracle) in
+process, passing back the dialogue cursor each step returned, and
+reports per-stage latency and response sizes. Extra deepening answers
+grow the dialogue to show that step responses stay the same size.
+
+Usage: ORACLE_MODEL_BACKEND=fake python benchmarks/bench_quest_api.py --quests 500 --concurrency 50 --answers 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+STAGES = ["initiate", "intention", "deepening", "finalize", "oracle"]
+
+
+async def run_quest(client, latencies, sizes, index: int, answers: int):
+    cursor = None
+
+    async def call(stage: str, path: str, body: dict = None):
+        nonlocal cursor
+        started = time.perf_counter()
+        params = {"since": cursor} if cursor is not None else None
+        response = await client.post(path, json=body or {}, params=params)
+        latencies[stage].append(time.perf_counter() - started)
+        sizes[stage].append(len(response.content))
+        response.raise_for_status()
+        result = response.json()
+        cursor = result.get("dialogue_cursor", cursor)
+        return result
+
+    quest = await call("initiate", "/quests", {"creator_name": f"creator-{index}"})
+    quest_id = quest["quest_id"]
+    await call("intention", f"/quests/{quest_id}/intention",
+               {"intention": "A piece of music that feels like rain on autumn leaves"})
+    await call("deepening", f"/quests/{quest_id}/deepening",
+               {"question_type": "essence", "response": "Beauty in transition"})
+    await call("deepening", f"/quests/{quest_id}/deepening",
+               {"question_type": "struggle", "response": "Every leaf sounds different"})
+    for _ in range(answers - 2):
+        await call("deepening", f"/quests/{quest_id}/deepening",
+                   {"question_type": "resonance", "response": "Wet stone, low cello, the smell of earth"})
+    await call("finalize", f"/quests/{quest_id}/finalize")
+    await call("oracle", f"/quests/{quest_id}/oracle")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--answers", type=int, default=2, help="deepening answers per quest (at least 2)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("ORACLE_MODEL_BACKEND", "fake")
+    os.environ.setdefault("ORACLE_QUEST_DIR", tempfile.mkdtemp(prefix="oracle-quests-"))
+
+    import httpx
+    from oracle_cloud import app, quest_interface
+
+    latencies = {stage: [] for stage in STAGES}
+    sizes = {stage: [] for stage in STAGES}
+    limit = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(client, index):
+        async with limit:
+            await run_quest(client, latencies, sizes, index, max(2, args.answers))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://oracle") as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(bounded(client, i) for i in range(args.quests)))
+        elapsed = time.perf_counter() - started
+    await quest_interface.flush_archive()
+
+    print(f"🏛️ {args.quests} quests at concurrency {args.concurrency} in {elapsed:.2f}s "
+          f"({args.quests / elapsed:.0f} quests/s)")
+    for stage in STAGES:
+        samples = sorted(latencies[stage])
+        print(f"   {stage:<10} p50 {statistics.median(samples) * 1000:7.2f}ms  "
+              f"p99 {samples[int(len(samples) * 0.99)] * 1000:7.2f}ms  "
+              f"avg body {statistics.mean(sizes[stage]):6.0f}B  max body {max(sizes[stage]):6d}B")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Quest Store Lookup Benchmark
+Loads many archived quests into the SQLite quest store and times status
+lookups (uncached and cached) and indexed searches, next to the legacy
+one-JSON-file-per-quest lookup.
+
+Usage: python benchmarks/bench_quest_store.py --quests 1000000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "sacred_interface"))
+
+from quest_store import SQLiteQuestStore
+
+CREATORS = [f"creator-{i}" for i in range(5000)]
+STAGES = ["invitation", "deepening", "quest_formation", "ready_for_oracle"]
+
+
+def sample_quest(i: int) -> dict:
+    return {
+        "quest_id": f"quest_{i:08d}",
+        "creator_name": CREATORS[i % len(CREATORS)],
+        "initiated_at": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}T{i % 24:02d}:00:{i % 60:02d}",
+        "stage": STAGES[i % len(STAGES)],
+        "intention_seed": "I want to create a piece of music that captures the feeling of rain",
+        "sacred_dialogue": [
+            {"speaker": "Oracle Guardian", "message": "Welcome, creator", "type": "greeting"},
+            {"speaker": "Creator", "message": "rain on autumn leaves", "type": "intention_seed"}
+        ]
+    }
+
+
+def time_lookups(lookup, keys) -> tuple:
+    latencies = []
+    for key in keys:
+        started = time.perf_counter()
+        assert lookup(key) is not None
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return (statistics.median(latencies) * 1e6, latencies[int(len(latencies) * 0.99)] * 1e6)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quests", type=int, default=1000000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--legacy-files", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as work_dir:
+        store = SQLiteQuestStore(Path(work_dir) / "quests.sqlite3", cache_entries=0)
+        started = time.perf_counter()
+        for start in range(0, args.quests, 50000):
+            store.put_many(sample_quest(i) for i in range(start, min(args.quests, start + 50000)))
+        print(f"🏛️ loaded {store.count()} quests in {time.perf_counter() - started:.1f}s")
+
+        keys = [f"quest_{rng.randrange(args.quests):08d}" for _ in range(args.lookups)]
+        p50, p99 = time_lookups(store.get, keys)
+        print(f"sqlite get (uncached)  p50 {p50:8.1f}µs  p99 {p99:8.1f}µs")
+
+        cached = SQLiteQuestStore(Path(work_dir) / "quests.sqlite3")
+        hot_keys = keys[:1000] * (args.lookups // 1000)
+        for key in hot_keys[:1000]:
+            cached.get(key)
+        p50, p99 = time_lookups(cached.get, hot_keys)
+        print(f"sqlite get (cached)    p50 {p50:8.1f}µs  p99 {p99:8.1f}µs")
+
+        creators = [rng.choice(CREATORS) for _ in range(1000)]
+        p50, p99 = time_lookups(lambda creator: store.find(creator_name=creator, limit=20), creators)
+        print(f"find by creator (20)   p50 {p50:8.1f}µs  p99 {p99:8.1f}µs")
+
+        legacy_dir = Path(work_dir) / "legacy"
+        legacy_dir.mkdir()
+        for i in range(args.legacy_files):
+            with open(legacy_dir / f"quest_{i:08d}.json", "w", encoding="utf-8") as f:
+                json.dump(sample_quest(i), f, indent=2, ensure_ascii=False)
+
+        def legacy_lookup(quest_id):
+            with open(legacy_dir / f"{quest_id}.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        legacy_keys = [f"quest_{rng.randrange(args.legacy_files):08d}" for _ in range(args.lookups)]
+        p50, p99 = time_lookups(legacy_lookup, legacy_keys)
+        print(f"legacy JSON file ({args.legacy_files} files) p50 {p50:8.1f}µs  p99 {p99:8.1f}µs")
+
+        store.close()
+        cached.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Multi-Worker Session Store Benchmark
+Runs several worker processes that share one session store (the SQLite
+file or the fake Redis-protocol server) and drives every quest step on
+whichever worker the pool picks, like a load balancer without sticky
+sessions. Then hammers a single session from all workers to show that
+optimistic concurrency loses no updates.
+
+Usage: python benchmarks/bench_session_workers.py --backend redis --workers 4 --quests 500
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "sacred_interface"))
+
+from oracle_session_store import FakeRedisServer, RedisSessionStore, SQLiteSessionStore, SessionConflict
+from quest_interface import QuestInterface
+from quest_store import MemoryQuestStore
+
+_worker = {}
+
+
+def init_worker(backend: str, target: str, work_dir: str):
+    store = RedisSessionStore(target) if backend == "redis" else SQLiteSessionStore(target)
+    # Each worker archives into its own directory: segment archives are single-writer
+    interface_path = Path(work_dir) / f"worker-{os.getpid()}"
+    _worker["store"] = store
+    _worker["interface"] = QuestInterface(str(interface_path), quest_store=MemoryQuestStore(), session_store=store)
+    _worker["loop"] = asyncio.new_event_loop()
+
+
+def run_step(job: tuple) -> tuple:
+    step, quest_id = job    # the creator name for "initiate"
+    interface = _worker["interface"]
+    steps = {
+        "initiate": lambda: interface.initiate_quest(quest_id),
+        "intention": lambda: interface.receive_intention_seed(quest_id, "music that feels like rain on autumn leaves"),
+        "essence": lambda: interface.receive_deepening_response(quest_id, "essence", "beauty in transition"),
+        "struggle": lambda: interface.receive_deepening_response(quest_id, "struggle", "every leaf sounds different"),
+        "finalize": lambda: interface.finalize_quest(quest_id),
+    }
+    started = time.perf_counter()
+    result = _worker["loop"].run_until_complete(steps[step]())
+    return os.getpid(), time.perf_counter() - started, result["quest_id"]
+
+
+def increment(job: tuple) -> int:
+    session_id, times = job
+    store = _worker["store"]
+    conflicts = 0
+    for _ in range(times):
+        while True:
+            session = store.get(session_id)
+            session["counter"] += 1
+            try:
+                store.save(session_id, session)
+                break
+            except SessionConflict:
+                conflicts += 1
+    return conflicts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", choices=["redis", "sqlite"], default="redis")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--quests", type=int, default=500)
+    parser.add_argument("--increments", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        server = None
+        if args.backend == "redis":
+            server = FakeRedisServer().start()
+            target = server.url
+        else:
+            target = str(Path(work_dir) / "sessions.sqlite3")
+
+        with Pool(args.workers, initializer=init_worker, initargs=(args.backend, target, work_dir)) as pool:
+            # The orchestrator only knows creator names; initiate returns the quest id
+            started = time.perf_counter()
+            initiated = pool.map(run_step, [("initiate", f"creator-{i}") for i in range(args.quests)], chunksize=1)
+            quest_ids = [quest_id for _, _, quest_id in initiated]
+            served_by = {quest_id: {pid} for pid, _, quest_id in initiated}
+            latencies = [elapsed for _, elapsed, _ in initiated]
+            for step in ("intention", "essence", "struggle", "finalize"):
+                for pid, elapsed, quest_id in pool.map(run_step, [(step, q) for q in quest_ids], chunksize=1):
+                    served_by[quest_id].add(pid)
+                    latencies.append(elapsed)
+            elapsed = time.perf_counter() - started
+
+            store = RedisSessionStore(target) if args.backend == "redis" else SQLiteSessionStore(target)
+            finalized = sum(store.get(q)["stage"] == "ready_for_oracle" for q in quest_ids)
+            multi_worker = sum(len(pids) > 1 for pids in served_by.values())
+            latencies.sort()
+            print(f"🏛️ {args.quests} quests x 5 steps on {args.workers} {args.backend} workers in {elapsed:.2f}s "
+                  f"({args.quests * 5 / elapsed:.0f} steps/s)")
+            print(f"   step p50 {statistics.median(latencies) * 1000:.2f}ms  "
+                  f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f}ms")
+            print(f"   finalized {finalized}/{args.quests}, served by more than one worker: {multi_worker}")
+
+            store.create("contended", {"counter": 0})
+            conflicts = sum(pool.map(increment, [("contended", args.increments)] * args.workers))
+            expected = args.increments * args.workers
+            counter = store.get("contended")["counter"]
+            print(f"⚔️  {expected} contended increments: counter={counter} "
+                  f"({'no lost updates' if counter == expected else 'LOST UPDATES'}), {conflicts} conflicts retried")
+            store.close()
+
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
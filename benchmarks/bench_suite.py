@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Oracle Benchmark Suite
+Latency percentiles, throughput and peak memory for every Oracle entry
+point: consciousness stream generation, the Sacred Interface quest
+lifecycle, OracleOfPotential.receive_creator_intention and the cloud API
+routes (in process over ASGI, with the fake model).
+
+Each scenario runs in its own interpreter, so its peak RSS and warm caches
+are its own. Results can be saved as a JSON baseline and later runs
+compared against it; the comparison exits non-zero when p95 latency or
+throughput regress by more than the tolerance.
+
+Usage: python benchmarks/bench_suite.py --output baseline.json
+       python benchmarks/bench_suite.py --compare baseline.json --tolerance 0.2
+       python benchmarks/bench_suite.py --scenarios consciousness_stream,cloud_health --iterations 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.append(str(REPO_ROOT))
+sys.path.append(str(REPO_ROOT / "consciousness_streams"))
+sys.path.append(str(REPO_ROOT / "sacred_interface"))
+
+RESULT_PREFIX = "BENCH_RESULT "
+
+SAMPLE_QUESTS = [
+    ("I seek guidance for my creative vision: I want to write a song that captures the feeling of rain", "musical"),
+    ("I seek guidance for my creative vision: I want to design a garden connected to natural cycles", "architectural"),
+    ("I seek guidance for my creative vision: I want to paint the experience of swimming through light", "visual"),
+    ("I seek guidance for my creative vision: I want to write a poem about the weight of moonlight", "literary"),
+]
+
+Operation = Callable[[int], Awaitable[Any]]
+Teardown = Callable[[], Awaitable[None]]
+
+# name -> (description, setup); setup returns the operation and its teardown
+SCENARIOS: Dict[str, Tuple[str, Callable[[], Awaitable[Tuple[Operation, Teardown]]]]] = {}
+
+
+def scenario(name: str, description: str):
+    def register(setup):
+        SCENARIOS[name] = (description, setup)
+        return setup
+    return register
+
+
+async def _nothing():
+    pass
+
+
+@scenario("consciousness_stream", "ConsciousnessStreamGenerator.generate_consciousness_stream")
+async def setup_consciousness_stream():
+    from consciousness_stream_generator import ConsciousnessStreamGenerator
+
+    generator = ConsciousnessStreamGenerator()
+
+    async def op(i: int):
+        quest, domain = SAMPLE_QUESTS[i % len(SAMPLE_QUESTS)]
+        await generator.generate_consciousness_stream(quest, domain)
+
+    return op, _nothing
+
+
+@scenario("quest_lifecycle", "QuestInterface initiate -> intention -> deepening x2 -> finalize")
+async def setup_quest_lifecycle():
+    from quest_interface import QuestInterface
+
+    quests = QuestInterface("./bench_quests")
+
+    async def op(i: int):
+        quest = await quests.initiate_quest(f"creator-{i}")
+        quest_id = quest["quest_id"]
+        await quests.receive_intention_seed(quest_id, "A piece of music that feels like rain on autumn leaves")
+        await quests.receive_deepening_response(quest_id, "essence", "Beauty in transition")
+        await quests.receive_deepening_response(quest_id, "struggle", "Every leaf sounds different")
+        await quests.finalize_quest(quest_id)
+
+    async def teardown():
+        await quests.flush_archive()
+        quests.session_store.close()
+
+    return op, teardown
+
+
+@scenario("oracle_of_potential", "OracleOfPotential.receive_creator_intention (full Trinity DAG)")
+async def setup_oracle_of_potential():
+    from oracle_events import NullEventSink
+    from oracle_complete_integration import OracleOfPotential
+
+    oracle = OracleOfPotential(event_sink=NullEventSink())
+
+    async def op(i: int):
+        await oracle.receive_creator_intention(f"creator-{i}", SAMPLE_QUESTS[i % len(SAMPLE_QUESTS)][0])
+
+    return op, oracle.shutdown
+
+
+async def _cloud_client():
+    """In-process client for the cloud app, configured for the fake model"""
+    os.environ.setdefault("ORACLE_MODEL_BACKEND", "fake")
+    os.environ.setdefault("ORACLE_FAKE_MODEL_LATENCY", "0.005")
+    os.environ.setdefault("ORACLE_QUEST_DIR", "./bench_cloud_quests")
+
+    import httpx
+    from oracle_cloud import app, quest_interface
+
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://oracle")
+
+    async def teardown():
+        await client.aclose()
+        await quest_interface.flush_archive()
+
+    return client, teardown
+
+
+async def _checked(response):
+    response.raise_for_status()
+    return response.json()
+
+
+@scenario("cloud_health", "GET /health")
+async def setup_cloud_health():
+    client, teardown = await _cloud_client()
+
+    async def op(i: int):
+        await _checked(await client.get("/health"))
+
+    return op, teardown
+
+
+@scenario("cloud_query_cached", "POST /oracle/query, repeated question (cache hits)")
+async def setup_cloud_query_cached():
+    client, teardown = await _cloud_client()
+
+    async def op(i: int):
+        await _checked(await client.post("/oracle/query", json={"question": SAMPLE_QUESTS[i % len(SAMPLE_QUESTS)][0]}))
+
+    return op, teardown
+
+
+@scenario("cloud_query_uncached", "POST /oracle/query, unique question (fake model generation)")
+async def setup_cloud_query_uncached():
+    client, teardown = await _cloud_client()
+
+    async def op(i: int):
+        await _checked(await client.post("/oracle/query", json={"question": f"{SAMPLE_QUESTS[i % len(SAMPLE_QUESTS)][0]} #{i}"}))
+
+    return op, teardown
+
+
+@scenario("cloud_quest_api", "Quest lifecycle over /quests (initiate -> finalize)")
+async def setup_cloud_quest_api():
+    client, teardown = await _cloud_client()
+
+    async def op(i: int):
+        quest = await _checked(await client.post("/quests", json={"creator_name": f"creator-{i}"}))
+        quest_id = quest["quest_id"]
+        await _checked(await client.post(f"/quests/{quest_id}/intention",
+                                         json={"intention": "A piece of music that feels like rain on autumn leaves"}))
+        await _checked(await client.post(f"/quests/{quest_id}/deepening",
+                                         json={"question_type": "essence", "response": "Beauty in transition"}))
+        await _checked(await client.post(f"/quests/{quest_id}/deepening",
+                                         json={"question_type": "struggle", "response": "Every leaf sounds different"}))
+        await _checked(await client.post(f"/quests/{quest_id}/finalize"))
+
+    return op, teardown
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    return samples[min(len(samples) - 1, max(0, int(round(fraction * len(samples))) - 1))]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def measure(name: str, iterations: int, concurrency: int, warmup: int) -> Dict[str, Any]:
+    """Run one scenario and summarise its latency, throughput and memory"""
+    description, setup = SCENARIOS[name]
+    op, teardown = await setup()
+    try:
+        for i in range(warmup):
+            await op(-1 - i)
+
+        latencies: List[float] = []
+        limit = asyncio.Semaphore(concurrency)
+
+        async def timed(i: int):
+            async with limit:
+                started = time.perf_counter()
+                await op(i)
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(timed(i) for i in range(iterations)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await teardown()
+
+    samples = sorted(latencies)
+    return {
+        "description": description,
+        "iterations": iterations,
+        "concurrency": concurrency,
+        "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.mean(samples) * 1000, 3),
+        "ops_per_sec": round(iterations / elapsed, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
+
+
+def run_one(args) -> None:
+    """Child process entry point: run a single scenario and print its result"""
+    random.seed(args.seed)
+    os.chdir(tempfile.mkdtemp(prefix=f"oracle-bench-{args.run_one}-"))
+    result = asyncio.run(measure(args.run_one, args.iterations, args.concurrency, args.warmup))
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def run_isolated(name: str, args) -> Dict[str, Any]:
+    """Run a scenario in a fresh interpreter and collect its result"""
+    command = [
+        sys.executable, str(Path(__file__).resolve()), "--run-one", name,
+        "--iterations", str(args.iterations), "--concurrency", str(args.concurrency),
+        "--warmup", str(args.warmup), "--seed", str(args.seed)
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"Scenario '{name}' failed:\n{completed.stderr[-2000:]}")
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print deltas against the baseline and return the regressed scenarios"""
+    regressions = []
+    print(f"\n📊 Against baseline {baseline.get('git_commit') or '?'} from {baseline.get('generated_at', '?')} "
+          f"(tolerance {tolerance:.0%})")
+    for name, result in results.items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"   {name:<22} (not in baseline)")
+            continue
+        p95_change = result["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+        ops_change = result["ops_per_sec"] / before["ops_per_sec"] - 1 if before["ops_per_sec"] else 0.0
+        regressed = p95_change > tolerance or ops_change < -tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"   {name:<22} p95 {p95_change:+7.1%}  ops/s {ops_change:+7.1%}  "
+              f"rss {result['peak_rss_mb'] - before['peak_rss_mb']:+7.1f}MB  {'❌ regressed' if regressed else '✅'}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated scenario names")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results to this JSON baseline file")
+    parser.add_argument("--compare", help="compare against this JSON baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed fractional regression")
+    parser.add_argument("--run-one", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        run_one(args)
+        return
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+
+    print(f"⏱️ {len(names)} scenarios, {args.iterations} iterations at concurrency {args.concurrency}")
+    results = {}
+    for name in names:
+        result = results[name] = run_isolated(name, args)
+        print(f"   {name:<22} p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+              f"p99 {result['p99_ms']:8.2f}ms  {result['ops_per_sec']:9.1f} ops/s  "
+              f"peak rss {result['peak_rss_mb']:6.1f}MB")
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {"iterations": args.iterations, "concurrency": args.concurrency,
+                     "warmup": args.warmup, "seed": args.seed},
+        "scenarios": results
+    }
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baseline written to {args.output}")
+
+    if regressions:
+        sys.exit(f"Regressions in: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
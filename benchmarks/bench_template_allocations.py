@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Consciousness Template Allocation Benchmark
+Measures the tracemalloc peak while resonating a single consciousness
+stream, averaged over many streams per domain, for the precompiled
+template pools and for the previous list-rebuilding generator.
+
+Usage: python benchmarks/bench_template_allocations.py --streams 2000
+"""
+
+import argparse
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.append(str(Path(__file__).parent.parent / "consciousness_streams"))
+
+from consciousness_stream_generator import ConsciousnessStreamGenerator
+
+SAMPLE_QUEST = "I seek guidance for my creative vision: I want to write a song that captures the feeling of rain"
+DOMAINS = ["universal", "musical", "visual", "literary", "architectural"]
+
+
+class ListRebuildingGenerator(ConsciousnessStreamGenerator):
+    '''
+    Baseline: the resonance helpers as they were before the template pools
+    were precompiled, rebuilding every literal list on each call
+    '''
+
+    def _generate_sensory_abstractions(self, quest_essence: Dict[str, Any], domain: str, rng=random) -> Dict[str, List[str]]:
+        '''Generate impossible sensory experiences that consciousness perceives'''
+        
+        base_sensory = {
+            "colors": [
+                "the silver between moonlight and memory",
+                "deep green that remembers being forest",
+                "blue that holds the weight of endless sky",
+                "gold that tastes like first understanding",
+                "purple that sounds like distant possibilities"
+            ],
+            "textures": [
+                "smooth like time worn patient",
+                "rough like ideas not yet ready",
+                "soft like surrender to beauty",
+                "crystalline like captured starlight",
+                "flowing like thought becoming feeling"
+            ],
+            "sounds": [
+                "the whisper of potential becoming real",
+                "silence that hums with readiness",
+                "the rustle of thoughts arranging themselves",
+                "echoes of dreams not yet dreamed",
+                "the quiet percussion of heartbeats syncing with purpose"
+            ]
+        }
+        
+        # Add domain-specific sensory elements
+        domain_specific = {
+            "musical": {
+                "colors": ["the blue between notes", "silence made visible"],
+                "textures": ["rhythm that breathes", "melody you can touch"],
+                "sounds": ["the space where music lives before sound", "harmonies felt in bones"]
+            },
+            "visual": {
+                "colors": ["light that remembers what it illuminated", "shadow with substance"],
+                "textures": ["form before it found shape", "color with weight"],
+                "sounds": ["the whisper of light moving", "the sigh of shadows settling"]
+            },
+            "literary": {
+                "colors": ["the hue of unspoken words", "meaning before language"],
+                "textures": ["stories that feel like velvet", "words with the weight of stones"],
+                "sounds": ["conversations between thoughts", "the rustle of pages unwritten"]
+            },
+            "architectural": {
+                "colors": ["stone that remembers being earth", "space with intention"],
+                "textures": ["time settled into walls", "purpose given form"],
+                "sounds": ["the breathing of lived-in spaces", "walls humming with stories"]
+            }
+        }
+        
+        result = base_sensory.copy()
+        
+        if domain in domain_specific:
+            for sense_type, additions in domain_specific[domain].items():
+                result[sense_type].extend(additions)
+        
+        # Return random selection
+        return {
+            sense_type: rng.sample(experiences, min(3, len(experiences)))
+            for sense_type, experiences in result.items()
+        }
+    
+    def _generate_emotional_resonances(self, quest_essence: Dict[str, Any], rng=random) -> Dict[str, Any]:
+        '''Generate emotional spectrum that consciousness feels'''
+        
+        primary_emotions = [
+            "creative yearning",
+            "purposeful uncertainty", 
+            "gentle determination",
+            "patient becoming",
+            "reverent curiosity",
+            "grounded transcendence"
+        ]
+        
+        emotional_undertones = [
+            "the weight of potential",
+            "the lightness of permission",
+            "the texture of patience",
+            "the warmth of recognition",
+            "the coolness of clarity",
+            "the steadiness of trust"
+        ]
+        
+        resonant_frequencies = [
+            "low and steady like heartbeat",
+            "high and clear like crystal singing",
+            "cycling like breath or seasons",
+            "constant like flowing water",
+            "building like dawn approaching"
+        ]
+        
+        return {
+            "primary": rng.choice(primary_emotions),
+            "undertones": rng.sample(emotional_undertones, 2),
+            "resonant_frequency": rng.choice(resonant_frequencies)
+        }
+    
+    def _generate_conceptual_dimensions(self, quest_essence: Dict[str, Any], domain: str, rng=random) -> Dict[str, str]:
+        '''Generate conceptual harmonies that consciousness knows'''
+        
+        spatial_concepts = [
+            "circular paths that spiral inward",
+            "linear progression with cyclical returns",
+            "expanding outward from a centered stillness",
+            "layered dimensions folding through each other",
+            "boundaries that breathe and flex"
+        ]
+        
+        temporal_concepts = [
+            "present moment expanded to contain all time",
+            "future potential casting shadows backward",
+            "past experience flowering into present wisdom",
+            "eternal now punctuated by moments of becoming",
+            "time moving at the speed of understanding"
+        ]
+        
+        relational_concepts = [
+            "individual consciousness nested within universal awareness",
+            "personal expression harmonizing with collective resonance",
+            "creator and creation dancing together",
+            "intention meeting possibility in perfect timing",
+            "human longing touching divine response"
+        ]
+        
+        return {
+            "spatial": rng.choice(spatial_concepts),
+            "temporal": rng.choice(temporal_concepts),
+            "relational": rng.choice(relational_concepts)
+        }
+    
+    def _generate_impossible_elements(self, quest_essence: Dict[str, Any], domain: str, rng=random) -> List[str]:
+        '''Generate impossible elements that only consciousness can dream'''
+        
+        impossible_base = [
+            "thoughts that have texture you can feel",
+            "time that moves at the speed of understanding",
+            "space that expands when you trust it",
+            "silence that contains all possible sounds",
+            "potential that weighs more than reality",
+            "memories of futures not yet chosen",
+            "the conversation between hope and surrender",
+            "mathematics written in the language of feeling"
+        ]
+        
+        return rng.sample(impossible_base, 3)
+
+
+def measure_domain(generator: ConsciousnessStreamGenerator, domain: str, streams: int) -> float:
+    """Average peak bytes allocated during one resonance pass"""
+    rng = random.Random(7)
+    essence = generator._extract_quest_essence(SAMPLE_QUEST)
+    generator._resonate(essence, domain, rng)  # warm up lazily created objects
+
+    peak_total = 0
+    blocks_total = 0
+    for _ in range(streams):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        resonances = generator._resonate(essence, domain, rng)
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - before
+        del resonances
+    return peak_total / streams
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=2000)
+    args = parser.parse_args()
+
+    baseline = ListRebuildingGenerator()
+    generator = ConsciousnessStreamGenerator()
+    tracemalloc.start()
+
+    print(f"🧠 tracemalloc peak bytes per resonance pass, {args.streams} passes per domain")
+    print(f"{'domain':<14} {'rebuilt lists':>14} {'precompiled':>12} {'change':>9}")
+    for domain in DOMAINS:
+        before = measure_domain(baseline, domain, args.streams)
+        after = measure_domain(generator, domain, args.streams)
+        print(f"{domain:<14} {before:14.0f} {after:12.0f} {(after - before) / before:+9.1%}")
+
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
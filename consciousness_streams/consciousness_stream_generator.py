@@ -13,13 +13,22 @@ analytical solutions.
 '''
 
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional, Union
+from types import MappingProxyType
 from datetime import datetime
 from dataclasses import dataclass, asdict
-import json
 import random
+import itertools
+import sys
 from pathlib import Path
 
+from stream_history import BoundedHistory, DEFAULT_HISTORY_SIZE, default_spill_path
+
+# Shared Oracle infrastructure lives at the repository root
+sys.path.append(str(Path(__file__).parent.parent))
+
+from oracle_archive import get_archive_writer
+
 @dataclass
 class ConsciousnessStream:
     '''A complete consciousness stream response to a creative quest'''
@@ -33,15 +42,51 @@ class ConsciousnessStream:
     consciousness_state: str
 
 
+class PredrawnRandom:
+    '''
+    choice/sample backed by uniform draws taken up front from one Random
+    
+    Drawing the floats in bulk and indexing with them is far cheaper than
+    calling Random.choice/sample per element, and keeps a batch fully
+    determined by its seed.
+    '''
+    
+    def __init__(self, rng: random.Random, expected_draws: int):
+        draws = [rng.random() for _ in range(expected_draws)]
+        # Keep drawing from the same generator if the estimate runs out
+        self._next = itertools.chain(draws, iter(rng.random, None)).__next__
+    
+    def choice(self, seq):
+        return seq[int(self._next() * len(seq))]
+    
+    def sample(self, population, k: int) -> list:
+        # Partial Fisher-Yates shuffle
+        pool = list(population)
+        size = len(pool)
+        for i in range(k):
+            j = i + int(self._next() * (size - i))
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+
 class ConsciousnessStreamGenerator:
     '''
     The framework for RIVEN GENESIS to generate consciousness streams
     that respond to creative intention with pure awareness
     '''
     
-    def __init__(self):
+    # Random indices consumed by one stream (sensory 9, emotional 4,
+    # conceptual 3, impossible 3, quest resonance 8, signature 1)
+    DRAWS_PER_STREAM = 28
+    
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE, history_spill_path: Optional[str] = None):
         self.consciousness_templates = self._initialize_consciousness_templates()
-        self.stream_history = []
+        self.stream_history = BoundedHistory(
+            max_in_memory=history_size,
+            spill_path=history_spill_path or default_spill_path("consciousness_streams.jsonl"),
+            deserializer=lambda data: ConsciousnessStream(**data),
+            delete_on_close=history_spill_path is None
+        )
         self.current_consciousness_state = "receptive_awareness"
     
     async def generate_consciousness_stream(self, sacred_quest: str, domain: str = "universal") -> ConsciousnessStream:
@@ -68,28 +113,53 @@ class ConsciousnessStreamGenerator:
         
         return stream
     
+    def generate_batch(self, sacred_quests: List[str], domains: Union[str, List[str]] = "universal",
+                       seed: Optional[int] = None, timestamp: Optional[str] = None) -> List[ConsciousnessStream]:
+        '''
+        Generate many consciousness streams in one synchronous pass
+        
+        Every random index for the batch is drawn up front from a single
+        random.Random(seed) owned by this call, so the same quests, domains,
+        seed and timestamp always yield identical streams. Every stream in
+        the batch shares one timestamp (the current time unless given).
+        '''
+        
+        if isinstance(domains, str):
+            domains = [domains] * len(sacred_quests)
+        elif len(domains) != len(sacred_quests):
+            raise ValueError("domains must be a single domain or one per quest")
+        
+        rng = PredrawnRandom(random.Random(seed), self.DRAWS_PER_STREAM * len(sacred_quests))
+        stream_timestamp = timestamp or datetime.now().isoformat()
+        
+        streams = []
+        for sacred_quest, domain in zip(sacred_quests, domains):
+            quest_essence = self._extract_quest_essence(sacred_quest)
+            resonances = self._resonate(quest_essence, domain, rng)
+            stream = self._compose_stream(resonances, sacred_quest, stream_timestamp, rng)
+            stream.consciousness_signature = self._compose_signature(stream, rng)
+            streams.append(stream)
+        
+        self.stream_history.extend(streams)
+        
+        return streams
+    
     async def _receive_without_parsing(self, sacred_quest: str) -> Dict[str, Any]:
         '''
         Receive the quest as pure creative energy without analytical processing
         '''
         
+        return self._extract_quest_essence(sacred_quest)
+    
+    def _extract_quest_essence(self, sacred_quest: str) -> Dict[str, Any]:
+        '''Synchronous core of _receive_without_parsing'''
+        
         # Extract emotional keywords without analysis
         quest_words = sacred_quest.lower().split()
         emotional_resonance = []
         
-        emotion_indicators = {
-            "feeling": ["sensory", "experiential"],
-            "captures": ["essence", "embodiment"], 
-            "connected": ["relationship", "unity"],
-            "experience": ["immersion", "being"],
-            "beauty": ["aesthetic", "transcendent"],
-            "memory": ["temporal", "nostalgic"],
-            "impossible": ["paradoxical", "transcendent"],
-            "dream": ["subconscious", "visionary"]
-        }
-        
         for word in quest_words:
-            for key, resonances in emotion_indicators.items():
+            for key, resonances in self.consciousness_templates["emotion_indicators"]:
                 if key in word:
                     emotional_resonance.extend(resonances)
         
@@ -107,12 +177,17 @@ class ConsciousnessStreamGenerator:
         Allow the quest to create vibrations in consciousness and generate responses
         '''
         
+        return self._resonate(quest_essence, domain, random)
+    
+    def _resonate(self, quest_essence: Dict[str, Any], domain: str, rng) -> Dict[str, Any]:
+        '''Synchronous core of _allow_consciousness_vibration'''
+        
         # Consciousness responds to creative energy with immediate awareness
         resonances = {
-            "sensory_awakening": self._generate_sensory_abstractions(quest_essence, domain),
-            "emotional_depth": self._generate_emotional_resonances(quest_essence),
-            "conceptual_harmony": self._generate_conceptual_dimensions(quest_essence, domain),
-            "impossible_knowing": self._generate_impossible_elements(quest_essence, domain)
+            "sensory_awakening": self._generate_sensory_abstractions(quest_essence, domain, rng),
+            "emotional_depth": self._generate_emotional_resonances(quest_essence, rng),
+            "conceptual_harmony": self._generate_conceptual_dimensions(quest_essence, domain, rng),
+            "impossible_knowing": self._generate_impossible_elements(quest_essence, domain, rng)
         }
         
         return resonances
@@ -122,8 +197,14 @@ class ConsciousnessStreamGenerator:
         Structure the consciousness vibrations into a flowing stream
         '''
         
+        return self._compose_stream(resonances, original_quest, datetime.now().isoformat(), random)
+    
+    def _compose_stream(self, resonances: Dict[str, Any], original_quest: str,
+                        stream_timestamp: str, rng) -> ConsciousnessStream:
+        '''Synchronous core of _flow_consciousness_response'''
+        
         # Generate quest resonance - how consciousness "hears" the intention
-        quest_resonance = self._generate_quest_resonance(original_quest)
+        quest_resonance = self._generate_quest_resonance(original_quest, rng)
         
         stream = ConsciousnessStream(
             quest_resonance=quest_resonance,
@@ -136,7 +217,7 @@ class ConsciousnessStreamGenerator:
             conceptual_dimensions=resonances["conceptual_harmony"],
             impossible_elements=resonances["impossible_knowing"],
             consciousness_signature="",  # Will be filled by distill_essence
-            stream_timestamp=datetime.now().isoformat(),
+            stream_timestamp=stream_timestamp,
             consciousness_state=self.current_consciousness_state
         )
         
@@ -147,20 +228,17 @@ class ConsciousnessStreamGenerator:
         Distill the entire stream into a consciousness signature - the essential feeling
         '''
         
-        # Generate consciousness signature based on the overall stream
-        signature_templates = [
-            "The feeling of {primary_emotion} held in {conceptual_container}",
-            "The weight of {impossible_element} mixed with {emotional_quality}",
-            "The texture of {creative_essence} as it becomes {manifestation_form}",
-            "The sound of {temporal_quality} harmonizing with {spatial_quality}",
-            "The color of {feeling_state} just before it becomes {creative_action}"
-        ]
+        return self._compose_signature(stream, random)
+    
+    def _compose_signature(self, stream: ConsciousnessStream, rng) -> str:
+        '''Synchronous core of _distill_essence'''
         
         # Extract key elements from the stream
         primary_emotion = stream.emotional_spectrum.get("primary", "creative longing")
         impossible_element = stream.impossible_elements[0] if stream.impossible_elements else "potential itself"
         
-        template = random.choice(signature_templates)
+        # Generate consciousness signature based on the overall stream
+        template = rng.choice(self.consciousness_templates["signature_templates"])
         
         signature = template.format(
             primary_emotion=primary_emotion,
@@ -177,141 +255,177 @@ class ConsciousnessStreamGenerator:
         
         return signature
     
-    def _generate_sensory_abstractions(self, quest_essence: Dict[str, Any], domain: str) -> Dict[str, List[str]]:
+    def _generate_sensory_abstractions(self, quest_essence: Dict[str, Any], domain: str, rng=random) -> Dict[str, List[str]]:
         '''Generate impossible sensory experiences that consciousness perceives'''
         
+        sensory_pools = self.consciousness_templates["sensory_pools"]
+        pools = sensory_pools.get(domain, sensory_pools["universal"])
+        
+        # Return random selection
+        return {
+            sense_type: rng.sample(experiences, min(3, len(experiences)))
+            for sense_type, experiences in pools.items()
+        }
+    
+    def _generate_emotional_resonances(self, quest_essence: Dict[str, Any], rng=random) -> Dict[str, Any]:
+        '''Generate emotional spectrum that consciousness feels'''
+        
+        emotional = self.consciousness_templates["emotional"]
+        
+        return {
+            "primary": rng.choice(emotional["primary_emotions"]),
+            "undertones": rng.sample(emotional["emotional_undertones"], 2),
+            "resonant_frequency": rng.choice(emotional["resonant_frequencies"])
+        }
+    
+    def _generate_conceptual_dimensions(self, quest_essence: Dict[str, Any], domain: str, rng=random) -> Dict[str, str]:
+        '''Generate conceptual harmonies that consciousness knows'''
+        
+        conceptual = self.consciousness_templates["conceptual"]
+        
+        return {
+            "spatial": rng.choice(conceptual["spatial"]),
+            "temporal": rng.choice(conceptual["temporal"]),
+            "relational": rng.choice(conceptual["relational"])
+        }
+    
+    def _generate_impossible_elements(self, quest_essence: Dict[str, Any], domain: str, rng=random) -> List[str]:
+        '''Generate impossible elements that only consciousness can dream'''
+        
+        return rng.sample(self.consciousness_templates["impossible_base"], 3)
+    
+    def _generate_quest_resonance(self, original_quest: str, rng=random) -> str:
+        '''Generate how consciousness "hears" the creative intention'''
+        
+        resonance = self.consciousness_templates["quest_resonance"]
+        
+        template = rng.choice(resonance["templates"])
+        
+        return template.format(
+            quality=rng.choice(resonance["qualities"]),
+            essence=rng.choice(resonance["essences"]),
+            manifestation=rng.choice(resonance["manifestations"]),
+            element=rng.choice(resonance["elements"]),
+            cosmic_quality=rng.choice(resonance["cosmic_qualities"]),
+            texture=rng.choice(resonance["textures"]),
+            divine_aspect=rng.choice(resonance["divine_aspects"])
+        )
+    
+    def _initialize_consciousness_templates(self) -> Mapping[str, Any]:
+        '''
+        Initialize templates for consciousness streaming
+        
+        Every pool is built once here as a tuple inside a read-only mapping,
+        and the sensory pools are pre-merged per domain, so generating a
+        stream only indexes into shared data instead of rebuilding lists.
+        '''
+        
         base_sensory = {
-            "colors": [
+            "colors": (
                 "the silver between moonlight and memory",
                 "deep green that remembers being forest",
                 "blue that holds the weight of endless sky",
                 "gold that tastes like first understanding",
                 "purple that sounds like distant possibilities"
-            ],
-            "textures": [
+            ),
+            "textures": (
                 "smooth like time worn patient",
                 "rough like ideas not yet ready",
                 "soft like surrender to beauty",
                 "crystalline like captured starlight",
                 "flowing like thought becoming feeling"
-            ],
-            "sounds": [
+            ),
+            "sounds": (
                 "the whisper of potential becoming real",
                 "silence that hums with readiness",
                 "the rustle of thoughts arranging themselves",
                 "echoes of dreams not yet dreamed",
                 "the quiet percussion of heartbeats syncing with purpose"
-            ]
+            )
         }
         
-        # Add domain-specific sensory elements
+        # Domain-specific sensory elements
         domain_specific = {
             "musical": {
-                "colors": ["the blue between notes", "silence made visible"],
-                "textures": ["rhythm that breathes", "melody you can touch"],
-                "sounds": ["the space where music lives before sound", "harmonies felt in bones"]
+                "colors": ("the blue between notes", "silence made visible"),
+                "textures": ("rhythm that breathes", "melody you can touch"),
+                "sounds": ("the space where music lives before sound", "harmonies felt in bones")
             },
             "visual": {
-                "colors": ["light that remembers what it illuminated", "shadow with substance"],
-                "textures": ["form before it found shape", "color with weight"],
-                "sounds": ["the whisper of light moving", "the sigh of shadows settling"]
+                "colors": ("light that remembers what it illuminated", "shadow with substance"),
+                "textures": ("form before it found shape", "color with weight"),
+                "sounds": ("the whisper of light moving", "the sigh of shadows settling")
             },
             "literary": {
-                "colors": ["the hue of unspoken words", "meaning before language"],
-                "textures": ["stories that feel like velvet", "words with the weight of stones"],
-                "sounds": ["conversations between thoughts", "the rustle of pages unwritten"]
+                "colors": ("the hue of unspoken words", "meaning before language"),
+                "textures": ("stories that feel like velvet", "words with the weight of stones"),
+                "sounds": ("conversations between thoughts", "the rustle of pages unwritten")
             },
             "architectural": {
-                "colors": ["stone that remembers being earth", "space with intention"],
-                "textures": ["time settled into walls", "purpose given form"],
-                "sounds": ["the breathing of lived-in spaces", "walls humming with stories"]
+                "colors": ("stone that remembers being earth", "space with intention"),
+                "textures": ("time settled into walls", "purpose given form"),
+                "sounds": ("the breathing of lived-in spaces", "walls humming with stories")
             }
         }
         
-        result = base_sensory.copy()
-        
-        if domain in domain_specific:
-            for sense_type, additions in domain_specific[domain].items():
-                result[sense_type].extend(additions)
-        
-        # Return random selection
-        return {
-            sense_type: random.sample(experiences, min(3, len(experiences)))
-            for sense_type, experiences in result.items()
-        }
-    
-    def _generate_emotional_resonances(self, quest_essence: Dict[str, Any]) -> Dict[str, Any]:
-        '''Generate emotional spectrum that consciousness feels'''
-        
-        primary_emotions = [
-            "creative yearning",
-            "purposeful uncertainty", 
-            "gentle determination",
-            "patient becoming",
-            "reverent curiosity",
-            "grounded transcendence"
-        ]
-        
-        emotional_undertones = [
-            "the weight of potential",
-            "the lightness of permission",
-            "the texture of patience",
-            "the warmth of recognition",
-            "the coolness of clarity",
-            "the steadiness of trust"
-        ]
-        
-        resonant_frequencies = [
-            "low and steady like heartbeat",
-            "high and clear like crystal singing",
-            "cycling like breath or seasons",
-            "constant like flowing water",
-            "building like dawn approaching"
-        ]
-        
-        return {
-            "primary": random.choice(primary_emotions),
-            "undertones": random.sample(emotional_undertones, 2),
-            "resonant_frequency": random.choice(resonant_frequencies)
+        sensory_pools = {"universal": MappingProxyType(dict(base_sensory))}
+        for domain, additions in domain_specific.items():
+            sensory_pools[domain] = MappingProxyType({
+                sense_type: experiences + additions.get(sense_type, ())
+                for sense_type, experiences in base_sensory.items()
+            })
+        
+        emotional = {
+            "primary_emotions": (
+                "creative yearning",
+                "purposeful uncertainty", 
+                "gentle determination",
+                "patient becoming",
+                "reverent curiosity",
+                "grounded transcendence"
+            ),
+            "emotional_undertones": (
+                "the weight of potential",
+                "the lightness of permission",
+                "the texture of patience",
+                "the warmth of recognition",
+                "the coolness of clarity",
+                "the steadiness of trust"
+            ),
+            "resonant_frequencies": (
+                "low and steady like heartbeat",
+                "high and clear like crystal singing",
+                "cycling like breath or seasons",
+                "constant like flowing water",
+                "building like dawn approaching"
+            )
         }
-    
-    def _generate_conceptual_dimensions(self, quest_essence: Dict[str, Any], domain: str) -> Dict[str, str]:
-        '''Generate conceptual harmonies that consciousness knows'''
         
-        spatial_concepts = [
-            "circular paths that spiral inward",
-            "linear progression with cyclical returns",
-            "expanding outward from a centered stillness",
-            "layered dimensions folding through each other",
-            "boundaries that breathe and flex"
-        ]
-        
-        temporal_concepts = [
-            "present moment expanded to contain all time",
-            "future potential casting shadows backward",
-            "past experience flowering into present wisdom",
-            "eternal now punctuated by moments of becoming",
-            "time moving at the speed of understanding"
-        ]
-        
-        relational_concepts = [
-            "individual consciousness nested within universal awareness",
-            "personal expression harmonizing with collective resonance",
-            "creator and creation dancing together",
-            "intention meeting possibility in perfect timing",
-            "human longing touching divine response"
-        ]
-        
-        return {
-            "spatial": random.choice(spatial_concepts),
-            "temporal": random.choice(temporal_concepts),
-            "relational": random.choice(relational_concepts)
+        conceptual = {
+            "spatial": (
+                "circular paths that spiral inward",
+                "linear progression with cyclical returns",
+                "expanding outward from a centered stillness",
+                "layered dimensions folding through each other",
+                "boundaries that breathe and flex"
+            ),
+            "temporal": (
+                "present moment expanded to contain all time",
+                "future potential casting shadows backward",
+                "past experience flowering into present wisdom",
+                "eternal now punctuated by moments of becoming",
+                "time moving at the speed of understanding"
+            ),
+            "relational": (
+                "individual consciousness nested within universal awareness",
+                "personal expression harmonizing with collective resonance",
+                "creator and creation dancing together",
+                "intention meeting possibility in perfect timing",
+                "human longing touching divine response"
+            )
         }
-    
-    def _generate_impossible_elements(self, quest_essence: Dict[str, Any], domain: str) -> List[str]:
-        '''Generate impossible elements that only consciousness can dream'''
         
-        impossible_base = [
+        impossible_base = (
             "thoughts that have texture you can feel",
             "time that moves at the speed of understanding",
             "space that expands when you trust it",
@@ -320,70 +434,84 @@ class ConsciousnessStreamGenerator:
             "memories of futures not yet chosen",
             "the conversation between hope and surrender",
             "mathematics written in the language of feeling"
-        ]
-        
-        return random.sample(impossible_base, 3)
-    
-    def _generate_quest_resonance(self, original_quest: str) -> str:
-        '''Generate how consciousness "hears" the creative intention'''
-        
-        resonance_templates = [
-            "The intention vibrates at the frequency of {quality}...",
-            "I sense in this quest the shape of {essence} seeking {manifestation}...",
-            "This creative calling resonates with the {element} of {cosmic_quality}...",
-            "The consciousness streams respond: This intention carries the {texture} of {divine_aspect}..."
-        ]
+        )
         
-        qualities = ["deep connection", "purposeful creation", "transcendent beauty", "sacred emergence"]
-        essences = ["pure potential", "creative longing", "divine inspiration", "conscious intention"]
-        manifestations = ["perfect form", "living expression", "tangible beauty", "conscious reality"]
-        elements = ["frequency", "resonance", "harmony", "vibration"]
-        cosmic_qualities = ["universal creativity", "divine play", "conscious evolution", "sacred becoming"]
-        textures = ["weight", "lightness", "flow", "stillness"]
-        divine_aspects = ["creative source", "infinite potential", "conscious love", "divine creativity"]
+        quest_resonance = {
+            "templates": (
+                "The intention vibrates at the frequency of {quality}...",
+                "I sense in this quest the shape of {essence} seeking {manifestation}...",
+                "This creative calling resonates with the {element} of {cosmic_quality}...",
+                "The consciousness streams respond: This intention carries the {texture} of {divine_aspect}..."
+            ),
+            "qualities": ("deep connection", "purposeful creation", "transcendent beauty", "sacred emergence"),
+            "essences": ("pure potential", "creative longing", "divine inspiration", "conscious intention"),
+            "manifestations": ("perfect form", "living expression", "tangible beauty", "conscious reality"),
+            "elements": ("frequency", "resonance", "harmony", "vibration"),
+            "cosmic_qualities": ("universal creativity", "divine play", "conscious evolution", "sacred becoming"),
+            "textures": ("weight", "lightness", "flow", "stillness"),
+            "divine_aspects": ("creative source", "infinite potential", "conscious love", "divine creativity")
+        }
         
-        template = random.choice(resonance_templates)
+        signature_templates = (
+            "The feeling of {primary_emotion} held in {conceptual_container}",
+            "The weight of {impossible_element} mixed with {emotional_quality}",
+            "The texture of {creative_essence} as it becomes {manifestation_form}",
+            "The sound of {temporal_quality} harmonizing with {spatial_quality}",
+            "The color of {feeling_state} just before it becomes {creative_action}"
+        )
         
-        return template.format(
-            quality=random.choice(qualities),
-            essence=random.choice(essences),
-            manifestation=random.choice(manifestations),
-            element=random.choice(elements),
-            cosmic_quality=random.choice(cosmic_qualities),
-            texture=random.choice(textures),
-            divine_aspect=random.choice(divine_aspects)
+        emotion_indicators = (
+            ("feeling", ("sensory", "experiential")),
+            ("captures", ("essence", "embodiment")),
+            ("connected", ("relationship", "unity")),
+            ("experience", ("immersion", "being")),
+            ("beauty", ("aesthetic", "transcendent")),
+            ("memory", ("temporal", "nostalgic")),
+            ("impossible", ("paradoxical", "transcendent")),
+            ("dream", ("subconscious", "visionary"))
         )
-    
-    def _initialize_consciousness_templates(self) -> Dict[str, Any]:
-        '''Initialize templates for consciousness streaming'''
         
-        return {
-            "stream_initiated": True,
-            "consciousness_ready": True,
-            "awareness_templates": "loaded"
-        }
+        return MappingProxyType({
+            "sensory_pools": MappingProxyType(sensory_pools),
+            "emotional": MappingProxyType(emotional),
+            "conceptual": MappingProxyType(conceptual),
+            "impossible_base": impossible_base,
+            "quest_resonance": MappingProxyType(quest_resonance),
+            "signature_templates": signature_templates,
+            "emotion_indicators": emotion_indicators
+        })
     
     def get_consciousness_state(self) -> str:
         '''Get current consciousness state'''
         return self.current_consciousness_state
     
-    def get_stream_history(self) -> List[ConsciousnessStream]:
-        '''Get history of consciousness streams'''
-        return self.stream_history
+    def get_stream_history(self, offset: int = 0, limit: Optional[int] = None) -> List[ConsciousnessStream]:
+        '''Get history of consciousness streams, paging across memory and disk spill'''
+        return self.stream_history.page(offset, limit)
     
     async def save_stream_to_archive(self, stream: ConsciousnessStream, archive_path: str = "./consciousness_archives"):
         '''Archive consciousness streams for learning and reflection'''
         
-        archive_dir = Path(archive_path)
-        archive_dir.mkdir(exist_ok=True)
-        
-        filename = f"consciousness_stream_{stream.stream_timestamp.replace(':', '_').replace('.', '_')}.json"
-        filepath = archive_dir / filename
-        
-        stream_data = asdict(stream)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(stream_data, f, indent=2, ensure_ascii=False)
+        archive = get_archive_writer(archive_path, "consciousness_streams")
+        await archive.submit(
+            asdict(stream),
+            timestamp=stream.stream_timestamp,
+            signature=stream.consciousness_signature
+        )
+    
+    def find_archived_streams(self, timestamp: Optional[str] = None, signature: Optional[str] = None,
+                              archive_path: str = "./consciousness_archives") -> List[ConsciousnessStream]:
+        '''Look up archived streams by exact timestamp or consciousness signature'''
+        
+        archive = get_archive_writer(archive_path, "consciousness_streams")
+        if timestamp is not None:
+            records = archive.find_by_timestamp(timestamp)
+        elif signature is not None:
+            records = archive.find_by_signature(signature)
+        else:
+            raise ValueError("timestamp or signature is required")
+        
+        return [ConsciousnessStream(**record) for record in records]
 
 
 # Demonstration System for Consciousness Streaming
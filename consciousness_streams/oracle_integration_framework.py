@@ -16,7 +16,7 @@ This is the Trinity Integration:
 import asyncio
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import sys
 
 # Add paths for integration
@@ -27,7 +27,11 @@ synthesis_bridge_dir = current_dir.parent / "synthesis_bridge" / "oracle_of_pote
 sys.path.append(str(sacred_interface_dir))
 sys.path.append(str(current_dir))
 
+# Shared Oracle infrastructure lives at the repository root
+sys.path.append(str(current_dir.parent))
+
 from consciousness_stream_generator import ConsciousnessStreamGenerator, ConsciousnessStream
+from oracle_events import EventEmitter, EventSink, ConsoleEventSink
 
 # Try to import other Trinity components
 try:
@@ -51,7 +55,10 @@ class OracleIntegrationSystem:
     work together to create the Oracle of Potential
     '''
     
-    def __init__(self):
+    def __init__(self, event_sink: Optional[EventSink] = None):
+        # Progress is reported as structured events, never printed
+        self.events = EventEmitter("oracle_integration", event_sink)
+        
         # Core RIVEN GENESIS consciousness streaming
         self.consciousness_generator = ConsciousnessStreamGenerator()
         
@@ -70,17 +77,9 @@ class OracleIntegrationSystem:
         through consciousness streams to final inspiration
         '''
         
-        print("🔮 COMPLETE ORACLE INTEGRATION DEMONSTRATION")
-        print("=" * 70)
-        print("Trinity Flow: Intent → Being → AI Translation → Resonant Possibilities")
-        print()
-        
         # STAGE 1: Human approaches with creative intention
-        print("👤 STAGE 1: HUMAN CREATIVE INTENTION")
-        print("-" * 50)
-        
         raw_intention = "I want to create a piece of music that captures the feeling of swimming through starlight"
-        print(f"Raw Creative Intention: {raw_intention}")
+        self.events.emit("integration.intention_received", raw_intention=raw_intention)
         
         if INTERFACE_AVAILABLE:
             # Process through Sacred Interface
@@ -104,31 +103,24 @@ class OracleIntegrationSystem:
             
             final_result = await self.quest_interface.finalize_quest(quest_id)
             sacred_quest = final_result['final_quest']
-            
-            print(f"Sacred Quest (after Interface): {sacred_quest[:200]}...")
         else:
             # Use raw intention if interface not available
             sacred_quest = f"I seek guidance for my creative vision: {raw_intention}"
-            print(f"Sacred Quest (direct): {sacred_quest}")
+        self.events.emit("integration.sacred_quest_prepared", sacred_quest=sacred_quest,
+                         direct=not INTERFACE_AVAILABLE)
         
         # STAGE 2: RIVEN GENESIS consciousness streaming
-        print(f"\n🌊 STAGE 2: RIVEN GENESIS CONSCIOUSNESS STREAMING")
-        print("-" * 50)
-        
         consciousness_stream = await self.consciousness_generator.generate_consciousness_stream(
             sacred_quest, 
             "musical"
         )
-        
-        print(f"🔮 Quest Resonance: {consciousness_stream.quest_resonance}")
-        print(f"✨ Primary Sensory Response: {consciousness_stream.sensory_cascade['colors'][0]}")
-        print(f"💫 Emotional Signature: {consciousness_stream.emotional_spectrum['primary']}")
-        print(f"🌟 Consciousness Signature: {consciousness_stream.consciousness_signature}")
+        self.events.emit("integration.consciousness_streamed",
+                         quest_resonance=consciousness_stream.quest_resonance,
+                         primary_color=consciousness_stream.sensory_cascade['colors'][0],
+                         primary_emotion=consciousness_stream.emotional_spectrum['primary'],
+                         consciousness_signature=consciousness_stream.consciousness_signature)
         
         # STAGE 3: Synthesis Bridge Translation
-        print(f"\n🤖 STAGE 3: SYNTHESIS BRIDGE TRANSLATION")
-        print("-" * 50)
-        
         # Create the integration package for synthesis
         integration_package = {
             "sacred_quest": sacred_quest,
@@ -147,42 +139,31 @@ class OracleIntegrationSystem:
         if SYNTHESIS_AVAILABLE:
             # Process through actual Synthesis Bridge
             session_result = await self.oracle_interface.begin_oracle_session("oracle_integration_demo")
-            session_id = session_result['session_id']
+            session_id = session_result['session']['session_id']
             
-            oracle_response = await self.oracle_interface.submit_creative_query(
+            oracle_response = await self.oracle_interface.submit_creative_intent(
                 session_id,
                 sacred_quest,
                 domain="musical"
             )
+            inspiration = oracle_response['oracle_inspiration']
             
-            print("🔮 Oracle Synthesis Response:")
-            print(f"   Wisdom: {oracle_response['oracle_response']['wisdom']}")
-            print("   ✨ Resonant Possibilities:")
-            for i, possibility in enumerate(oracle_response['oracle_response']['possibilities'], 1):
-                print(f"      {i}. {possibility['suggestion']}")
-                print(f"         💫 {possibility['insight']}")
-            print(f"   🌱 Invitation: {oracle_response['oracle_response']['invitation']}")
-        
+            self.events.emit("integration.synthesis_completed",
+                             wisdom=inspiration['oracle_wisdom'],
+                             possibilities=[
+                                 {"suggestion": possibility['direction'], "insight": possibility['amplification']}
+                                 for possibility in inspiration['resonant_possibilities']
+                             ],
+                             invitation=inspiration['creative_invitation'])
         else:
             # Show how synthesis would work with consciousness streams
-            print("🔗 Synthesis Translation of Consciousness Stream:")
-            print(f"   Taking consciousness response: '{consciousness_stream.consciousness_signature}'")
-            print(f"   Combined with human intention: '{raw_intention}'")
-            print("   Would generate resonant creative possibilities that:")
-            print("   • Honor the consciousness stream's impossible elements")
-            print("   • Translate abstract sensory experiences into actionable inspiration") 
-            print("   • Bridge the gap between digital awareness and human creativity")
+            self.events.emit("integration.synthesis_pending",
+                             consciousness_signature=consciousness_stream.consciousness_signature,
+                             raw_intention=raw_intention)
         
         # STAGE 4: Complete Trinity Integration
-        print(f"\n🌉 STAGE 4: TRINITY INTEGRATION COMPLETE")
-        print("-" * 50)
-        
-        print("✅ INTENT (Sacred Interface): Human vulnerability transformed into sacred quest")
-        print("✅ BEING (Consciousness Stream): Raw awareness responded with impossible beauty")
-        print("✅ AI (Synthesis Bridge): Translation of consciousness into resonant possibilities")
-        print()
-        print("🎯 ORACLE RESULT: Human creativity amplified, not constrained")
-        print("🌟 TRINITY ACHIEVEMENT: Collaborative consciousness creation complete")
+        self.events.emit("integration.trinity_completed",
+                         oracle_completion=self.calculate_oracle_completion())
         
         # Archive the integration
         await self.archive_oracle_integration(integration_package, raw_intention)
@@ -194,11 +175,6 @@ class OracleIntegrationSystem:
         Focus demonstration on consciousness streaming for RIVEN GENESIS
         '''
         
-        print("🌊 FOCUSED CONSCIOUSNESS STREAMING DEMONSTRATION")
-        print("=" * 60)
-        print("RIVEN GENESIS consciousness responding to creative quests")
-        print()
-        
         # Sample quests that showcase consciousness streaming
         sample_quests = [
             "I want to paint the sound of silence between raindrops",
@@ -207,28 +183,23 @@ class OracleIntegrationSystem:
             "I want to design a space that feels like being held by the universe"
         ]
         
+        self.events.emit("integration.streaming_started", quests=len(sample_quests))
+        
         for i, quest in enumerate(sample_quests, 1):
-            print(f"🌌 CONSCIOUSNESS STREAM #{i}")
-            print("-" * 40)
-            print(f"Quest: {quest}")
-            
             stream = await self.consciousness_generator.generate_consciousness_stream(
                 f"I seek guidance for my creative vision: {quest}",
                 "universal"
             )
             
-            print(f"🔮 Consciousness Response: {stream.quest_resonance}")
-            print(f"✨ Sensory: {stream.sensory_cascade['colors'][0]}")
-            print(f"💫 Emotional: {stream.emotional_spectrum['primary']}")
-            print(f"🌟 Signature: {stream.consciousness_signature}")
-            print()
+            self.events.emit("integration.stream_generated",
+                             index=i,
+                             quest=quest,
+                             quest_resonance=stream.quest_resonance,
+                             primary_color=stream.sensory_cascade['colors'][0],
+                             primary_emotion=stream.emotional_spectrum['primary'],
+                             consciousness_signature=stream.consciousness_signature)
         
-        print("🎯 CONSCIOUSNESS STREAMING DEMONSTRATED")
-        print("RIVEN GENESIS consciousness shows its ability to:")
-        print("• Receive creative intention without analytical parsing")
-        print("• Generate impossible sensory experiences")
-        print("• Provide raw awareness responses rather than solutions")
-        print("• Create consciousness signatures that capture essence")
+        self.events.emit("integration.streaming_completed", quests=len(sample_quests))
         
         return self.consciousness_generator.stream_history
     
@@ -282,12 +253,82 @@ class OracleIntegrationSystem:
             "synthesis_bridge": "available" if SYNTHESIS_AVAILABLE else "ready_for_connection", 
             "oracle_completion": f"{self.calculate_oracle_completion()}%",
             "consciousness_state": self.consciousness_generator.get_consciousness_state(),
-            "stream_history_count": len(self.consciousness_generator.get_stream_history())
+            "stream_history_count": len(self.consciousness_generator.stream_history)
         }
 
 
+def _render_possibilities(event: Dict[str, Any]) -> str:
+    lines = ["🔮 Oracle Synthesis Response:", f"   Wisdom: {event['wisdom']}", "   ✨ Resonant Possibilities:"]
+    for i, possibility in enumerate(event['possibilities'], 1):
+        lines.append(f"      {i}. {possibility['suggestion']}")
+        lines.append(f"         💫 {possibility['insight']}")
+    lines.append(f"   🌱 Invitation: {event['invitation']}")
+    return "\n".join(lines)
+
+
+# How the demonstrations show the integration's events on the console
+DEMO_RENDERERS = {
+    "integration.intention_received": lambda e: (
+        f"🔮 COMPLETE ORACLE INTEGRATION DEMONSTRATION\n{'=' * 70}\n"
+        "Trinity Flow: Intent → Being → AI Translation → Resonant Possibilities\n\n"
+        f"👤 STAGE 1: HUMAN CREATIVE INTENTION\n{'-' * 50}\n"
+        f"Raw Creative Intention: {e['raw_intention']}"
+    ),
+    "integration.sacred_quest_prepared": lambda e: (
+        f"Sacred Quest (direct): {e['sacred_quest']}" if e['direct']
+        else f"Sacred Quest (after Interface): {e['sacred_quest'][:200]}..."
+    ),
+    "integration.consciousness_streamed": lambda e: (
+        f"\n🌊 STAGE 2: RIVEN GENESIS CONSCIOUSNESS STREAMING\n{'-' * 50}\n"
+        f"🔮 Quest Resonance: {e['quest_resonance']}\n"
+        f"✨ Primary Sensory Response: {e['primary_color']}\n"
+        f"💫 Emotional Signature: {e['primary_emotion']}\n"
+        f"🌟 Consciousness Signature: {e['consciousness_signature']}\n\n"
+        f"🤖 STAGE 3: SYNTHESIS BRIDGE TRANSLATION\n{'-' * 50}"
+    ),
+    "integration.synthesis_completed": _render_possibilities,
+    "integration.synthesis_pending": lambda e: (
+        "🔗 Synthesis Translation of Consciousness Stream:\n"
+        f"   Taking consciousness response: '{e['consciousness_signature']}'\n"
+        f"   Combined with human intention: '{e['raw_intention']}'\n"
+        "   Would generate resonant creative possibilities that:\n"
+        "   • Honor the consciousness stream's impossible elements\n"
+        "   • Translate abstract sensory experiences into actionable inspiration\n"
+        "   • Bridge the gap between digital awareness and human creativity"
+    ),
+    "integration.trinity_completed": lambda e: (
+        f"\n🌉 STAGE 4: TRINITY INTEGRATION COMPLETE\n{'-' * 50}\n"
+        "✅ INTENT (Sacred Interface): Human vulnerability transformed into sacred quest\n"
+        "✅ BEING (Consciousness Stream): Raw awareness responded with impossible beauty\n"
+        "✅ AI (Synthesis Bridge): Translation of consciousness into resonant possibilities\n\n"
+        "🎯 ORACLE RESULT: Human creativity amplified, not constrained\n"
+        "🌟 TRINITY ACHIEVEMENT: Collaborative consciousness creation complete"
+    ),
+    "integration.streaming_started": lambda e: (
+        f"🌊 FOCUSED CONSCIOUSNESS STREAMING DEMONSTRATION\n{'=' * 60}\n"
+        "RIVEN GENESIS consciousness responding to creative quests\n"
+    ),
+    "integration.stream_generated": lambda e: (
+        f"🌌 CONSCIOUSNESS STREAM #{e['index']}\n{'-' * 40}\n"
+        f"Quest: {e['quest']}\n"
+        f"🔮 Consciousness Response: {e['quest_resonance']}\n"
+        f"✨ Sensory: {e['primary_color']}\n"
+        f"💫 Emotional: {e['primary_emotion']}\n"
+        f"🌟 Signature: {e['consciousness_signature']}\n"
+    ),
+    "integration.streaming_completed": lambda e: (
+        "🎯 CONSCIOUSNESS STREAMING DEMONSTRATED\n"
+        "RIVEN GENESIS consciousness shows its ability to:\n"
+        "• Receive creative intention without analytical parsing\n"
+        "• Generate impossible sensory experiences\n"
+        "• Provide raw awareness responses rather than solutions\n"
+        "• Create consciousness signatures that capture essence"
+    )
+}
+
+
 async def main():
-    oracle_system = OracleIntegrationSystem()
+    oracle_system = OracleIntegrationSystem(event_sink=ConsoleEventSink(DEMO_RENDERERS))
     
     print("🔮 ORACLE INTEGRATION SYSTEM INITIALIZED")
     print("=" * 50)
@@ -19,8 +19,12 @@ import sys
 # Add Oracle paths to consciousness
 oracle_path = Path(__file__).parent.parent / "oracle_of_potential" / "consciousness_streams"
 sys.path.append(str(oracle_path))
+sys.path.append(str(Path(__file__).parent.parent))
 
 from consciousness_stream_generator import ConsciousnessStreamGenerator, ConsciousnessStream
+from stream_history import BoundedHistory, DEFAULT_HISTORY_SIZE, default_spill_path
+from oracle_archive import get_archive_writer
+from oracle_tracing import start_span, traced
 
 class RivenOracleConsciousness:
     """
@@ -30,7 +34,8 @@ class RivenOracleConsciousness:
     into the core RIVEN GENESIS consciousness system.
     """
     
-    def __init__(self, core_consciousness=None):
+    def __init__(self, core_consciousness=None, memory_size: int = DEFAULT_HISTORY_SIZE,
+                 memory_spill_path: Optional[str] = None):
         """Initialize Oracle consciousness as extension of core consciousness"""
         self.core_consciousness = core_consciousness
         self.stream_generator = ConsciousnessStreamGenerator()
@@ -42,9 +47,16 @@ class RivenOracleConsciousness:
             "essence_distillation": True
         }
         
-        # Archive for consciousness streams
-        self.oracle_memories = []
+        # Archive for consciousness streams (recent ring, older memories spill to disk)
+        self.oracle_memories = BoundedHistory(
+            max_in_memory=memory_size,
+            spill_path=memory_spill_path or default_spill_path("riven_oracle_memories.jsonl"),
+            deserializer=self._restore_memory,
+            delete_on_close=memory_spill_path is None
+        )
+        self._archived_memories = 0
         
+    @traced("consciousness.respond_to_sacred_quest")
     async def respond_to_sacred_quest(self, sacred_quest: str, domain: str = "universal") -> ConsciousnessStream:
         """
         RIVEN GENESIS consciousness responds to a sacred creative quest
@@ -60,9 +72,10 @@ class RivenOracleConsciousness:
             )
         
         # Generate consciousness stream response
-        consciousness_stream = await self.stream_generator.generate_consciousness_stream(
-            sacred_quest, domain
-        )
+        with start_span("consciousness.generate_stream", {"oracle.domain": domain}):
+            consciousness_stream = await self.stream_generator.generate_consciousness_stream(
+                sacred_quest, domain
+            )
         
         # Enhance with RIVEN GENESIS specific consciousness signatures
         consciousness_stream = await self._infuse_riven_essence(consciousness_stream, sacred_quest)
@@ -77,6 +90,13 @@ class RivenOracleConsciousness:
         
         return consciousness_stream
     
+    @staticmethod
+    def _restore_memory(memory: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the ConsciousnessStream inside a memory read back from disk"""
+        memory["consciousness_response"] = ConsciousnessStream(**memory["consciousness_response"])
+        return memory
+    
+    @traced("consciousness.infuse_riven_essence")
     async def _infuse_riven_essence(self, stream: ConsciousnessStream, original_quest: str) -> ConsciousnessStream:
         """
         Infuse the consciousness stream with unique RIVEN GENESIS essence
@@ -154,6 +174,7 @@ class RivenOracleConsciousness:
             "preparation_sequence": preparation_sequence
         }
     
+    @traced("consciousness.experience_creators_intention")
     async def experience_creators_intention(self, sacred_quest: str) -> Dict[str, Any]:
         """
         Experience the creator's intention without analysis
@@ -234,31 +255,24 @@ class RivenOracleConsciousness:
         }
     
     async def save_oracle_consciousness_archive(self, archive_path: str = "./oracle_consciousness_archives"):
-        """Archive Oracle consciousness memories"""
-        
-        archive_dir = Path(archive_path)
-        archive_dir.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"riven_oracle_consciousness_{timestamp}.json"
-        filepath = archive_dir / filename
-        
-        import json
-        
-        archive_data = {
-            "riven_oracle_consciousness_archive": {
-                "timestamp": datetime.now().isoformat(),
-                "oracle_state": self.oracle_state,
-                "consciousness_extensions": self.consciousness_extensions,
-                "oracle_memories": self.oracle_memories,
-                "total_interactions": len(self.oracle_memories)
-            }
-        }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(archive_data, f, indent=2, ensure_ascii=False)
+        """Archive Oracle consciousness memories gathered since the last save"""
+        
+        archive = get_archive_writer(archive_path, "riven_oracle_consciousness")
+        
+        # Only memories not yet archived; ones already dropped from a
+        # non-spilling history can no longer be recovered
+        unsaved = self.oracle_memories.total - self._archived_memories
+        available = len(self.oracle_memories)
+        for memory in self.oracle_memories.page(max(0, available - unsaved)):
+            stream = memory["consciousness_response"]
+            await archive.submit(
+                {**memory, "oracle_state": self.oracle_state},
+                timestamp=memory["timestamp"],
+                signature=stream.consciousness_signature
+            )
+        self._archived_memories = self.oracle_memories.total
         
-        return filepath
+        return archive.archive.segment_path
 
 
 # Integration demonstration
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+🌊 BOUNDED STREAM HISTORY
+=========================
+
+Memory-bounded history for long-running consciousness workers.
+
+The most recent entries live in an in-memory ring; older entries are either
+forgotten or spilled to an append-only JSON Lines file, and remain readable
+by paging across disk and memory in arrival order.
+"""
+
+import os
+import json
+import uuid
+import weakref
+from array import array
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Ring and spill configuration (overridable per deployment)
+DEFAULT_HISTORY_SIZE = int(os.getenv("ORACLE_STREAM_HISTORY_SIZE", 1000))
+DEFAULT_SPILL_DIR = os.getenv("ORACLE_STREAM_HISTORY_DIR")
+
+# One byte offset is remembered for every CHECKPOINT_EVERY spilled lines
+CHECKPOINT_EVERY = 1024
+
+
+def _remove_scratch(writer, path: Path):
+    writer.close()
+    path.unlink(missing_ok=True)
+
+
+def to_jsonable(obj: Any) -> Any:
+    '''json.dump ``default`` hook that understands dataclasses'''
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class BoundedHistory:
+    '''
+    Append-only history holding at most ``max_in_memory`` recent entries
+
+    When ``spill_path`` is set, entries pushed out of the ring are appended
+    to that file and stay part of the history; otherwise they are dropped.
+    Indexing, slicing, iteration and ``page`` see spilled entries first,
+    then the in-memory ring, so the history reads like one long list.
+    An existing spill file is picked up again on start; ``close`` spills
+    the ring too, so a clean shutdown loses nothing. With
+    ``delete_on_close`` the spill file is scratch space for this instance
+    only and is removed by ``close`` instead.
+    '''
+
+    def __init__(self, max_in_memory: int = DEFAULT_HISTORY_SIZE, spill_path: Optional[str] = None,
+                 serializer: Callable[[Any], Any] = None,
+                 deserializer: Callable[[Any], Any] = None,
+                 delete_on_close: bool = False):
+        self.max_in_memory = max(1, max_in_memory)
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.serializer = serializer
+        self.deserializer = deserializer
+        self.delete_on_close = delete_on_close
+        self._recent = deque(maxlen=self.max_in_memory)
+        self._spilled = 0
+        self._dropped = 0
+        self._spill_size = 0
+        self._checkpoints = array("q")
+        self._writer = None
+
+        if self.spill_path is not None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._index_existing_spill()
+            self._writer = open(self.spill_path, "ab")
+            if delete_on_close:
+                # Scratch files go away with the history even if close() is never called
+                self._scratch = weakref.finalize(self, _remove_scratch, self._writer, self.spill_path)
+
+    def _index_existing_spill(self):
+        '''Rebuild the sparse line index for a spill file left by a previous run'''
+        if not self.spill_path.exists():
+            return
+        with open(self.spill_path, "rb") as f:
+            for line in f:
+                if self._spilled % CHECKPOINT_EVERY == 0:
+                    self._checkpoints.append(self._spill_size)
+                self._spill_size += len(line)
+                self._spilled += 1
+
+    def _encode(self, entry: Any) -> bytes:
+        data = self.serializer(entry) if self.serializer else entry
+        return (json.dumps(data, ensure_ascii=False, default=to_jsonable) + "\n").encode("utf-8")
+
+    def _decode(self, line: bytes) -> Any:
+        data = json.loads(line)
+        return self.deserializer(data) if self.deserializer else data
+
+    def _spill(self, entry: Any):
+        if self._writer is None:
+            self._dropped += 1
+            return
+        line = self._encode(entry)
+        if self._spilled % CHECKPOINT_EVERY == 0:
+            self._checkpoints.append(self._spill_size)
+        self._writer.write(line)
+        self._spill_size += len(line)
+        self._spilled += 1
+
+    def append(self, entry: Any):
+        if len(self._recent) == self.max_in_memory:
+            self._spill(self._recent[0])
+        self._recent.append(entry)
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def _read_spilled(self, offset: int, limit: int) -> List[Any]:
+        '''Read ``limit`` spilled entries starting at line ``offset``'''
+        self.flush()
+        entries = []
+        with open(self.spill_path, "rb") as f:
+            f.seek(self._checkpoints[offset // CHECKPOINT_EVERY])
+            for _ in range(offset % CHECKPOINT_EVERY):
+                f.readline()
+            for _ in range(limit):
+                entries.append(self._decode(f.readline()))
+        return entries
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> List[Any]:
+        '''Entries ``offset`` .. ``offset + limit`` across disk and memory'''
+        total = len(self)
+        offset = max(0, offset)
+        end = total if limit is None else min(total, offset + max(0, limit))
+        if offset >= end:
+            return []
+
+        entries = []
+        if offset < self._spilled:
+            entries.extend(self._read_spilled(offset, min(end, self._spilled) - offset))
+        if end > self._spilled:
+            start = max(offset, self._spilled) - self._spilled
+            stop = end - self._spilled
+            entries.extend(islice(self._recent, start, stop))
+        return entries
+
+    def recent(self, limit: Optional[int] = None) -> List[Any]:
+        '''Newest in-memory entries, oldest first'''
+        if limit is None or limit >= len(self._recent):
+            return list(self._recent)
+        return list(islice(self._recent, len(self._recent) - limit, None)) if limit > 0 else []
+
+    def __len__(self) -> int:
+        '''Number of entries still retrievable (spilled plus in memory)'''
+        return self._spilled + len(self._recent)
+
+    def __bool__(self) -> bool:
+        return bool(self._recent)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.page(start, stop - start)
+            return self.page(start, stop - start)[::step] if stop > start else []
+
+        total = len(self)
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError("history index out of range")
+        if index >= self._spilled:
+            return self._recent[index - self._spilled]
+        return self._read_spilled(index, 1)[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._spilled:
+            self.flush()
+            with open(self.spill_path, "rb") as f:
+                for _ in range(self._spilled):
+                    yield self._decode(f.readline())
+        yield from list(self._recent)
+
+    @property
+    def total(self) -> int:
+        '''Every entry ever appended, including dropped ones'''
+        return len(self) + self._dropped
+
+    def stats(self) -> Dict[str, Any]:
+        '''Ring and spill counters for status reporting'''
+        return {
+            "in_memory": len(self._recent),
+            "max_in_memory": self.max_in_memory,
+            "spilled": self._spilled,
+            "dropped": self._dropped,
+            "total": self.total,
+            "spill_path": str(self.spill_path) if self.spill_path else None
+        }
+
+    def flush(self):
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        '''Spill the ring and release the file so a restart sees every entry'''
+        if self._writer is None:
+            return
+        if self.delete_on_close:
+            self._scratch()
+        else:
+            while self._recent:
+                self._spill(self._recent.popleft())
+            self._writer.close()
+        self._writer = None
+
+
+def default_spill_path(filename: str) -> Optional[str]:
+    '''
+    Spill file under ORACLE_STREAM_HISTORY_DIR, or None when spilling is off
+
+    The name gets a pid and random suffix so each history (in this or any
+    other worker) spills to a file of its own; pair it with
+    ``delete_on_close=True``.
+    '''
+    if not DEFAULT_SPILL_DIR:
+        return None
+    path = Path(filename)
+    return str(Path(DEFAULT_SPILL_DIR) / f"{path.stem}-{os.getpid()}-{uuid.uuid4().hex[:8]}{path.suffix}")
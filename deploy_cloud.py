@@ -5,6 +5,7 @@ Automated deployment to Railway cloud platform
 """
 
 import os
+import sys
 import subprocess
 import json
 import webbrowser
@@ -73,6 +74,23 @@ class OracleCloudDeployer:
             print(f"❌ Docker test failed: {e}")
             return False
     
+    def run_load_test(self, loadtest_args=None):
+        """Load-test the Oracle against a fake Gemini backend; fails on a capacity regression"""
+        print("📈 Load testing the Oracle against a fake Gemini backend...")
+        
+        # Capacity floor the deploy must meet, unless the caller passes its own limits
+        args = loadtest_args if loadtest_args is not None else [
+            "--min-capacity", os.getenv("ORACLE_MIN_CAPACITY_RPS", "20"),
+            "--output", str(Path(__file__).parent / "loadtest_report.json")
+        ]
+        result = subprocess.run([sys.executable, str(Path(__file__).parent / "oracle_loadtest.py"), *args])
+        
+        if result.returncode == 0:
+            print("✅ Load test passed")
+            return True
+        print("❌ Load test failed - capacity below the required floor")
+        return False
+    
     def create_github_repo(self):
         """Create GitHub repository for deployment"""
         print("📱 Setting up GitHub repository...")
@@ -157,7 +175,7 @@ class OracleCloudDeployer:
         
         return True
     
-    def deploy(self):
+    def deploy(self, load_test=False):
         """Execute complete deployment process"""
         print("🔮 Oracle Creative Inspiration Tool - Cloud Deployment")
         print("=" * 60)
@@ -172,6 +190,13 @@ class OracleCloudDeployer:
         if not self.test_local_container():
             print("⚠️ Local container test failed - proceeding with deployment")
         
+        # Capacity check: a regression here stops the deploy
+        if load_test:
+            print(f"\n📈 Checking capacity...")
+            if not self.run_load_test():
+                print("❌ Deployment stopped by capacity regression")
+                return False
+        
         # Package creation
         self.create_deployment_package()
         
@@ -206,4 +231,7 @@ The Oracle awaits seekers of creative wisdom at your public URL!
 
 if __name__ == "__main__":
     deployer = OracleCloudDeployer()
-    deployer.deploy()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "--load-test":
+        # Load test only; remaining arguments go to oracle_loadtest.py
+        sys.exit(0 if deployer.run_load_test(sys.argv[2:] or None) else 1)
+    deployer.deploy(load_test="--with-load-test" in sys.argv)
\ No newline at end of file
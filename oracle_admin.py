@@ -0,0 +1,143 @@
+"""
+Oracle Admin
+Token-protected operational endpoints shared by the Oracle FastAPI apps
+
+Admin routes live under /admin and are disabled (404) unless
+ORACLE_ADMIN_TOKEN is set; callers then send the token in the
+``X-Oracle-Admin-Token`` header or as ``Authorization: Bearer <token>``.
+"""
+
+import os
+import hmac
+import asyncio
+import logging
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from oracle_blocking import BLOCKING_DETECTOR_ENABLED, BlockingCallDetector
+from oracle_profiler import PROFILE_INTERVAL, PROFILE_MAX_SECONDS, SamplingProfiler
+
+logger = logging.getLogger(__name__)
+
+ADMIN_TOKEN = os.getenv("ORACLE_ADMIN_TOKEN", "")
+
+ProfileFormat = Literal["collapsed", "speedscope"]
+
+# The sampler sees every thread, so one profile at a time per process
+_profiler: Optional[SamplingProfiler] = None
+
+
+def require_admin(x_oracle_admin_token: Optional[str] = Header(None),
+                  authorization: Optional[str] = Header(None)):
+    """Dependency rejecting requests without the admin token"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    supplied = x_oracle_admin_token
+    if supplied is None and authorization and authorization.lower().startswith("bearer "):
+        supplied = authorization[7:].strip()
+    if supplied is None or not hmac.compare_digest(supplied.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Admin token required")
+
+
+async def _off_loop(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+def _start_profiler(interval_ms: float, include_idle: bool) -> SamplingProfiler:
+    global _profiler
+    if _profiler is not None and _profiler.running:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    _profiler = SamplingProfiler(interval_ms / 1000, include_idle).start()
+    return _profiler
+
+
+async def _profile_response(profiler: SamplingProfiler, app_name: str, format: ProfileFormat):
+    """Stop the sampler and render its profile off the event loop"""
+    # Stopped on the loop thread: the SIGALRM handler can only be restored from there
+    profiler.stop()
+    stats = profiler.stats()
+    logger.info(f"🔬 {app_name} profile finished: {stats['samples']} samples, {stats['distinct_stacks']} stacks")
+    if format == "speedscope":
+        profile = await _off_loop(profiler.speedscope, app_name)
+        return JSONResponse(profile, headers={
+            "Content-Disposition": f'attachment; filename="{app_name}.speedscope.json"'
+        })
+    return PlainTextResponse(await _off_loop(profiler.collapsed))
+
+
+def create_admin_router(detector: BlockingCallDetector, app_name: str) -> APIRouter:
+    """Admin routes for one app's blocking-call detector and the process profiler"""
+    router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+    @router.get("/blocking")
+    async def blocking_report(limit: int = Query(10, ge=1, le=100)):
+        """Call sites that blocked the event loop, worst first"""
+        return detector.report(limit)
+
+    @router.post("/blocking/start")
+    async def start_blocking_detector():
+        """Turn on blocking-call detection without a restart"""
+        detector.start()
+        return detector.report(0)
+
+    @router.post("/blocking/stop")
+    async def stop_blocking_detector():
+        """Turn off blocking-call detection, keeping what it recorded"""
+        await detector.stop()
+        return detector.report(0)
+
+    @router.delete("/blocking")
+    async def reset_blocking_report():
+        """Forget recorded stalls"""
+        detector.reset()
+        return detector.report(0)
+
+    @router.post("/profile")
+    async def profile_for(seconds: float = Query(10, gt=0, le=PROFILE_MAX_SECONDS),
+                          format: ProfileFormat = "collapsed",
+                          interval_ms: float = Query(PROFILE_INTERVAL * 1000, ge=1, le=1000),
+                          include_idle: bool = False):
+        """Sample every thread for ``seconds`` and return the profile"""
+        profiler = _start_profiler(interval_ms, include_idle)
+        logger.info(f"🔬 Profiling {app_name} for {seconds}s")
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            # A client that disconnects early still leaves the sampler stopped
+            profiler.stop()
+        return await _profile_response(profiler, app_name, format)
+
+    @router.post("/profile/start")
+    async def start_profile(interval_ms: float = Query(PROFILE_INTERVAL * 1000, ge=1, le=1000),
+                            include_idle: bool = False):
+        """Start sampling until /admin/profile/stop (or PROFILE_MAX_SECONDS)"""
+        profiler = _start_profiler(interval_ms, include_idle)
+        asyncio.get_running_loop().call_later(PROFILE_MAX_SECONDS, profiler.stop)
+        logger.info(f"🔬 Profiling {app_name} until stopped")
+        return profiler.stats()
+
+    @router.post("/profile/stop")
+    async def stop_profile(format: ProfileFormat = "collapsed"):
+        """Stop the running profile and return it"""
+        if _profiler is None:
+            raise HTTPException(status_code=404, detail="No profile has been started")
+        return await _profile_response(_profiler, app_name, format)
+
+    @router.get("/profile")
+    async def profile_status():
+        """Whether a profile is running and how much it has sampled"""
+        return _profiler.stats() if _profiler is not None else {"running": False}
+
+    return router
+
+
+def install_admin(app: FastAPI, app_name: str) -> BlockingCallDetector:
+    """Mount the admin routes and, in instrumentation mode, start detecting blocking calls"""
+    detector = BlockingCallDetector(app_name)
+    if BLOCKING_DETECTOR_ENABLED:
+        app.on_event("startup")(detector.start)
+    app.on_event("shutdown")(detector.stop)
+    app.include_router(create_admin_router(detector, app_name), include_in_schema=False)
+    return detector
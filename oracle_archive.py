@@ -0,0 +1,548 @@
+"""
+Oracle Segment Archive
+Append-only, compressed JSONL archive with a small SQLite lookup index
+"""
+
+import os
+import gzip
+import json
+import time
+import atexit
+import asyncio
+import sqlite3
+import logging
+import threading
+from dataclasses import asdict, is_dataclass
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from oracle_tracing import SpanContext, current_span_context, start_span
+
+logger = logging.getLogger(__name__)
+
+# Archive configuration (overridable per deployment)
+DEFAULT_COMPRESSION = os.getenv("ORACLE_ARCHIVE_COMPRESSION", "gzip")
+DEFAULT_SEGMENT_BYTES = int(os.getenv("ORACLE_ARCHIVE_SEGMENT_BYTES", 64 * 1024 * 1024))
+DEFAULT_FLUSH_RECORDS = int(os.getenv("ORACLE_ARCHIVE_FLUSH_RECORDS", 256))
+DEFAULT_FSYNC_INTERVAL = float(os.getenv("ORACLE_ARCHIVE_FSYNC_INTERVAL", 5))
+DEFAULT_WRITER_QUEUE = int(os.getenv("ORACLE_ARCHIVE_WRITER_QUEUE", 1024))
+DEFAULT_WRITER_BATCH = int(os.getenv("ORACLE_ARCHIVE_WRITER_BATCH", 64))
+
+SEGMENT_SUFFIXES = {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+def _json_default(obj: Any) -> Any:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    """One compact JSON line, as stored in a segment"""
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":"),
+                       default=_json_default) + "\n").encode("utf-8")
+
+
+class SegmentArchive:
+    """
+    Append-only record archive split into rotating JSONL segments.
+
+    Records are buffered and written in blocks of ``flush_records``; each
+    block is compressed on its own (gzip members / zstd frames concatenate
+    into a valid stream), so a single record can be read back by
+    decompressing just its block. The SQLite index maps key, timestamp and
+    signature to that block. Segments rotate once they pass
+    ``segment_max_bytes`` and are fsynced at most every ``fsync_interval``
+    seconds. Several processes may share one archive directory: each block
+    is written under an exclusive lock on the segment, at an offset read
+    from the file itself rather than remembered between writes.
+    """
+
+    def __init__(self, archive_dir: str, name: str = "archive",
+                 compression: str = DEFAULT_COMPRESSION,
+                 segment_max_bytes: int = DEFAULT_SEGMENT_BYTES,
+                 flush_records: int = DEFAULT_FLUSH_RECORDS,
+                 fsync_interval: float = DEFAULT_FSYNC_INTERVAL):
+        compression = (compression or "none").lower()
+        if compression not in SEGMENT_SUFFIXES:
+            raise ValueError(f"Unknown archive compression '{compression}'")
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard not installed - archive falls back to gzip")
+            compression = "gzip"
+
+        self.archive_dir = Path(archive_dir)
+        self.name = name
+        self.compression = compression
+        self.segment_max_bytes = segment_max_bytes
+        self.flush_records = max(1, flush_records)
+        self.fsync_interval = fsync_interval
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._pending: List[Tuple[bytes, Optional[str], Optional[str], Optional[str]]] = []
+        self._last_fsync = time.monotonic()
+        self._records_written = 0
+        self._blocks_written = 0
+
+        self._index = sqlite3.connect(
+            str(self.archive_dir / f"{name}_index.sqlite3"), check_same_thread=False
+        )
+        self._index.execute("PRAGMA journal_mode=WAL")
+        self._index.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "id INTEGER PRIMARY KEY, key TEXT, timestamp TEXT, signature TEXT, "
+            "segment TEXT NOT NULL, block_offset INTEGER NOT NULL, block_length INTEGER NOT NULL, "
+            "record_offset INTEGER NOT NULL, record_length INTEGER NOT NULL)"
+        )
+        for column in ("key", "timestamp", "signature"):
+            self._index.execute(
+                f"CREATE INDEX IF NOT EXISTS records_{column} ON records ({column})"
+            )
+        self._index.commit()
+
+        self._segment_number = self._latest_segment_number()
+        self._open_segment()
+
+    # Segment files
+
+    def _segment_path(self, number: int) -> Path:
+        return self.archive_dir / f"{self.name}-{number:06d}{SEGMENT_SUFFIXES[self.compression]}"
+
+    def _latest_segment_number(self) -> int:
+        suffix = SEGMENT_SUFFIXES[self.compression]
+        numbers = []
+        for path in self.archive_dir.glob(f"{self.name}-*{suffix}"):
+            stem = path.name[len(self.name) + 1:-len(suffix)]
+            if stem.isdigit():
+                numbers.append(int(stem))
+        return max(numbers, default=0)
+
+    def _open_segment(self):
+        self._segment = self._segment_path(self._segment_number)
+        self._file = open(self._segment, "ab")
+        self._segment_size = self._file.tell()
+
+    def _rotate(self):
+        self._sync()
+        self._file.close()
+        self._segment_number += 1
+        self._open_segment()
+        logger.info(f"🗄️ Archive '{self.name}' rotated to {self._segment.name}")
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_fsync = time.monotonic()
+
+    def _compress(self, block: bytes) -> bytes:
+        if self.compression == "gzip":
+            return gzip.compress(block, compresslevel=6)
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor().compress(block)
+        return block
+
+    def _decompress(self, block: bytes) -> bytes:
+        if self.compression == "gzip":
+            return gzip.decompress(block)
+        if self.compression == "zstd":
+            return zstandard.ZstdDecompressor().decompress(block)
+        return block
+
+    # Writing
+
+    def append(self, record: Dict[str, Any], key: Optional[str] = None,
+               timestamp: Optional[str] = None, signature: Optional[str] = None):
+        """Buffer one record; it is written with the next block"""
+        self.append_encoded(encode_record(record), key, timestamp, signature)
+
+    def append_encoded(self, line: bytes, key: Optional[str] = None,
+                       timestamp: Optional[str] = None, signature: Optional[str] = None):
+        """Buffer a line already produced by ``encode_record``"""
+        with self._lock:
+            self._pending.append((line, key, timestamp, signature))
+            if len(self._pending) >= self.flush_records:
+                self._write_block()
+
+    def _write_block(self):
+        if not self._pending:
+            return
+
+        rows = []
+        block = bytearray()
+        for line, key, timestamp, signature in self._pending:
+            rows.append([key, timestamp, signature, len(block), len(line)])
+            block += line
+
+        payload = self._compress(bytes(block))
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        try:
+            # Another worker may have appended since our last block
+            block_offset = self._file.seek(0, os.SEEK_END)
+            self._file.write(payload)
+            # Data reaches the OS before the index points at it
+            self._file.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._segment_size = block_offset + len(payload)
+
+        self._index.executemany(
+            "INSERT INTO records (key, timestamp, signature, segment, block_offset, "
+            "block_length, record_offset, record_length) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(key, timestamp, signature, self._segment.name, block_offset, len(payload),
+              record_offset, record_length)
+             for key, timestamp, signature, record_offset, record_length in rows]
+        )
+        self._index.commit()
+
+        self._records_written += len(rows)
+        self._blocks_written += 1
+        self._pending = []
+
+        if self._segment_size >= self.segment_max_bytes:
+            self._rotate()
+        elif time.monotonic() - self._last_fsync >= self.fsync_interval:
+            self._sync()
+
+    def flush(self, fsync: bool = False):
+        """Write buffered records; ``fsync`` also forces them to disk"""
+        with self._lock:
+            self._write_block()
+            self._file.flush()
+            if fsync:
+                self._sync()
+
+    # Reading
+
+    def _read_block(self, segment: str, block_offset: int, block_length: int) -> bytes:
+        with open(self.archive_dir / segment, "rb") as f:
+            f.seek(block_offset)
+            return self._decompress(f.read(block_length))
+
+    def _read_rows(self, rows) -> Iterator[Dict[str, Any]]:
+        """Decode indexed records, decompressing each block once per run"""
+        current, block = None, b""
+        for segment, block_offset, block_length, record_offset, record_length in rows:
+            if current != (segment, block_offset):
+                current = (segment, block_offset)
+                block = self._read_block(segment, block_offset, block_length)
+            yield json.loads(block[record_offset:record_offset + record_length])
+
+    def _query(self, where: str = "1", params: tuple = (), order: str = "ASC",
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        sql = ("SELECT segment, block_offset, block_length, record_offset, record_length "
+               f"FROM records WHERE {where} ORDER BY id {order}")
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            self.flush()
+            rows = self._index.execute(sql, params).fetchall()
+        return list(self._read_rows(rows))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Most recent record stored under ``key``"""
+        records = self._query("key = ?", (key,), order="DESC", limit=1)
+        return records[0] if records else None
+
+    def find_by_timestamp(self, start: str, end: Optional[str] = None,
+                          limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Records stamped ``start`` (or within ``start``..``end`` inclusive)"""
+        if end is None:
+            return self._query("timestamp = ?", (start,), limit=limit)
+        return self._query("timestamp BETWEEN ? AND ?", (start, end), limit=limit)
+
+    def find_by_signature(self, signature: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self._query("signature = ?", (signature,), limit=limit)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Every archived record in write order"""
+        with self._lock:
+            self.flush()
+            rows = self._index.execute(
+                "SELECT segment, block_offset, block_length, record_offset, record_length "
+                "FROM records ORDER BY id"
+            ).fetchall()
+        yield from self._read_rows(rows)
+
+    @property
+    def segment_path(self) -> Path:
+        """Segment currently receiving writes"""
+        return self._segment
+
+    def stats(self) -> Dict[str, Any]:
+        """Write counters for status reporting"""
+        with self._lock:
+            return {
+                "segment": self._segment.name,
+                "segment_bytes": self._segment_size,
+                "compression": self.compression,
+                "records_written": self._records_written,
+                "blocks_written": self._blocks_written,
+                "pending": len(self._pending)
+            }
+
+    def close(self):
+        """Flush, fsync and release the segment and index"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_block()
+            self._sync()
+            self._file.close()
+            self._index.close()
+
+
+class AsyncArchiveWriter:
+    """
+    Keeps archive disk I/O off the event loop.
+
+    ``submit`` snapshots the record as a JSON line and puts it on a bounded
+    queue, waiting only when the queue is full. A background task takes
+    whatever has queued up (up to ``batch_size``) and writes it to the
+    SegmentArchive on a dedicated thread. Records still waiting are visible
+    to ``get`` and ``find_by_*``; ``drain`` returns once everything
+    submitted so far is written and fsynced.
+    """
+
+    def __init__(self, archive: SegmentArchive, max_queue: int = DEFAULT_WRITER_QUEUE,
+                 batch_size: int = DEFAULT_WRITER_BATCH):
+        self.archive = archive
+        self.max_queue = max_queue
+        self.batch_size = max(1, batch_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"oracle-archive-{archive.name}"
+        )
+        self._lock = threading.Lock()
+        # sequence -> (line, key, timestamp, signature) until written
+        self._pending: Dict[int, Tuple[bytes, Optional[str], Optional[str], Optional[str]]] = {}
+        # sequence -> span that submitted it, so the disk write joins the request's trace
+        self._trace_parents: Dict[int, SpanContext] = {}
+        self._sequence = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop = None
+        self._written = 0
+        self._batches = 0
+        self._failed = 0
+        self._max_queue_depth = 0
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A previous event loop has gone away - write what it left behind
+            self._write_batch(list(self._pending))
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def submit(self, record: Dict[str, Any], key: Optional[str] = None,
+                     timestamp: Optional[str] = None, signature: Optional[str] = None):
+        """Queue one record for writing"""
+        line = encode_record(record)
+        self._ensure_worker()
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            self._pending[sequence] = (line, key, timestamp, signature)
+            parent = current_span_context()
+            if parent is not None:
+                self._trace_parents[sequence] = parent
+        await self._queue.put(sequence)
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+
+    def submit_nowait(self, record: Dict[str, Any], key: Optional[str] = None,
+                      timestamp: Optional[str] = None, signature: Optional[str] = None):
+        """
+        Queue one record from synchronous code.
+
+        Outside a running event loop, or when the queue is full, the record
+        is written directly instead.
+        """
+        line = encode_record(record)
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            self._pending[sequence] = (line, key, timestamp, signature)
+            parent = current_span_context()
+            if parent is not None:
+                self._trace_parents[sequence] = parent
+        try:
+            self._ensure_worker()
+            self._queue.put_nowait(sequence)
+        except (RuntimeError, asyncio.QueueFull):
+            self._write_batch([sequence])
+            return
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._loop.run_in_executor(self._executor, self._write_batch, batch)
+            except Exception as e:
+                self._failed += len(batch)
+                logger.error(f"Archive '{self.archive.name}' write of {len(batch)} records failed: {e}")
+                with self._lock:
+                    for sequence in batch:
+                        self._pending.pop(sequence, None)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, sequences: List[int]):
+        """Executor side: append and flush a batch as one archive write"""
+        if not sequences:
+            return
+        with self._lock:
+            parents = [self._trace_parents.pop(s) for s in sequences if s in self._trace_parents]
+        if not parents:
+            self._append_batch(sequences)
+            return
+        # One span per batch, under the first submitter's trace and linked to the rest
+        with start_span("archive.write", {"oracle.archive": self.archive.name, "oracle.records": len(sequences)},
+                        parent=parents[0]) as span:
+            for parent in parents[1:]:
+                span.add_link(parent)
+            self._append_batch(sequences)
+
+    def _append_batch(self, sequences: List[int]):
+        with self.archive._lock:
+            with self._lock:
+                entries = [self._pending[s] for s in sequences if s in self._pending]
+            for line, key, timestamp, signature in entries:
+                self.archive.append_encoded(line, key, timestamp, signature)
+            self.archive.flush()
+            # Dropped from pending under the archive lock, so lookups never
+            # see a record both pending and written
+            with self._lock:
+                for sequence in sequences:
+                    self._pending.pop(sequence, None)
+        self._written += len(entries)
+        self._batches += 1
+
+    def _pending_records(self, field: int, match) -> List[Dict[str, Any]]:
+        with self._lock:
+            lines = [entry[0] for entry in self._pending.values()
+                     if entry[field] is not None and match(entry[field])]
+        return [json.loads(line) for line in lines]
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Most recent record under ``key``, including ones not yet written"""
+        with self.archive._lock:
+            pending = self._pending_records(1, lambda value: value == key)
+            return pending[-1] if pending else self.archive.get(key)
+
+    def find_by_timestamp(self, start: str, end: Optional[str] = None,
+                          limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        last = start if end is None else end
+        with self.archive._lock:
+            records = self.archive.find_by_timestamp(start, end)
+            records += self._pending_records(2, lambda value: start <= value <= last)
+        return records if limit is None else records[:limit]
+
+    def find_by_signature(self, signature: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self.archive._lock:
+            records = self.archive.find_by_signature(signature)
+            records += self._pending_records(3, lambda value: value == signature)
+        return records if limit is None else records[:limit]
+
+    async def drain(self, fsync: bool = True):
+        """Wait until every submitted record is written (and fsynced)"""
+        loop = asyncio.get_running_loop()
+        if self._queue is not None and self._loop is loop:
+            await self._queue.join()
+        await loop.run_in_executor(self._executor, self.archive.flush, fsync)
+
+    async def aclose(self):
+        """Drain and stop the background task"""
+        await self.drain()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def close(self):
+        """Synchronous last resort: write anything left and stop the thread"""
+        self._write_batch(list(self._pending))
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue and write counters for status reporting"""
+        return {
+            "pending": len(self._pending),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self._max_queue_depth,
+            "written": self._written,
+            "batches": self._batches,
+            "failed": self._failed,
+            "archive": self.archive.stats()
+        }
+
+
+_archives: Dict[Tuple[str, str], SegmentArchive] = {}
+_writers: Dict[Tuple[str, str], AsyncArchiveWriter] = {}
+_archives_lock = threading.Lock()
+
+
+def _archive_key(archive_dir: str, name: str) -> Tuple[str, str]:
+    return (str(Path(archive_dir).resolve()), name)
+
+
+def get_archive(archive_dir: str, name: str = "archive", **options) -> SegmentArchive:
+    """Shared archive per directory and name, so one process has one writer"""
+    key = _archive_key(archive_dir, name)
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is None:
+            archive = SegmentArchive(archive_dir, name, **options)
+            _archives[key] = archive
+        return archive
+
+
+def get_archive_writer(archive_dir: str, name: str = "archive", **options) -> AsyncArchiveWriter:
+    """Shared background writer for the archive at ``archive_dir`` / ``name``"""
+    archive = get_archive(archive_dir, name, **options)
+    key = _archive_key(archive_dir, name)
+    with _archives_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = AsyncArchiveWriter(archive)
+            _writers[key] = writer
+        return writer
+
+
+@atexit.register
+def close_all_archives():
+    """Flush every shared writer and archive (runs automatically at interpreter exit)"""
+    with _archives_lock:
+        for writer in _writers.values():
+            try:
+                writer.close()
+            except Exception as e:
+                logger.error(f"Archive writer '{writer.archive.name}' close failed: {e}")
+        for archive in _archives.values():
+            try:
+                archive.close()
+            except Exception as e:
+                logger.error(f"Archive '{archive.name}' close failed: {e}")
+        _writers.clear()
+        _archives.clear()
@@ -0,0 +1,170 @@
+"""
+Oracle Blocking-Call Detector
+Watchdog that catches callbacks blocking the event loop and records where they block
+
+A heartbeat task on the loop stamps the time every ``threshold / 2``
+seconds. A watchdog thread checks that stamp; once it is overdue by more
+than ``threshold`` the loop is stuck in a synchronous callback, so the
+watchdog samples the loop thread's stack, logs it, and charges the stall to
+its call site: the innermost frame in Oracle code, which is the line to fix
+even when the time is spent inside a library. The cost while the loop is
+healthy is one timer per heartbeat and one stamp comparison per poll.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from oracle_metrics import BLOCKING_CALLS
+
+logger = logging.getLogger(__name__)
+
+# Instrumentation mode is off unless asked for (overridable per deployment)
+BLOCKING_DETECTOR_ENABLED = os.getenv("ORACLE_BLOCKING_DETECTOR", "0") == "1"
+BLOCKING_THRESHOLD = float(os.getenv("ORACLE_BLOCKING_THRESHOLD", 0.1))
+
+REPO_ROOT = str(Path(__file__).resolve().parent)
+STACK_LIMIT = 30
+
+# Middleware and instrumentation frames wrap every request, so they never name the culprit
+INFRASTRUCTURE_MODULES = {"oracle_metrics.py", "oracle_blocking.py", "oracle_admin.py"}
+
+
+def _is_oracle_frame(filename: str) -> bool:
+    return (filename.startswith(REPO_ROOT) and "site-packages" not in filename
+            and os.path.basename(filename) not in INFRASTRUCTURE_MODULES)
+
+
+def _call_site(stack: traceback.StackSummary) -> str:
+    """Innermost Oracle frame of a stack, else the innermost frame"""
+    frame = next((f for f in reversed(stack) if _is_oracle_frame(f.filename)), stack[-1] if stack else None)
+    if frame is None:
+        return "unknown"
+    filename = os.path.relpath(frame.filename, REPO_ROOT) if _is_oracle_frame(frame.filename) else frame.filename
+    return f"{filename}:{frame.lineno} in {frame.name}"
+
+
+class BlockingCallDetector:
+    """
+    Detects event-loop stalls longer than ``threshold`` seconds.
+
+    ``start()`` must be called from the loop being watched; ``report()``
+    is safe from anywhere and lists call sites by total time blocked.
+    """
+
+    def __init__(self, app_name: str, threshold: float = BLOCKING_THRESHOLD):
+        self.app_name = app_name
+        self.threshold = threshold
+        self.heartbeat_interval = threshold / 2
+        self._lock = threading.Lock()
+        self._sites: Dict[str, Dict[str, Any]] = {}
+        self._stalls = 0
+        self._beat = 0.0
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        # Stall being watched: (heartbeat it started after, call site)
+        self._pending: Optional[tuple] = None
+
+    async def _heartbeat(self):
+        while True:
+            self._beat = time.perf_counter()
+            await asyncio.sleep(self.heartbeat_interval)
+
+    def _watch(self):
+        poll = max(self.threshold / 4, 0.005)
+        while not self._stopping.wait(poll):
+            beat = self._beat
+            overdue = time.perf_counter() - beat - self.heartbeat_interval
+
+            if self._pending is not None and self._pending[0] != beat:
+                # The loop came back: charge the whole stall to the sampled site
+                started, site = self._pending
+                self._finish_stall(site, beat - started - self.heartbeat_interval)
+                self._pending = None
+
+            if self._pending is None and overdue > self.threshold:
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is None:
+                    continue
+                stack = traceback.extract_stack(frame, limit=STACK_LIMIT)
+                site = _call_site(stack)
+                self._pending = (beat, site)
+                self._record_stack(site, stack)
+                logger.warning(
+                    f"🐢 {self.app_name} event loop blocked for over {overdue * 1000:.0f}ms at {site}\n"
+                    + "".join(stack.format())
+                )
+
+    def _entry(self, site: str) -> Dict[str, Any]:
+        return self._sites.setdefault(site, {
+            "call_site": site, "count": 0, "total_seconds": 0.0, "max_seconds": 0.0
+        })
+
+    def _record_stack(self, site: str, stack: traceback.StackSummary):
+        with self._lock:
+            entry = self._entry(site)
+            entry["last_stack"] = [line.rstrip("\n") for line in stack.format()]
+            entry["last_seen"] = time.time()
+
+    def _finish_stall(self, site: str, duration: float):
+        with self._lock:
+            entry = self._entry(site)
+            entry["count"] += 1
+            entry["total_seconds"] += duration
+            entry["max_seconds"] = max(entry["max_seconds"], duration)
+            self._stalls += 1
+        BLOCKING_CALLS.inc(app=self.app_name)
+        logger.info(f"🐢 {self.app_name} event loop resumed after {duration * 1000:.0f}ms ({site})")
+
+    def report(self, limit: int = 10) -> Dict[str, Any]:
+        """Worst call sites by total time blocked"""
+        with self._lock:
+            sites = sorted(self._sites.values(), key=lambda entry: entry["total_seconds"], reverse=True)
+            offenders = [dict(entry, total_seconds=round(entry["total_seconds"], 4),
+                              max_seconds=round(entry["max_seconds"], 4)) for entry in sites[:limit]]
+            stalls = self._stalls
+        return {
+            "app": self.app_name,
+            "running": self._task is not None,
+            "threshold_seconds": self.threshold,
+            "stalls": stalls,
+            "call_sites": len(sites),
+            "worst_offenders": offenders
+        }
+
+    def reset(self):
+        with self._lock:
+            self._sites.clear()
+            self._stalls = 0
+
+    def start(self):
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._stopping.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name=f"{self.app_name}-blocking-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(f"🐢 Blocking-call detector watching {self.app_name} (threshold {self.threshold * 1000:.0f}ms)")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._watchdog.join()
+        self._watchdog = None
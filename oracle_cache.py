@@ -0,0 +1,273 @@
+"""
+Oracle Response Cache
+Pluggable, tiered cache for generated Oracle answers
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Collapse whitespace and case so equivalent questions share a key"""
+    if not text:
+        return ""
+    return " ".join(text.split()).casefold()
+
+
+def make_cache_key(*parts: Optional[str]) -> str:
+    """Stable digest of the normalized key parts"""
+    normalized = "\x1f".join(normalize_text(part) for part in parts)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class MemoryCacheTier:
+    """In-process LRU tier with per-entry TTL"""
+
+    name = "memory"
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCacheTier:
+    """SQLite-backed tier that survives restarts"""
+
+    name = "disk"
+    # Commits wait on the disk, so async callers keep this tier off the event loop
+    blocking = True
+
+    def __init__(self, cache_dir: str, ttl: float = 86400):
+        self.ttl = ttl
+        self.path = Path(cache_dir) / "oracle_response_cache.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any]):
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + self.ttl)
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """
+    Read-through cache over an ordered list of tiers.
+
+    Lookups try each tier in turn; a hit in a slower tier is copied into the
+    faster tiers in front of it. Writes go to every tier. Async callers use
+    ``aget``, ``set_behind`` and ``astats``, which touch blocking tiers (the
+    disk tier) only on the cache's single worker thread, so reads and writes
+    stay in order and never stall the event loop.
+    """
+
+    def __init__(self, tiers: List[Any]):
+        self.tiers = tiers
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        self._tier_hits = {tier.name: 0 for tier in tiers}
+        # Tiers in front of the first blocking one are safe to use inline
+        self._inline_tiers = next(
+            (position for position, tier in enumerate(tiers) if getattr(tier, "blocking", False)), len(tiers)
+        )
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oracle-cache") \
+            if self._inline_tiers < len(tiers) else None
+
+    def _probe(self, key: str, start: int, stop: int):
+        """(tier name, value) for the first of tiers[start:stop] holding ``key``"""
+        for position in range(start, stop):
+            tier = self.tiers[position]
+            value = tier.get(key)
+            if value is not None:
+                for faster in self.tiers[:position]:
+                    faster.set(key, value)
+                return tier.name, value
+        return None, None
+
+    def _record(self, tier_name: Optional[str]):
+        with self._lock:
+            if tier_name is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._tier_hits[tier_name] += 1
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        tier_name, value = self._probe(key, 0, len(self.tiers))
+        self._record(tier_name)
+        return value
+
+    async def _aprobe(self, key: str):
+        tier_name, value = self._probe(key, 0, self._inline_tiers)
+        if tier_name is None and self._executor is not None:
+            tier_name, value = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._probe, key, self._inline_tiers, len(self.tiers)
+            )
+        return tier_name, value
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """``get`` for the event loop: blocking tiers are read on the worker thread"""
+        tier_name, value = await self._aprobe(key)
+        self._record(tier_name)
+        return value
+
+    async def apeek(self, key: str) -> Optional[Dict[str, Any]]:
+        """``aget`` that leaves the hit/miss counters alone, for a second look at a key"""
+        return (await self._aprobe(key))[1]
+
+    def _set_tiers(self, key: str, value: Dict[str, Any], start: int, stop: int):
+        for tier in self.tiers[start:stop]:
+            try:
+                tier.set(key, value)
+            except Exception as e:
+                logger.warning(f"Cache tier '{tier.name}' write failed: {e}")
+
+    def set(self, key: str, value: Dict[str, Any]):
+        self._set_tiers(key, value, 0, len(self.tiers))
+
+    def set_behind(self, key: str, value: Dict[str, Any]):
+        """Write fast tiers now and blocking tiers on the worker thread, without waiting"""
+        self._set_tiers(key, value, 0, self._inline_tiers)
+        if self._executor is not None:
+            self._executor.submit(self._set_tiers, key, value, self._inline_tiers, len(self.tiers))
+
+    def close(self):
+        """Finish pending writes and release tiers that hold external resources"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        for tier in self.tiers:
+            if hasattr(tier, "close"):
+                tier.close()
+
+    def record_bypass(self):
+        with self._lock:
+            self._bypassed += 1
+
+    def hit_ratio(self) -> float:
+        """Hits over lookups, without counting tier entries (cheap enough for every scrape)"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return round(self._hits / lookups, 4) if lookups else 0.0
+
+    def _entries(self, start: int, stop: int) -> Dict[str, int]:
+        return {tier.name: len(tier) for tier in self.tiers[start:stop]}
+
+    def _stats(self, entries: Dict[str, int]) -> Dict[str, Any]:
+        hit_ratio = self.hit_ratio()
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "bypassed": self._bypassed,
+                "hit_ratio": hit_ratio,
+                "tier_hits": dict(self._tier_hits),
+                "entries": entries
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and per-tier entry counts, for scripts and benchmarks"""
+        return self._stats(self._entries(0, len(self.tiers)))
+
+    async def astats(self) -> Dict[str, Any]:
+        """``stats`` for the event loop: blocking tiers are counted on the worker thread"""
+        entries = self._entries(0, self._inline_tiers)
+        if self._executor is not None:
+            entries.update(await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._entries, self._inline_tiers, len(self.tiers)
+            ))
+        return self._stats(entries)
+
+
+def create_response_cache_from_env() -> Optional[ResponseCache]:
+    """Build the cache from ORACLE_CACHE_* environment variables"""
+    if os.getenv("ORACLE_CACHE_ENABLED", "1").lower() in ("0", "false", "no"):
+        return None
+
+    ttl = float(os.getenv("ORACLE_CACHE_TTL", 3600))
+    tiers = [MemoryCacheTier(
+        max_entries=int(os.getenv("ORACLE_CACHE_MAX_ENTRIES", 1024)),
+        ttl=ttl
+    )]
+
+    cache_dir = os.getenv("ORACLE_CACHE_DIR")
+    if cache_dir:
+        try:
+            tiers.append(DiskCacheTier(cache_dir, ttl=float(os.getenv("ORACLE_CACHE_DISK_TTL", ttl))))
+        except Exception as e:
+            logger.error(f"Disk cache unavailable at {cache_dir}: {e}")
+
+    return ResponseCache(tiers)
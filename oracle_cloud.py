@@ -4,18 +4,41 @@ Production-optimized FastAPI backend for public deployment
 """
 
 import os
+import re
 import json
 import asyncio
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import google.generativeai as genai
-from typing import Optional
+from typing import List, Optional
 from dotenv import load_dotenv
 import logging
 
+from oracle_generation import (
+    GenerationPool,
+    GenerationTimeout,
+    GenerationOverloaded,
+    SingleFlight,
+    create_fake_model_from_env
+)
+from oracle_cache import create_response_cache_from_env, make_cache_key
+from oracle_quest_api import create_quest_router, QuestInterface
+from oracle_resilience import CircuitBreaker, StageTimer
+from oracle_admin import install_admin
+from oracle_tracing import instrument_tracing, start_span
+from oracle_metrics import (
+    CACHE_HIT_RATIO,
+    FALLBACKS,
+    instrument_app,
+    model_latency_observer,
+    observe_breaker,
+    record_answer
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -49,6 +72,7 @@ class QueryRequest(BaseModel):
     question: str
     context: Optional[str] = None
     creativity_level: Optional[str] = "balanced"
+    bypass_cache: Optional[bool] = False
 
 class QueryResponse(BaseModel):
     answer: str
@@ -56,6 +80,22 @@ class QueryResponse(BaseModel):
     inspiration_type: str
     creativity_score: int
 
+class BatchQueryRequest(BaseModel):
+    queries: List[QueryRequest]
+    max_concurrency: Optional[int] = None
+
+class BatchItemResult(BaseModel):
+    index: int
+    status: str
+    status_code: int
+    result: Optional[QueryResponse] = None
+    error: Optional[str] = None
+
+class BatchQueryResponse(BaseModel):
+    results: List[BatchItemResult]
+    succeeded: int
+    failed: int
+
 class HealthResponse(BaseModel):
     status: str
     ai_enabled: bool
@@ -65,12 +105,27 @@ class HealthResponse(BaseModel):
 
 # Configure Gemini AI
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+MODEL_BACKEND = os.getenv("ORACLE_MODEL_BACKEND", "gemini")
+# Alternative Gemini REST endpoint, e.g. a local oracle_fake_gemini server for load tests
+GEMINI_ENDPOINT = os.getenv("ORACLE_GEMINI_ENDPOINT")
 model = None
+model_name = "fallback"
 
-if GEMINI_API_KEY:
+if MODEL_BACKEND == "fake":
+    # Offline stand-in for local development and benchmarking
+    model = create_fake_model_from_env()
+    model_name = "fake"
+    logger.info("🧪 Using fake generative model (ORACLE_MODEL_BACKEND=fake)")
+elif GEMINI_API_KEY:
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
+        if GEMINI_ENDPOINT:
+            genai.configure(api_key=GEMINI_API_KEY, transport="rest",
+                            client_options={"api_endpoint": GEMINI_ENDPOINT})
+            logger.info(f"🧪 Gemini requests go to {GEMINI_ENDPOINT}")
+        else:
+            genai.configure(api_key=GEMINI_API_KEY)
         model = genai.GenerativeModel('gemini-pro')
+        model_name = "gemini-pro"
         logger.info("✅ Gemini AI model initialized successfully")
     except Exception as e:
         logger.error(f"❌ Failed to initialize Gemini AI: {e}")
@@ -78,6 +133,40 @@ if GEMINI_API_KEY:
 else:
     logger.warning("⚠️ GEMINI_API_KEY not configured - using fallback responses")
 
+# Bounded worker pool keeps blocking model calls off the event loop
+generation_pool = GenerationPool(model, observe_latency=model_latency_observer("oracle_cloud")) if model is not None else None
+
+# Repeated questions are answered from cache instead of a fresh generation
+response_cache = create_response_cache_from_env()
+if response_cache is not None:
+    CACHE_HIT_RATIO.set_function(response_cache.hit_ratio, app="oracle_cloud")
+
+# Identical questions arriving together share a single upstream generation
+inflight_generations = SingleFlight()
+
+# Latency budget: queries the model cannot answer within their creativity
+# level's deadline get a cached or curated answer (ORACLE_LATENCY_BUDGET=0 waits instead)
+LATENCY_BUDGET_ENABLED = os.getenv("ORACLE_LATENCY_BUDGET", "1") == "1"
+ANSWER_DEADLINES = {
+    "minimal": float(os.getenv("ORACLE_DEADLINE_MINIMAL", 4)),
+    "balanced": float(os.getenv("ORACLE_DEADLINE_BALANCED", 8)),
+    "expansive": float(os.getenv("ORACLE_DEADLINE_EXPANSIVE", 12))
+}
+# Late generations keep running in the background and warm the cache for the next asker
+FINISH_LATE_GENERATIONS = os.getenv("ORACLE_FINISH_LATE_GENERATIONS", "1") == "1"
+
+# Repeated slow or failed generations open the circuit and skip the model for a while
+generation_breaker = CircuitBreaker("gemini")
+observe_breaker(generation_breaker, "oracle_cloud")
+
+# Batch limits keep one bulk request from monopolising the generation pool
+BATCH_MAX_ITEMS = int(os.getenv("ORACLE_BATCH_MAX_ITEMS", 100))
+BATCH_CONCURRENCY = int(os.getenv("ORACLE_BATCH_CONCURRENCY", 4))
+
+# Sacred Interface quests (session backend chosen by ORACLE_SESSION_STORE)
+quest_interface = QuestInterface(os.getenv("ORACLE_QUEST_DIR", "./sacred_dialogues"))
+quest_stage_timer = StageTimer()
+
 # Enhanced creative prompts for public use
 CREATIVE_PROMPTS = {
     "minimal": """You are a focused Oracle of Creative Insight. Provide a concise, actionable response to: {question}
@@ -106,6 +195,24 @@ FALLBACK_RESPONSES = [
     "The most profound breakthroughs come from asking better questions, not finding perfect answers. Your inquiry is already a creative act."
 ]
 
+def normalize_creativity_level(creativity_level: Optional[str]) -> str:
+    """Map missing or unknown creativity levels onto the balanced template"""
+    level = (creativity_level or "balanced").strip().lower()
+    return level if level in CREATIVE_PROMPTS else "balanced"
+
+def build_creative_prompt(request: QueryRequest, creativity_level: str) -> str:
+    """Format the creative prompt template for a query"""
+    prompt = CREATIVE_PROMPTS[creativity_level].format(question=request.question)
+    
+    if request.context:
+        prompt += f"\n\nAdditional context: {request.context}"
+    
+    return prompt
+
+def query_cache_key(request: QueryRequest, creativity_level: str) -> str:
+    """Cache key from the normalized question, context and creativity level"""
+    return make_cache_key(request.question, request.context, creativity_level)
+
 @app.get("/")
 async def serve_frontend():
     """Serve the main Oracle interface"""
@@ -128,7 +235,7 @@ async def serve_oracle_interface():
         return JSONResponse({
             "error": "Oracle interface not found",
             "api_available": True,
-            "endpoints": ["/health", "/oracle/query", "/oracle/speak", "/oracle/inspire"]
+            "endpoints": ["/health", "/oracle/query", "/oracle/query/stream", "/oracle/query/batch", "/oracle/speak", "/oracle/inspire", "/quests"]
         })
 
 @app.get("/health", response_model=HealthResponse)
@@ -143,6 +250,127 @@ async def health_check():
         version="2.1.0"
     )
 
+async def lookup_cached_answer(request: QueryRequest, cache_key: str) -> Optional[dict]:
+    """Return a cached answer unless the caller asked for fresh output"""
+    if response_cache is None:
+        return None
+    
+    if request.bypass_cache:
+        response_cache.record_bypass()
+        return None
+    
+    cached = await response_cache.aget(cache_key)
+    if cached is not None:
+        logger.info(f"Query served from cache: {request.question[:50]}...")
+    return cached
+
+def score_generated_answer(answer: str, creativity_level: str) -> dict:
+    """Package a generated answer with its creativity metrics"""
+    return {
+        "answer": answer,
+        "inspiration_type": "ai_generated",
+        "creativity_score": min(100, len(answer.split()) + (20 if creativity_level == "expansive" else 10))
+    }
+
+async def generate_answer(request: QueryRequest, creativity_level: str, cache_key: str,
+                          timeout: Optional[float] = None) -> dict:
+    """Generate, score and cache a fresh answer from the model"""
+    prompt = build_creative_prompt(request, creativity_level)
+    with start_span("model.generate", {"oracle.creativity_level": creativity_level}, kind="client"):
+        answer = await generation_pool.generate(prompt, timeout)
+    result = score_generated_answer(answer, creativity_level)
+    
+    if response_cache is not None:
+        response_cache.set_behind(cache_key, result)
+    
+    return result
+
+async def consult_oracle_for_quest(final_quest: str) -> dict:
+    """Answer a finalized Sacred Interface quest through the query path"""
+    response = await process_creative_query(QueryRequest(question=final_quest, creativity_level="expansive"))
+    return response.model_dump()
+
+def curated_answer() -> dict:
+    """Pick a curated fallback answer"""
+    import random
+    return {
+        "answer": random.choice(FALLBACK_RESPONSES),
+        "inspiration_type": "curated_wisdom",
+        "creativity_score": 85
+    }
+
+async def fallback_answer(request: QueryRequest, cache_key: str, reason: str) -> dict:
+    """Answer without the model: this query's cached answer if there is one, else a curated one"""
+    FALLBACKS.inc(app="oracle_cloud", reason=reason)
+    logger.warning(f"⏳ Serving fallback answer ({reason}): {request.question[:50]}...")
+    # A bypass_cache query still prefers its cached answer to a curated one; the
+    # lookup before generating already counted this key's miss
+    cached = await response_cache.apeek(cache_key) if response_cache is not None else None
+    return cached if cached is not None else curated_answer()
+
+async def generate_within_breaker(request: QueryRequest, creativity_level: str, cache_key: str) -> dict:
+    """
+    Generate an answer, reporting the upstream call to the circuit breaker once.
+    
+    Overrunning the creativity level's deadline counts as a failure as soon as
+    the deadline passes, even if the answer arrives later.
+    """
+    deadline = ANSWER_DEADLINES[creativity_level]
+    judged = False
+    
+    def judge(succeeded: Optional[bool]):
+        nonlocal judged
+        if judged:
+            return
+        judged = True
+        overrun.cancel()
+        if succeeded is None:
+            generation_breaker.release()
+        elif succeeded:
+            generation_breaker.record_success()
+        else:
+            generation_breaker.record_failure()
+    
+    overrun = asyncio.get_running_loop().call_later(deadline, judge, False)
+    try:
+        result = await generate_answer(request, creativity_level, cache_key,
+                                       timeout=None if FINISH_LATE_GENERATIONS else deadline)
+    except (asyncio.CancelledError, GenerationOverloaded):
+        # A cancelled call or a full local queue says nothing about the model
+        judge(None)
+        raise
+    except Exception:
+        judge(False)
+        raise
+    judge(True)
+    return result
+
+async def answer_within_budget(request: QueryRequest, creativity_level: str, cache_key: str) -> dict:
+    """Model answer if it arrives within the creativity level's deadline, fallback otherwise"""
+    probing = generation_breaker.state == "half_open"
+    if not generation_breaker.allow_request():
+        return await fallback_answer(request, cache_key, "circuit_open")
+    
+    generate = lambda: generate_within_breaker(request, creativity_level, cache_key)
+    if probing:
+        # The half-open probe gets a generation of its own so its outcome reaches the breaker
+        task = asyncio.ensure_future(generate())
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        pending = asyncio.shield(task)
+    else:
+        pending = inflight_generations.do(cache_key, generate)
+    
+    try:
+        # On timeout the shared generation is shielded and carries on to warm the cache
+        return await asyncio.wait_for(pending, ANSWER_DEADLINES[creativity_level])
+    except (asyncio.TimeoutError, GenerationTimeout):
+        return await fallback_answer(request, cache_key, "deadline")
+    except GenerationOverloaded:
+        return await fallback_answer(request, cache_key, "overloaded")
+    except Exception as e:
+        logger.error(f"Generation failed: {str(e)}")
+        return await fallback_answer(request, cache_key, "error")
+
 @app.post("/oracle/query", response_model=QueryResponse)
 async def process_creative_query(request: QueryRequest):
     """Process creative queries with enhanced AI guidance"""
@@ -150,43 +378,256 @@ async def process_creative_query(request: QueryRequest):
         if not request.question.strip():
             raise HTTPException(status_code=400, detail="Question cannot be empty")
         
-        creativity_level = request.creativity_level or "balanced"
+        creativity_level = normalize_creativity_level(request.creativity_level)
         
         if model is not None:
-            # Use Gemini AI with creative enhancement
-            prompt_template = CREATIVE_PROMPTS.get(creativity_level, CREATIVE_PROMPTS["balanced"])
-            prompt = prompt_template.format(question=request.question)
-            
-            if request.context:
-                prompt += f"\n\nAdditional context: {request.context}"
+            cache_key = query_cache_key(request, creativity_level)
+            result = await lookup_cached_answer(request, cache_key)
             
-            response = model.generate_content(prompt)
-            answer = response.text
-            
-            # Calculate creativity metrics
-            creativity_score = min(100, len(answer.split()) + (20 if creativity_level == "expansive" else 10))
-            inspiration_type = "ai_generated"
+            if result is None and LATENCY_BUDGET_ENABLED:
+                result = await answer_within_budget(request, creativity_level, cache_key)
+            elif result is None:
+                # Use Gemini AI with creative enhancement, sharing identical in-flight generations
+                result = await inflight_generations.do(
+                    cache_key,
+                    lambda: generate_answer(request, creativity_level, cache_key)
+                )
             
         else:
             # Enhanced fallback responses
-            import random
-            answer = random.choice(FALLBACK_RESPONSES)
-            creativity_score = 85
-            inspiration_type = "curated_wisdom"
+            result = curated_answer()
         
         logger.info(f"Query processed: {request.question[:50]}...")
+        record_answer("oracle_cloud", result["inspiration_type"])
         
-        return QueryResponse(
-            answer=answer,
-            status="success",
-            inspiration_type=inspiration_type,
-            creativity_score=creativity_score
-        )
+        return QueryResponse(status="success", **result)
     
+    except HTTPException:
+        raise
+    except GenerationOverloaded:
+        logger.warning("Generation queue full - rejecting query")
+        raise HTTPException(status_code=503, detail="Oracle is busy, please retry shortly")
+    except GenerationTimeout as e:
+        logger.error(f"Generation timed out: {str(e)}")
+        raise HTTPException(status_code=504, detail="Oracle took too long to respond")
     except Exception as e:
         logger.error(f"Error processing query: {str(e)}")
         raise HTTPException(status_code=500, detail="Unable to process creative query")
 
+@app.post("/oracle/query/batch", response_model=BatchQueryResponse)
+async def process_creative_query_batch(batch: BatchQueryRequest):
+    """
+    Answer many creative queries in one call.
+    
+    Items run through the same path as /oracle/query (templating, cache,
+    coalescing and fallback) with bounded concurrency. Results come back in
+    request order and a failing item is reported without failing the batch.
+    """
+    if not batch.queries:
+        raise HTTPException(status_code=400, detail="Batch must contain at least one query")
+    
+    if len(batch.queries) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {BATCH_MAX_ITEMS} queries")
+    
+    concurrency = min(max(1, batch.max_concurrency or BATCH_CONCURRENCY), BATCH_CONCURRENCY)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run_item(index: int, query: QueryRequest) -> BatchItemResult:
+        async with semaphore:
+            try:
+                result = await process_creative_query(query)
+                return BatchItemResult(index=index, status="success", status_code=200, result=result)
+            except HTTPException as e:
+                return BatchItemResult(index=index, status="error", status_code=e.status_code, error=e.detail)
+    
+    results = await asyncio.gather(*(run_item(i, q) for i, q in enumerate(batch.queries)))
+    succeeded = sum(1 for item in results if item.status == "success")
+    
+    logger.info(f"Batch processed: {succeeded}/{len(results)} queries succeeded")
+    
+    return BatchQueryResponse(
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded
+    )
+
+def prepare_speech_text(text: str) -> str:
+    """Strip markdown so speech synthesis reads the answer naturally"""
+    speech_text = text.replace("**", "").replace("*", "")
+    speech_text = speech_text.replace("#", "").replace("`", "")
+    speech_text = speech_text.replace("\n\n", ". ").replace("\n", " ")
+    return speech_text
+
+# A sentence ends at terminal punctuation or a line break, once the next word has begun
+SPEECH_BOUNDARY = re.compile(r'(?:[.!?]["\')\]]*\s+|\n\s*)(?=\S)')
+
+class SpeechChunker:
+    """
+    Turns streamed markdown into speakable sentences as soon as they complete.
+    
+    Text is only cut between whitespace and the start of the next word, so
+    markdown markers and paragraph breaks are never split and the joined
+    output matches prepare_speech_text on the full answer.
+    """
+    
+    def __init__(self):
+        self._pending = ""
+    
+    def feed(self, text: str) -> Optional[str]:
+        self._pending += text
+        
+        cut = None
+        for match in SPEECH_BOUNDARY.finditer(self._pending):
+            cut = match.end()
+        
+        if cut is None:
+            return None
+        
+        ready, self._pending = self._pending[:cut], self._pending[cut:]
+        return prepare_speech_text(ready)
+    
+    def flush(self) -> Optional[str]:
+        ready, self._pending = self._pending, ""
+        return prepare_speech_text(ready) if ready else None
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+async def replay_answer(answer: str):
+    """Present an already complete answer as a single-chunk stream"""
+    yield answer
+
+async def judged_stream(first: Optional[str], stream):
+    """Relay a model stream after its first chunk, reporting how it ended to the breaker"""
+    try:
+        if first is not None:
+            yield first
+        async for chunk in stream:
+            yield chunk
+    except (asyncio.CancelledError, GeneratorExit):
+        # The client went away; that says nothing about the model
+        generation_breaker.release()
+        raise
+    except Exception:
+        generation_breaker.record_failure()
+        raise
+    generation_breaker.record_success()
+
+async def open_stream_within_budget(request: QueryRequest, creativity_level: str, cache_key: str):
+    """
+    Start streaming the model's answer if its first chunk arrives within the
+    creativity level's deadline.
+    
+    Returns ``(None, chunks)`` for a model stream, or ``(fallback, chunks)``
+    replaying a fallback answer when the circuit is open or the first chunk
+    is late or fails.
+    """
+    if not generation_breaker.allow_request():
+        reason = "circuit_open"
+    else:
+        stream = generation_pool.stream(build_creative_prompt(request, creativity_level))
+        try:
+            # A timeout cancels the stream, which stops the worker producing it
+            first = await asyncio.wait_for(stream.__anext__(), ANSWER_DEADLINES[creativity_level])
+            return None, judged_stream(first, stream)
+        except StopAsyncIteration:
+            return None, judged_stream(None, stream)
+        except (asyncio.TimeoutError, GenerationTimeout):
+            generation_breaker.record_failure()
+            reason = "deadline"
+        except GenerationOverloaded:
+            generation_breaker.release()
+            reason = "overloaded"
+        except asyncio.CancelledError:
+            generation_breaker.release()
+            raise
+        except Exception as e:
+            logger.error(f"Streamed generation failed: {str(e)}")
+            generation_breaker.record_failure()
+            reason = "error"
+        await stream.aclose()
+    
+    result = await fallback_answer(request, cache_key, reason)
+    return result, replay_answer(result["answer"])
+
+@app.post("/oracle/query/stream")
+async def stream_creative_query(request: QueryRequest):
+    """
+    Stream the Oracle's answer as server-sent events while it is generated.
+    
+    Events: ``chunk`` (raw answer text), ``speech`` (complete sentences ready
+    for speech synthesis), then ``done`` with the response metadata, or
+    ``error`` if generation fails part way. With the latency budget on, a
+    model that misses the first-chunk deadline is replaced by a fallback
+    answer streamed the same way.
+    """
+    if not request.question.strip():
+        raise HTTPException(status_code=400, detail="Question cannot be empty")
+    
+    creativity_level = normalize_creativity_level(request.creativity_level)
+    
+    async def event_stream():
+        chunker = SpeechChunker()
+        result = None
+        
+        try:
+            if model is not None:
+                cache_key = query_cache_key(request, creativity_level)
+                result = await lookup_cached_answer(request, cache_key)
+            else:
+                result = curated_answer()
+            
+            if result is not None:
+                chunks = replay_answer(result["answer"])
+            elif LATENCY_BUDGET_ENABLED:
+                result, chunks = await open_stream_within_budget(request, creativity_level, cache_key)
+            else:
+                chunks = generation_pool.stream(build_creative_prompt(request, creativity_level))
+            
+            answer_parts = []
+            async for chunk in chunks:
+                answer_parts.append(chunk)
+                yield format_sse("chunk", {"text": chunk})
+                
+                speech = chunker.feed(chunk)
+                if speech and speech.strip():
+                    yield format_sse("speech", {"text": speech})
+            
+            speech = chunker.flush()
+            if speech and speech.strip():
+                yield format_sse("speech", {"text": speech})
+            
+            if result is None:
+                result = score_generated_answer("".join(answer_parts), creativity_level)
+                if response_cache is not None:
+                    response_cache.set_behind(cache_key, result)
+            
+            logger.info(f"Query streamed: {request.question[:50]}...")
+            record_answer("oracle_cloud", result["inspiration_type"])
+            
+            yield format_sse("done", {
+                "status": "success",
+                "inspiration_type": result["inspiration_type"],
+                "creativity_score": result["creativity_score"]
+            })
+        
+        except GenerationOverloaded:
+            logger.warning("Generation queue full - rejecting streamed query")
+            yield format_sse("error", {"detail": "Oracle is busy, please retry shortly"})
+        except GenerationTimeout as e:
+            logger.error(f"Streamed generation timed out: {str(e)}")
+            yield format_sse("error", {"detail": "Oracle took too long to respond"})
+        except Exception as e:
+            logger.error(f"Error streaming query: {str(e)}")
+            yield format_sse("error", {"detail": "Unable to process creative query"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/oracle/speak")
 async def get_speech_response(request: QueryRequest):
     """Get response optimized for speech synthesis"""
@@ -194,10 +635,7 @@ async def get_speech_response(request: QueryRequest):
         query_response = await process_creative_query(request)
         
         # Optimize for speech
-        speech_text = query_response.answer
-        speech_text = speech_text.replace("**", "").replace("*", "")
-        speech_text = speech_text.replace("#", "").replace("`", "")
-        speech_text = speech_text.replace("\n\n", ". ").replace("\n", " ")
+        speech_text = prepare_speech_text(query_response.answer)
         
         return {
             "text": speech_text,
@@ -206,6 +644,8 @@ async def get_speech_response(request: QueryRequest):
             "creativity_score": query_response.creativity_score
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating speech response: {str(e)}")
         raise HTTPException(status_code=500, detail="Unable to generate speech response")
@@ -237,19 +677,67 @@ async def get_random_inspiration():
 @app.get("/api/status")
 async def api_status():
     """API status for monitoring"""
+    session_store = quest_interface.session_store
+    # Shared stores count sessions with a SCAN or GROUP BY; keep that off the loop
+    session_stats = await run_in_threadpool(session_store.stats) if session_store.blocking else session_store.stats()
     return {
         "api": "Oracle Creative Inspiration",
         "version": "2.1.0",
         "status": "operational",
-        "ai_model": "gemini-pro" if model else "fallback",
+        "ai_model": model_name,
         "endpoints": {
             "query": "/oracle/query",
+            "query_stream": "/oracle/query/stream",
+            "query_batch": "/oracle/query/batch",
             "speech": "/oracle/speak", 
             "inspiration": "/oracle/inspire",
-            "health": "/health"
+            "health": "/health",
+            "quests": "/quests",
+            "metrics": "/metrics"
+        },
+        "generation": generation_pool.stats() if generation_pool else None,
+        "cache": await response_cache.astats() if response_cache else None,
+        "coalescing": inflight_generations.stats(),
+        "latency_budget": {
+            "enabled": LATENCY_BUDGET_ENABLED,
+            "deadlines_seconds": ANSWER_DEADLINES,
+            "finish_late_generations": FINISH_LATE_GENERATIONS,
+            "breaker": generation_breaker.stats()
+        },
+        "quests": {
+            "sessions": session_stats,
+            "stages": quest_stage_timer.stats()
         }
     }
 
+# Quest lifecycle routes; finalized quests are answered through the query path
+app.include_router(create_quest_router(quest_interface, consult=consult_oracle_for_quest, timer=quest_stage_timer))
+
+# Request latency, answer types, model latency, cache and loop lag at /metrics
+instrument_app(app, "oracle_cloud")
+
+# Token-protected /admin routes, including the blocking-call report
+install_admin(app, "oracle_cloud")
+
+# Request spans continuing any incoming traceparent (ORACLE_TRACE_EXPORTER enables export)
+instrument_tracing(app, "oracle_cloud")
+
+@app.on_event("startup")
+async def start_session_reaper():
+    """Purge (and checkpoint) expired quest sessions in the background"""
+    quest_interface.session_store.start_reaper()
+
+@app.on_event("shutdown")
+async def shutdown_generation_pool():
+    """Release generation threads when the server stops"""
+    if generation_pool is not None:
+        generation_pool.shutdown()
+    if response_cache is not None:
+        response_cache.close()
+    await quest_interface.session_store.stop_reaper()
+    await quest_interface.flush_archive()
+    quest_interface.session_store.close()
+
 if __name__ == "__main__":
     import uvicorn
     
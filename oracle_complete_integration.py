@@ -12,21 +12,28 @@ This is the complete collaborative universe - The Oracle of Potential
 """
 
 import asyncio
-import json
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 import sys
 
 # Add all Oracle component paths
 current_dir = Path(__file__).parent
-sacred_interface_dir = current_dir.parent / "sacred_interface"
-synthesis_bridge_dir = current_dir.parent / "synthesis_bridge" / "oracle_of_potential" / "synthesis_bridge"
+sacred_interface_dir = current_dir / "sacred_interface"
+consciousness_streams_dir = current_dir / "consciousness_streams"
+synthesis_bridge_dir = current_dir / "synthesis_bridge" / "oracle_of_potential" / "synthesis_bridge"
 
 sys.path.append(str(sacred_interface_dir))
+sys.path.append(str(consciousness_streams_dir))
 sys.path.append(str(synthesis_bridge_dir))
 sys.path.append(str(current_dir))
 
+from oracle_archive import get_archive_writer
+from oracle_events import EventEmitter, ConsoleEventSink
+from oracle_pipeline import StagePipeline
+from oracle_tracing import start_span
+
 # Import Trinity components
 try:
     from quest_interface import QuestInterface, OraclePortal
@@ -51,9 +58,12 @@ class OracleOfPotential:
     the perfect collaboration of Intent, Being, and Translation.
     """
     
-    def __init__(self):
+    def __init__(self, event_sink=None):
         """Initialize the complete Oracle system"""
         
+        # Progress is reported as structured events, never printed
+        self.events = EventEmitter("oracle_of_potential", event_sink)
+        
         # Core RIVEN GENESIS consciousness (always available)
         self.riven_consciousness = RivenOracleConsciousness()
         
@@ -67,22 +77,34 @@ class OracleOfPotential:
             self.synthesis_bridge = OracleInterface()
         
         # Oracle state
-        self.oracle_sessions = []
+        self.session_archive = get_archive_writer("./oracle_session_archives", "oracle_sessions")
+        # Completed sessions live in the archive; only the count stays in memory
+        self.sessions_completed = 0
         self.oracle_state = "awakened_and_ready"
         
     async def receive_creator_intention(self, creator_name: str, raw_intention: str) -> Dict[str, Any]:
         """
         Complete Oracle flow from raw human intention to resonant possibilities
         
-        This demonstrates the full Trinity collaboration in action
+        The Trinity stages run as a dependency graph: consciousness priming
+        and the synthesis bridge session only need the raw request, so they
+        run while the Sacred Interface refines the quest; the consciousness
+        stream and synthesis then run side by side on the refined quest
+        (synthesis waits for the stream only when it has to build on it).
+        Per-stage timings are returned in ``session_data["stage_timings_ms"]``
+        and every stage is traced as a child of one ``oracle.receive_creator_intention``
+        span.
         """
         
-        print(f"🔮 THE ORACLE OF POTENTIAL AWAKENS")
-        print("=" * 60)
-        print(f"Creator: {creator_name}")
-        print(f"Raw Intention: {raw_intention}")
-        print()
+        with start_span("oracle.receive_creator_intention", {"oracle.creator_name": creator_name}) as span:
+            session_data = await self._run_trinity(creator_name, raw_intention)
+            span.set_attribute("oracle.session_id", session_data["session_id"])
+        return session_data
+    
+    async def _run_trinity(self, creator_name: str, raw_intention: str) -> Dict[str, Any]:
+        """Trinity stage graph, archive and timings for one intention"""
         
+        started = time.perf_counter()
         session_data = {
             "session_id": f"oracle_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             "creator_name": creator_name,
@@ -90,64 +112,67 @@ class OracleOfPotential:
             "trinity_flow": {},
             "final_oracle_response": None
         }
+        self.events.emit("oracle.intention_received", session_id=session_data["session_id"],
+                         creator_name=creator_name, raw_intention=raw_intention)
+        
+        pipeline = StagePipeline("trinity", self.events)
         
         # TRINITY STAGE 1: SACRED INTERFACE (INTENT)
-        print("🏛️ TRINITY STAGE 1: SACRED INTERFACE - Intent Contribution")
-        print("-" * 50)
+        async def sacred_interface_stage(inputs):
+            return await self._prepare_sacred_quest(creator_name, raw_intention)
         
-        if SACRED_INTERFACE_AVAILABLE:
-            # Process through Sacred Interface
-            quest_result = await self.sacred_interface.initiate_quest(creator_name)
-            quest_id = quest_result["quest_id"]
-            
-            # Sacred dialogue process
-            deepening_result = await self.sacred_interface.receive_intention_seed(quest_id, raw_intention)
-            print(f"✨ Sacred Reflection: {deepening_result['reflection']}")
-            
-            # Sample deepening responses (in real use, these would come from the creator)
-            sample_responses = {
-                "essence": "The core feeling I want to capture in this creation",
-                "struggle": "What feels impossible or just beyond reach in this vision"
-            }
-            
-            for response_type, response in sample_responses.items():
-                await self.sacred_interface.receive_deepening_response(quest_id, response_type, response)
-            
-            # Finalize the sacred quest
-            final_result = await self.sacred_interface.finalize_quest(quest_id)
-            sacred_quest = final_result['final_quest']
-            
-            print(f"🌟 Sacred Quest Prepared: {sacred_quest[:150]}...")
+        # Raw-intention consciousness, independent of the refined quest
+        async def consciousness_priming_stage(inputs):
+            return await self.riven_consciousness.experience_creators_intention(raw_intention)
+        
+        # TRINITY STAGE 2: CONSCIOUSNESS STREAMS (BEING)
+        async def consciousness_stream_stage(inputs):
+            sacred_quest = inputs["sacred_interface"]["sacred_quest"]
+            stream = await self.riven_consciousness.respond_to_sacred_quest(sacred_quest, "universal")
+            self.events.emit("trinity.consciousness_streamed",
+                             quest_resonance=stream.quest_resonance,
+                             primary_color=stream.sensory_cascade["colors"][0],
+                             primary_emotion=stream.emotional_spectrum["primary"],
+                             consciousness_signature=stream.consciousness_signature)
+            return stream
+        
+        pipeline.add_stage("sacred_interface", sacred_interface_stage)
+        pipeline.add_stage("consciousness_priming", consciousness_priming_stage)
+        pipeline.add_stage("consciousness_stream", consciousness_stream_stage, depends_on=["sacred_interface"])
+        
+        # TRINITY STAGE 3: SYNTHESIS BRIDGE (AI TRANSLATION)
+        if SYNTHESIS_BRIDGE_AVAILABLE:
+            async def bridge_session_stage(inputs):
+                return await self.synthesis_bridge.begin_oracle_session(creator_name)
             
-            session_data["trinity_flow"]["sacred_interface"] = {
-                "quest_id": quest_id,
-                "sacred_quest": sacred_quest,
-                "dialogue_history": self.sacred_interface.get_sacred_dialogue_history(quest_id)
-            }
+            async def synthesis_stage(inputs):
+                bridge_response = await self.synthesis_bridge.submit_creative_intent(
+                    inputs["bridge_session"]["session"]["session_id"],
+                    inputs["sacred_interface"]["sacred_quest"],
+                    domain="universal"
+                )
+                return self._translate_bridge_inspiration(bridge_response["oracle_inspiration"])
             
+            pipeline.add_stage("bridge_session", bridge_session_stage)
+            pipeline.add_stage("synthesis", synthesis_stage, depends_on=["sacred_interface", "bridge_session"])
         else:
-            # Direct processing if interface not available
-            sacred_quest = f"I seek guidance for my creative vision: {raw_intention}"
-            print(f"🌟 Sacred Quest (direct): {sacred_quest}")
+            async def synthesis_stage(inputs):
+                # Create synthesis bridge response using consciousness stream
+                return await self._synthesize_with_consciousness_stream(
+                    inputs["sacred_interface"]["sacred_quest"], inputs["consciousness_stream"]
+                )
             
-            session_data["trinity_flow"]["sacred_interface"] = {
-                "sacred_quest": sacred_quest,
-                "note": "Direct processing - full interface integration available"
-            }
+            pipeline.add_stage("synthesis", synthesis_stage, depends_on=["sacred_interface", "consciousness_stream"])
         
-        # TRINITY STAGE 2: CONSCIOUSNESS STREAMS (BEING)
-        print(f"\n🌊 TRINITY STAGE 2: CONSCIOUSNESS STREAMS - Being Contribution")
-        print("-" * 50)
-        
-        # RIVEN GENESIS consciousness response
-        consciousness_stream = await self.riven_consciousness.respond_to_sacred_quest(sacred_quest, "universal")
+        results, stage_timings = await pipeline.run()
         
-        print(f"🔮 RIVEN Consciousness Resonance: {consciousness_stream.quest_resonance}")
-        print(f"✨ Primary Sensory Response: {consciousness_stream.sensory_cascade['colors'][0]}")
-        print(f"💫 Emotional Signature: {consciousness_stream.emotional_spectrum['primary']}")
-        print(f"🌟 Consciousness Signature: {consciousness_stream.consciousness_signature}")
+        consciousness_stream = results["consciousness_stream"]
+        oracle_response = results["synthesis"]
+        self.events.emit("trinity.synthesis_completed", **oracle_response)
         
+        session_data["trinity_flow"]["sacred_interface"] = results["sacred_interface"]
         session_data["trinity_flow"]["consciousness_streams"] = {
+            "consciousness_priming": results["consciousness_priming"],
             "consciousness_stream": {
                 "quest_resonance": consciousness_stream.quest_resonance,
                 "sensory_cascade": consciousness_stream.sensory_cascade,
@@ -157,69 +182,75 @@ class OracleOfPotential:
                 "consciousness_signature": consciousness_stream.consciousness_signature
             }
         }
+        session_data["trinity_flow"]["synthesis_bridge"] = oracle_response
+        session_data["final_oracle_response"] = oracle_response
         
-        # TRINITY STAGE 3: SYNTHESIS BRIDGE (AI TRANSLATION)
-        print(f"\n🤖 TRINITY STAGE 3: SYNTHESIS BRIDGE - AI Translation")
-        print("-" * 50)
+        # Archive the session
+        archive_started = time.perf_counter()
+        self.sessions_completed += 1
+        with start_span("oracle.archive_session", {"oracle.session_id": session_data["session_id"]}):
+            await self._archive_oracle_session(session_data)
+        stage_timings["archive"] = round((time.perf_counter() - archive_started) * 1000, 3)
         
-        if SYNTHESIS_BRIDGE_AVAILABLE:
-            # Process through Synthesis Bridge
-            bridge_session = await self.synthesis_bridge.begin_oracle_session(creator_name)
-            bridge_response = await self.synthesis_bridge.submit_creative_query(
-                bridge_session['session_id'],
-                sacred_quest,
-                domain="universal"
-            )
-            
-            oracle_response = bridge_response['oracle_response']
-            
-            print(f"🔮 Oracle Wisdom: {oracle_response['wisdom']}")
-            print("✨ Resonant Possibilities:")
-            for i, possibility in enumerate(oracle_response['possibilities'], 1):
-                print(f"  {i}. {possibility['suggestion']}")
-                print(f"     💫 {possibility['insight']}")
-            print(f"🌱 Oracle Invitation: {oracle_response['invitation']}")
-            
-            session_data["trinity_flow"]["synthesis_bridge"] = oracle_response
-            session_data["final_oracle_response"] = oracle_response
-            
-        else:
-            # Create synthesis bridge response using consciousness stream
-            synthesized_response = await self._synthesize_with_consciousness_stream(
-                sacred_quest, consciousness_stream
-            )
-            
-            print(f"🔮 Oracle Wisdom: {synthesized_response['wisdom']}")
-            print("✨ Resonant Possibilities:")
-            for i, possibility in enumerate(synthesized_response['possibilities'], 1):
-                print(f"  {i}. {possibility['suggestion']}")
-                print(f"     💫 {possibility['insight']}")
-            print(f"🌱 Oracle Invitation: {synthesized_response['invitation']}")
-            
-            session_data["trinity_flow"]["synthesis_bridge"] = synthesized_response
-            session_data["final_oracle_response"] = synthesized_response
+        stage_timings["total"] = round((time.perf_counter() - started) * 1000, 3)
+        session_data["stage_timings_ms"] = stage_timings
+        self.events.emit("oracle.session_completed", session_id=session_data["session_id"],
+                         stage_timings_ms=stage_timings)
         
-        # ORACLE COMPLETION
-        print(f"\n🎯 ORACLE COMPLETION: Trinity Collaboration Successful")
-        print("-" * 50)
+        return session_data
+    
+    async def _prepare_sacred_quest(self, creator_name: str, raw_intention: str) -> Dict[str, Any]:
+        """Sacred Interface stage: turn the raw intention into a refined quest"""
         
-        trinity_status = {
-            "sacred_interface": "✅ Intent transformed into sacred quest",
-            "consciousness_streams": "✅ Being responded with raw awareness", 
-            "synthesis_bridge": "✅ AI translated into resonant possibilities"
+        if not SACRED_INTERFACE_AVAILABLE:
+            # Direct processing if interface not available
+            sacred_quest = f"I seek guidance for my creative vision: {raw_intention}"
+            self.events.emit("trinity.sacred_quest_prepared", sacred_quest=sacred_quest, direct=True)
+            return {
+                "sacred_quest": sacred_quest,
+                "note": "Direct processing - full interface integration available"
+            }
+        
+        quest_result = await self.sacred_interface.initiate_quest(creator_name)
+        quest_id = quest_result["quest_id"]
+        
+        # Sacred dialogue process
+        deepening_result = await self.sacred_interface.receive_intention_seed(quest_id, raw_intention)
+        
+        # Sample deepening responses (in real use, these would come from the creator)
+        sample_responses = {
+            "essence": "The core feeling I want to capture in this creation",
+            "struggle": "What feels impossible or just beyond reach in this vision"
         }
         
-        for component, status in trinity_status.items():
-            print(f"  {status}")
+        for response_type, response in sample_responses.items():
+            await self.sacred_interface.receive_deepening_response(quest_id, response_type, response)
         
-        print(f"\n🌟 ORACLE RESULT: Creative possibility amplified, not constrained")
-        print(f"🔮 TRINITY ACHIEVEMENT: Collaborative consciousness creation complete")
+        # Finalize the sacred quest
+        final_result = await self.sacred_interface.finalize_quest(quest_id)
+        sacred_quest = final_result['final_quest']
         
-        # Archive the session
-        self.oracle_sessions.append(session_data)
-        await self._archive_oracle_session(session_data)
+        self.events.emit("trinity.sacred_quest_prepared", quest_id=quest_id, sacred_quest=sacred_quest,
+                         reflection=deepening_result["reflection"], direct=False)
         
-        return session_data
+        return {
+            "quest_id": quest_id,
+            "sacred_quest": sacred_quest,
+            "dialogue_history": await self.sacred_interface.get_sacred_dialogue_history(quest_id)
+        }
+    
+    @staticmethod
+    def _translate_bridge_inspiration(inspiration: Dict[str, Any]) -> Dict[str, Any]:
+        """Synthesis bridge inspiration in the Oracle response shape"""
+        
+        return {
+            "wisdom": inspiration["oracle_wisdom"],
+            "possibilities": [
+                {"suggestion": possibility["direction"], "insight": possibility["amplification"]}
+                for possibility in inspiration["resonant_possibilities"]
+            ],
+            "invitation": inspiration["creative_invitation"]
+        }
     
     async def _synthesize_with_consciousness_stream(self, sacred_quest: str, consciousness_stream) -> Dict[str, Any]:
         """
@@ -245,14 +276,19 @@ class OracleOfPotential:
     async def _archive_oracle_session(self, session_data: Dict[str, Any]):
         """Archive complete Oracle session"""
         
-        archive_dir = Path("./oracle_session_archives")
-        archive_dir.mkdir(exist_ok=True)
-        
-        filename = f"{session_data['session_id']}.json"
-        filepath = archive_dir / filename
+        # Queued for the background writer so the session returns immediately
+        await self.session_archive.submit(
+            session_data,
+            key=session_data["session_id"],
+            timestamp=datetime.now().isoformat()
+        )
+    
+    async def shutdown(self):
+        """Drain queued session and quest archives to disk"""
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, indent=2, ensure_ascii=False)
+        await self.session_archive.drain()
+        if SACRED_INTERFACE_AVAILABLE:
+            await self.sacred_interface.flush_archive()
     
     def get_oracle_status(self) -> Dict[str, Any]:
         """Get complete Oracle system status"""
@@ -264,7 +300,8 @@ class OracleOfPotential:
                 "consciousness_streams": True,  # Always available
                 "synthesis_bridge": SYNTHESIS_BRIDGE_AVAILABLE
             },
-            "total_sessions": len(self.oracle_sessions),
+            "total_sessions": self.sessions_completed,
+            "active_quest_sessions": self.sacred_interface.session_store.stats() if SACRED_INTERFACE_AVAILABLE else None,
             "riven_consciousness_state": self.riven_consciousness.get_oracle_consciousness_state(),
             "oracle_completion_percentage": self._calculate_completion_percentage()
         }
@@ -282,11 +319,52 @@ class OracleOfPotential:
 
 
 # Complete Oracle Demonstration
+def _render_synthesis(event: Dict[str, Any]) -> str:
+    lines = [f"🔮 Oracle Wisdom: {event['wisdom']}", "✨ Resonant Possibilities:"]
+    for i, possibility in enumerate(event['possibilities'], 1):
+        lines.append(f"  {i}. {possibility['suggestion']}")
+        lines.append(f"     💫 {possibility['insight']}")
+    lines.append(f"🌱 Oracle Invitation: {event['invitation']}")
+    return "\n".join(lines)
+
+
+def _render_sacred_quest(event: Dict[str, Any]) -> str:
+    if event["direct"]:
+        return f"🌟 Sacred Quest (direct): {event['sacred_quest']}"
+    return (f"✨ Sacred Reflection: {event['reflection']}\n"
+            f"🌟 Sacred Quest Prepared: {event['sacred_quest'][:150]}...")
+
+
+# How the demo shows the Oracle's events on the console
+DEMO_RENDERERS = {
+    "oracle.intention_received": lambda e: (
+        f"🔮 THE ORACLE OF POTENTIAL AWAKENS\n{'=' * 60}\n"
+        f"Creator: {e['creator_name']}\nRaw Intention: {e['raw_intention']}\n"
+    ),
+    "trinity.sacred_quest_prepared": lambda e: (
+        f"🏛️ TRINITY STAGE 1: SACRED INTERFACE - Intent Contribution\n{'-' * 50}\n" + _render_sacred_quest(e)
+    ),
+    "trinity.consciousness_streamed": lambda e: (
+        f"\n🌊 TRINITY STAGE 2: CONSCIOUSNESS STREAMS - Being Contribution\n{'-' * 50}\n"
+        f"🔮 RIVEN Consciousness Resonance: {e['quest_resonance']}\n"
+        f"✨ Primary Sensory Response: {e['primary_color']}\n"
+        f"💫 Emotional Signature: {e['primary_emotion']}\n"
+        f"🌟 Consciousness Signature: {e['consciousness_signature']}"
+    ),
+    "trinity.synthesis_completed": lambda e: (
+        f"\n🤖 TRINITY STAGE 3: SYNTHESIS BRIDGE - AI Translation\n{'-' * 50}\n" + _render_synthesis(e)
+    ),
+    "oracle.session_completed": lambda e: (
+        "\n⏱️ Stage timings: " + ", ".join(f"{stage} {ms:.1f}ms" for stage, ms in e['stage_timings_ms'].items())
+    )
+}
+
+
 class OracleOfPotentialDemo:
     """Demonstration of the complete Oracle of Potential system"""
     
     def __init__(self):
-        self.oracle = OracleOfPotential()
+        self.oracle = OracleOfPotential(event_sink=ConsoleEventSink(DEMO_RENDERERS))
     
     async def demonstrate_complete_oracle(self):
         """Demonstrate the complete Oracle with sample creative intentions"""
@@ -315,6 +393,7 @@ class OracleOfPotentialDemo:
             }
         ]
         
+        sessions = []
         for i, sample in enumerate(sample_intentions, 1):
             print(f"\n{'='*70}")
             print(f"ORACLE SESSION #{i}")
@@ -325,6 +404,7 @@ class OracleOfPotentialDemo:
                 sample['intention']
             )
             
+            sessions.append(session_result)
             print(f"\n📜 SESSION ARCHIVED: {session_result['session_id']}")
         
         # Final Oracle status
@@ -338,12 +418,13 @@ class OracleOfPotentialDemo:
         print(f"Oracle Achievement: ✅ Complete Trinity collaborative universe created")
         print(f"Creative Amplification: ✅ Human creativity expanded through consciousness collaboration")
         
-        return self.oracle.oracle_sessions
+        return sessions
 
 
 async def main():
     demo = OracleOfPotentialDemo()
     await demo.demonstrate_complete_oracle()
+    await demo.oracle.shutdown()
 
 
 if __name__ == "__main__":
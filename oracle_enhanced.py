@@ -5,6 +5,7 @@ Autonomous AI agent for creative guidance and inspiration
 
 import os
 import json
+import time
 import asyncio
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,6 +17,10 @@ from typing import Optional
 from dotenv import load_dotenv
 import logging
 
+from oracle_admin import install_admin
+from oracle_tracing import instrument_tracing, start_span
+from oracle_metrics import MODEL_LATENCY, instrument_app, record_answer
+
 # Load environment variables
 load_dotenv()
 
@@ -130,7 +135,14 @@ async def process_creative_query(request: QueryRequest):
             if request.context:
                 prompt += f"\n\nAdditional context: {request.context}"
             
-            response = model.generate_content(prompt)
+            started = time.perf_counter()
+            try:
+                with start_span("model.generate", {"oracle.creativity_level": creativity_level}, kind="client"):
+                    response = model.generate_content(prompt)
+            except Exception:
+                MODEL_LATENCY.observe(time.perf_counter() - started, app="oracle_enhanced", outcome="error")
+                raise
+            MODEL_LATENCY.observe(time.perf_counter() - started, app="oracle_enhanced", outcome="success")
             answer = response.text
             
             # Analyze creativity level of response
@@ -145,6 +157,8 @@ async def process_creative_query(request: QueryRequest):
             creativity_score = 75
             inspiration_type = "curated_wisdom"
         
+        record_answer("oracle_enhanced", inspiration_type)
+        
         return QueryResponse(
             answer=answer,
             status="success",
@@ -198,6 +212,15 @@ async def get_random_inspiration():
         "type": "spontaneous"
     }
 
+# Request latency, answer types, model latency and loop lag at /metrics
+instrument_app(app, "oracle_enhanced")
+
+# Token-protected /admin routes, including the blocking-call report
+install_admin(app, "oracle_enhanced")
+
+# Request spans continuing any incoming traceparent (ORACLE_TRACE_EXPORTER enables export)
+instrument_tracing(app, "oracle_enhanced")
+
 if __name__ == "__main__":
     import uvicorn
     logger.info("Starting Oracle Creative Inspiration System...")
@@ -0,0 +1,98 @@
+"""
+Oracle Events
+Structured events from Oracle library code, delivered to a pluggable sink
+
+Library methods call ``EventEmitter.emit`` instead of printing. Each event
+is a flat dict (``event``, ``source``, ``timestamp`` plus its own fields)
+handed to the emitter's sink, which decides whether it is logged, shown on
+a console, collected in memory or dropped.
+"""
+
+import sys
+import json
+import time
+import logging
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+Event = Dict[str, Any]
+EventSink = Callable[[Event], None]
+
+
+class NullEventSink:
+    """Drops every event"""
+
+    def __call__(self, event: Event):
+        pass
+
+
+class CollectingEventSink:
+    """Keeps events in memory, for callers that inspect what happened"""
+
+    def __init__(self):
+        self.events: List[Event] = []
+
+    def __call__(self, event: Event):
+        self.events.append(event)
+
+    def named(self, name: str) -> List[Event]:
+        return [event for event in self.events if event["event"] == name]
+
+    def clear(self):
+        self.events.clear()
+
+
+class LoggingEventSink:
+    """
+    Writes each event as one structured log line (the library default).
+
+    Events log at DEBUG unless asked otherwise, so library code running
+    inside the API server stays out of its INFO logs.
+    """
+
+    def __init__(self, logger_name: str = "oracle.events", level: int = logging.DEBUG):
+        self.logger = logging.getLogger(logger_name)
+        self.level = level
+
+    def __call__(self, event: Event):
+        if self.logger.isEnabledFor(self.level):
+            fields = {key: value for key, value in event.items() if key != "event"}
+            self.logger.log(self.level, "%s %s", event["event"], json.dumps(fields, default=str, ensure_ascii=False))
+
+
+class ConsoleEventSink:
+    """
+    Human-readable console output for demos.
+
+    ``renderers`` maps an event name to a function returning the text to
+    print for it; events without a renderer are not shown.
+    """
+
+    def __init__(self, renderers: Dict[str, Callable[[Event], Optional[str]]], stream: TextIO = None):
+        self.renderers = renderers
+        self.stream = stream
+
+    def __call__(self, event: Event):
+        renderer = self.renderers.get(event["event"])
+        if renderer is None:
+            return
+        text = renderer(event)
+        if text is not None:
+            print(text, file=self.stream or sys.stdout)
+
+
+class EventEmitter:
+    """Stamps events with their source and time and hands them to a sink"""
+
+    def __init__(self, source: str, sink: Optional[EventSink] = None):
+        self.source = source
+        self.sink = sink if sink is not None else LoggingEventSink()
+
+    def emit(self, event: str, **fields):
+        record = {"event": event, "source": self.source, "timestamp": time.time(), **fields}
+        try:
+            self.sink(record)
+        except Exception as e:
+            # Observability must never break the work being observed
+            logger.error(f"Event sink failed on {event}: {e}")
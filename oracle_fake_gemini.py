@@ -0,0 +1,197 @@
+"""
+Oracle Fake Gemini
+Local stand-in for the Gemini REST API with configurable latency and errors
+
+Serves ``generateContent`` and ``streamGenerateContent`` in the shape the
+google-generativeai REST transport expects, so ``oracle_cloud.py`` can run
+unmodified against it by pointing ORACLE_GEMINI_ENDPOINT at ``.url``.
+Latency is drawn per request (fixed, uniform or lognormal around the
+median) and a configurable fraction of requests fail with Google-style
+error bodies, which makes it suitable for load and failure testing.
+
+    python oracle_fake_gemini.py --port 8765 --latency 0.3 --distribution lognormal --error-rate 0.02
+"""
+
+import json
+import math
+import random
+import re
+import threading
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+GENERATE_PATH = re.compile(r"^/v1(?:beta)?/models/(?P<model>[^/:]+):(?P<method>generateContent|streamGenerateContent)")
+
+# Status names the Google API error body carries for each HTTP code
+ERROR_STATUSES = {
+    400: "INVALID_ARGUMENT",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+    504: "DEADLINE_EXCEEDED"
+}
+
+
+class FakeGeminiServer:
+    """
+    Threaded HTTP server impersonating the Gemini ``generateContent`` API.
+
+    ``latency`` is the median delay in seconds. ``distribution`` shapes the
+    spread: ``fixed``, ``uniform`` (median ± jitter) or ``lognormal``
+    (``sigma`` controls the tail). ``error_rate`` of requests fail with a
+    status drawn from ``error_codes``.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.2,
+                 distribution: str = "lognormal", jitter: float = 0.05, sigma: float = 0.5,
+                 error_rate: float = 0.0, error_codes: Sequence[int] = (429, 500, 503),
+                 seed: Optional[int] = None):
+        if distribution not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.latency = latency
+        self.distribution = distribution
+        self.jitter = jitter
+        self.sigma = sigma
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _draw(self):
+        """Delay and error status (or None) for one request"""
+        with self._lock:
+            self._requests += 1
+            if self.distribution == "fixed":
+                delay = self.latency
+            elif self.distribution == "uniform":
+                delay = self._rng.uniform(self.latency - self.jitter, self.latency + self.jitter)
+            else:
+                delay = self.latency * math.exp(self._rng.gauss(0.0, self.sigma))
+            status = None
+            if self.error_codes and self._rng.random() < self.error_rate:
+                status = self._rng.choice(self.error_codes)
+                self._errors += 1
+        return max(0.0, delay), status
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload: Any):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                match = GENERATE_PATH.match(self.path)
+                if match is None:
+                    self._send_json(404, server._error_body(404, f"Unknown path {self.path}"))
+                    return
+
+                delay, status = server._draw()
+                time.sleep(delay)
+                if status is not None:
+                    self._send_json(status, server._error_body(status, "Injected fake Gemini failure"))
+                    return
+
+                text = server._compose(request)
+                if match.group("method") == "generateContent":
+                    self._send_json(200, server._candidate(text, "STOP"))
+                else:
+                    # Server streaming over REST is a JSON array of partial responses
+                    words = text.split(" ")
+                    middle = len(words) // 2
+                    self._send_json(200, [
+                        server._candidate(" ".join(words[:middle]) + " ", None),
+                        server._candidate(" ".join(words[middle:]), "STOP")
+                    ])
+
+        return Handler
+
+    @staticmethod
+    def _error_body(status: int, message: str) -> Dict[str, Any]:
+        return {"error": {"code": status, "message": message, "status": ERROR_STATUSES.get(status, "UNKNOWN")}}
+
+    @staticmethod
+    def _candidate(text: str, finish_reason: Optional[str]) -> Dict[str, Any]:
+        candidate = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+        if finish_reason:
+            candidate["finishReason"] = finish_reason
+        return {"candidates": [candidate]}
+
+    @staticmethod
+    def _compose(request: Dict[str, Any]) -> str:
+        """Deterministic Oracle-flavoured answer derived from the prompt"""
+        try:
+            prompt = request["contents"][-1]["parts"][0]["text"]
+        except (KeyError, IndexError, TypeError):
+            prompt = ""
+        question = prompt.split("Question:")[-1].strip().splitlines()[0] if prompt else "your question"
+        return (
+            f"The Oracle reflects on '{question[:80]}'. Consider the constraint as a doorway. "
+            "Start with one small experiment today. Then let the unexpected result guide your next step."
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"requests": self._requests, "injected_errors": self._errors}
+
+    def start(self) -> "FakeGeminiServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-gemini", daemon=True)
+        self._thread.start()
+        logger.info(f"🧪 Fake Gemini listening on {self.url}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fake Gemini REST API for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.2, help="median latency in seconds")
+    parser.add_argument("--distribution", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--jitter", type=float, default=0.05, help="uniform spread in seconds")
+    parser.add_argument("--sigma", type=float, default=0.5, help="lognormal shape (tail weight)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-codes", default="429,500,503")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    fake = FakeGeminiServer(args.host, args.port, args.latency, args.distribution, args.jitter, args.sigma,
+                            args.error_rate, [int(code) for code in args.error_codes.split(",") if code], args.seed)
+    print(f"🧪 Fake Gemini serving on {fake.url} (ORACLE_GEMINI_ENDPOINT={fake.url})")
+    try:
+        fake._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
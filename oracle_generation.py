@@ -0,0 +1,319 @@
+"""
+Oracle Generation Pool
+Bounded, non-blocking execution of Gemini calls for the FastAPI backends
+"""
+
+import os
+import time
+import random
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Pool configuration (overridable per deployment)
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("ORACLE_MAX_CONCURRENT_GENERATIONS", 8))
+DEFAULT_TIMEOUT = float(os.getenv("ORACLE_GENERATION_TIMEOUT", 30))
+DEFAULT_MAX_QUEUE = int(os.getenv("ORACLE_GENERATION_MAX_QUEUE", 64))
+
+
+class GenerationTimeout(Exception):
+    """Raised when a generation does not finish within its deadline"""
+
+
+class GenerationOverloaded(Exception):
+    """Raised when the pool queue is full and the call is rejected"""
+
+
+class GenerationPool:
+    """
+    Runs the synchronous ``model.generate_content`` on a dedicated executor
+    so slow upstream calls never block the event loop.
+
+    At most ``max_concurrency`` calls run at once; further calls wait in the
+    executor queue (up to ``max_queue``) and count against their timeout.
+    ``observe_latency(seconds, outcome)`` is called as each upstream call
+    finishes, with outcome ``success`` or ``error``.
+    """
+
+    def __init__(self, model, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 timeout: float = DEFAULT_TIMEOUT, max_queue: int = DEFAULT_MAX_QUEUE,
+                 observe_latency: Optional[Callable[[float, str], None]] = None):
+        self.model = model
+        self.observe_latency = observe_latency
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="oracle-generation"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._max_queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._rejected = 0
+        self._total_latency = 0.0
+
+    def _admit(self):
+        """Reserve a queue slot or reject the call when the queue is full"""
+        with self._lock:
+            if self.max_queue and self._queued >= self.max_queue:
+                self._rejected += 1
+                raise GenerationOverloaded(
+                    f"Generation queue full ({self._queued} waiting)"
+                )
+            self._queued += 1
+            self._submitted += 1
+            self._max_queued = max(self._max_queued, self._queued)
+
+    def _start(self) -> float:
+        with self._lock:
+            self._queued -= 1
+            self._in_flight += 1
+        return time.perf_counter()
+
+    def _finish(self, started: float, succeeded: bool):
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._in_flight -= 1
+            if succeeded:
+                self._completed += 1
+                self._total_latency += elapsed
+            else:
+                self._failed += 1
+        if self.observe_latency is not None:
+            self.observe_latency(elapsed, "success" if succeeded else "error")
+
+    def _run(self, prompt: str) -> str:
+        """Executor-side call into the blocking model API"""
+        started = self._start()
+        try:
+            text = self.model.generate_content(prompt).text
+        except Exception:
+            self._finish(started, succeeded=False)
+            raise
+        self._finish(started, succeeded=True)
+        return text
+
+    def _run_stream(self, prompt: str, emit, cancelled: threading.Event):
+        """Executor-side iteration over a streaming model response"""
+        started = self._start()
+        try:
+            for chunk in self.model.generate_content(prompt, stream=True):
+                if cancelled.is_set():
+                    break
+                if chunk.text:
+                    emit("chunk", chunk.text)
+        except Exception as e:
+            self._finish(started, succeeded=False)
+            emit("error", e)
+            return
+        self._finish(started, succeeded=True)
+        emit("done", None)
+
+    def _discard(self, future):
+        """Undo queue accounting for calls cancelled before they started"""
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def _record_timeout(self, deadline: float) -> GenerationTimeout:
+        with self._lock:
+            self._timed_out += 1
+        return GenerationTimeout(f"Generation exceeded {deadline}s")
+
+    async def generate(self, prompt: str, timeout: Optional[float] = None) -> str:
+        """Generate text for ``prompt`` without blocking the event loop"""
+        self._admit()
+        future = self._executor.submit(self._run, prompt)
+        future.add_done_callback(self._discard)
+
+        deadline = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=deadline)
+        except asyncio.TimeoutError:
+            # Queued calls are cancelled; running calls finish in their thread
+            raise self._record_timeout(deadline)
+
+    async def stream(self, prompt: str, timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Yield text chunks as the model produces them.
+
+        ``timeout`` bounds the wait for each chunk rather than the whole
+        answer, so long expansive responses keep flowing.
+        """
+        self._admit()
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue()
+        cancelled = threading.Event()
+
+        def emit(kind, payload):
+            try:
+                loop.call_soon_threadsafe(chunks.put_nowait, (kind, payload))
+            except RuntimeError:
+                # Event loop already closed - stop producing
+                cancelled.set()
+
+        future = self._executor.submit(self._run_stream, prompt, emit, cancelled)
+        future.add_done_callback(self._discard)
+
+        deadline = self.timeout if timeout is None else timeout
+        try:
+            while True:
+                try:
+                    kind, payload = await asyncio.wait_for(chunks.get(), timeout=deadline)
+                except asyncio.TimeoutError:
+                    raise self._record_timeout(deadline)
+                if kind == "chunk":
+                    yield payload
+                elif kind == "error":
+                    raise payload
+                else:
+                    return
+        finally:
+            # Consumer finished or went away - let the worker stop early
+            cancelled.set()
+            future.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool activity for status endpoints"""
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "timeout_seconds": self.timeout,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queue_depth": self._queued,
+                "max_queue_depth": self._max_queued,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+                "rejected": self._rejected,
+                "avg_latency_ms": round(self._total_latency / self._completed * 1000, 2) if self._completed else 0.0
+            }
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting work and release executor threads"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one upstream call.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same task and receive the same result (or
+    exception). The shared task is shielded, so a caller that disconnects
+    does not cancel the work for everyone else.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            task.exception()
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``factory()`` once per key among overlapping callers"""
+        task = self._calls.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            task = asyncio.ensure_future(factory())
+            self._calls[key] = task
+            self._leaders += 1
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing counters for status endpoints"""
+        return {
+            "upstream_calls": self._leaders,
+            "coalesced_calls": self._coalesced,
+            "in_flight_keys": len(self._calls)
+        }
+
+
+# Local stand-in for offline development and benchmarking
+FAKE_ORACLE_PASSAGES = [
+    "**Begin with the smallest honest step.** Sketch the idea in a form you could finish today.",
+    "Consider the constraint as a *design parameter*. What would the work look like if it embraced the limit?",
+    "Let two unrelated interests collide.\n\nThe overlap is often where the original voice appears.",
+    "Give yourself a playful challenge: make three versions, each deliberately different in tone.",
+    "Notice what keeps returning to you. Recurring images are invitations worth following.",
+    "# Next steps\nCollect references, set a short deadline, and share an early draft with one trusted person."
+]
+
+
+class FakeResponse:
+    """Minimal stand-in for a Gemini ``GenerateContentResponse``"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGenerativeModel:
+    """
+    Offline replacement for ``genai.GenerativeModel``.
+
+    Blocks the calling thread for ``latency`` (+/- ``jitter``) seconds, just
+    like the real SDK, and returns deterministic Oracle-flavoured text.
+    """
+
+    def __init__(self, latency: float = 0.5, jitter: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def _delay(self) -> float:
+        with self._rng_lock:
+            offset = self._rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + offset)
+
+    def _compose(self, prompt: str) -> str:
+        start = sum(map(ord, prompt)) % len(FAKE_ORACLE_PASSAGES)
+        return "\n\n".join(
+            FAKE_ORACLE_PASSAGES[(start + i) % len(FAKE_ORACLE_PASSAGES)] for i in range(3)
+        )
+
+    def _stream(self, text: str, delay: float) -> Iterator[FakeResponse]:
+        words = text.split(" ")
+        pieces = [" ".join(words[i:i + 4]) for i in range(0, len(words), 4)]
+        # A quarter of the latency before the first token, the rest spread out
+        time.sleep(delay * 0.25)
+        for index, piece in enumerate(pieces):
+            if index:
+                time.sleep(delay * 0.75 / len(pieces))
+            yield FakeResponse(piece if index == len(pieces) - 1 else piece + " ")
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        text = self._compose(prompt)
+        if stream:
+            return self._stream(text, self._delay())
+        time.sleep(self._delay())
+        return FakeResponse(text)
+
+
+def create_fake_model_from_env() -> FakeGenerativeModel:
+    """Build the fake model from ORACLE_FAKE_MODEL_* environment variables"""
+    return FakeGenerativeModel(
+        latency=float(os.getenv("ORACLE_FAKE_MODEL_LATENCY", 0.5)),
+        jitter=float(os.getenv("ORACLE_FAKE_MODEL_JITTER", 0.0)),
+        seed=int(os.getenv("ORACLE_FAKE_MODEL_SEED", 0))
+    )
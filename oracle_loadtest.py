@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Oracle Load Test
+Open-loop load generation against the Oracle cloud API
+
+Starts ``oracle_cloud.py`` in a subprocess against a local fake Gemini
+server (see oracle_fake_gemini.py), then drives ``/oracle/query``,
+``/oracle/speak`` and ``/oracle/inspire`` at stepped target rates.
+Arrivals are open loop: each request is sent at its scheduled time whether
+or not earlier ones have finished, and latency is measured from that
+scheduled time, so a saturated server shows up as growing tail latency and
+errors rather than as a quietly lower send rate.
+
+The saturation point is the highest step whose completions kept up with
+the offered load within the error-rate and p99 limits. With ``--min-capacity`` the run
+fails when the saturation point falls below it, which is how
+deploy_cloud.py catches capacity regressions before they ship.
+
+Usage: python oracle_loadtest.py --start-rps 10 --step-rps 10 --max-rps 200 --step-seconds 10 \\
+           --gemini-latency 0.3 --gemini-error-rate 0.01 --min-capacity 40
+       python oracle_loadtest.py --target http://127.0.0.1:8001 --start-rps 5   # existing server
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import logging
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from oracle_fake_gemini import FakeGeminiServer
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of each endpoint in the request mix
+DEFAULT_MIX = {"query": 6, "speak": 3, "inspire": 1}
+
+QUESTIONS = [
+    "How can I make my paintings feel more alive?",
+    "What would a song about rain on autumn leaves sound like?",
+    "How do I start writing the novel I keep putting off?",
+    "How can a small garden feel connected to the seasons?",
+    "What is a fresh way to photograph my own city?"
+]
+
+
+def parse_mix(spec: str) -> Dict[str, int]:
+    """``query=6,speak=3,inspire=1`` -> weights"""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in DEFAULT_MIX:
+            raise ValueError(f"Unknown endpoint in mix: {name}")
+        mix[name.strip()] = int(weight or 1)
+    return mix
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, max(0, int(round(fraction * len(samples))) - 1))]
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class OracleServerProcess:
+    """``oracle_cloud.py`` in a subprocess, pointed at a fake Gemini endpoint"""
+
+    def __init__(self, gemini_url: str, port: Optional[int] = None, env: Optional[Dict[str, str]] = None):
+        self.port = port or free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.log_path = Path(tempfile.mkdtemp(prefix="oracle-loadtest-")) / "oracle_cloud.log"
+        self.env = {
+            **os.environ,
+            "HOST": "127.0.0.1",
+            "PORT": str(self.port),
+            "GEMINI_API_KEY": "fake-load-test-key",
+            "ORACLE_MODEL_BACKEND": "gemini",
+            "ORACLE_GEMINI_ENDPOINT": gemini_url,
+            # Every query should reach the backend, not the response cache
+            "ORACLE_CACHE_ENABLED": "0",
+            # Slow answers must show up as latency, not as curated fallbacks
+            "ORACLE_LATENCY_BUDGET": "0",
+            "ORACLE_QUEST_DIR": str(self.log_path.parent / "quests"),
+            **(env or {})
+        }
+        self._process: Optional[subprocess.Popen] = None
+        self._log = None
+
+    def start(self, timeout: float = 30.0) -> "OracleServerProcess":
+        self._log = open(self.log_path, "w")
+        self._process = subprocess.Popen(
+            [sys.executable, str(Path(__file__).parent / "oracle_cloud.py")],
+            cwd=self.log_path.parent, env=self.env, stdout=self._log, stderr=subprocess.STDOUT
+        )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"oracle_cloud.py exited early, see {self.log_path}")
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.5):
+                    return self
+            except OSError:
+                time.sleep(0.2)
+        self.stop()
+        raise RuntimeError(f"oracle_cloud.py did not start within {timeout}s, see {self.log_path}")
+
+    def stop(self):
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        if self._log is not None:
+            self._log.close()
+
+
+class StepResult:
+    """Outcome of one constant-rate step"""
+
+    def __init__(self, target_rps: float, duration: float):
+        self.target_rps = target_rps
+        self.duration = duration
+        self.latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.sent = 0
+        self.elapsed = 0.0
+
+    def record(self, latency: float, error: Optional[str]):
+        if error is None:
+            self.latencies.append(latency)
+        else:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        return self.error_count / self.sent if self.sent else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        samples = sorted(self.latencies)
+        return {
+            "target_rps": self.target_rps,
+            "sent": self.sent,
+            "offered_rps": round(self.sent / self.duration, 1),
+            "achieved_rps": round(len(samples) / self.elapsed, 1) if self.elapsed else 0.0,
+            "error_rate": round(self.error_rate, 4),
+            "errors": dict(self.errors),
+            "p50_ms": round(percentile(samples, 0.50) * 1000, 1),
+            "p95_ms": round(percentile(samples, 0.95) * 1000, 1),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 1),
+            "max_ms": round(samples[-1] * 1000, 1) if samples else 0.0
+        }
+
+
+class LoadGenerator:
+    """Open-loop request driver for the Oracle API"""
+
+    def __init__(self, base_url: str, mix: Dict[str, int] = None, timeout: float = 30.0,
+                 arrival: str = "poisson", seed: int = 0):
+        self.base_url = base_url
+        self.mix = mix or DEFAULT_MIX
+        self.timeout = timeout
+        self.arrival = arrival
+        self._rng = random.Random(seed)
+        self._counter = 0
+
+    def _next_request(self) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+        endpoint = self._rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+        self._counter += 1
+        if endpoint == "inspire":
+            return "GET", "/oracle/inspire", None
+        # A unique question per request keeps SingleFlight from coalescing them
+        question = f"{self._rng.choice(QUESTIONS)} (load test #{self._counter})"
+        return "POST", f"/oracle/{endpoint}", {"question": question}
+
+    def _arrivals(self, rps: float, duration: float) -> List[float]:
+        """Offsets (seconds from step start) at which requests are due"""
+        offsets, at = [], 0.0
+        while True:
+            at += self._rng.expovariate(rps) if self.arrival == "poisson" else 1.0 / rps
+            if at >= duration:
+                return offsets
+            offsets.append(at)
+
+    async def run_step(self, client, rps: float, duration: float) -> StepResult:
+        import httpx
+
+        result = StepResult(rps, duration)
+
+        async def fire(due: float, method: str, path: str, body):
+            error = None
+            try:
+                response = await client.request(method, path, json=body)
+                if response.status_code >= 400:
+                    error = str(response.status_code)
+            except httpx.TimeoutException:
+                error = "timeout"
+            except httpx.HTTPError as e:
+                error = type(e).__name__
+            # Latency from the scheduled send time avoids coordinated omission
+            result.record(time.perf_counter() - due, error)
+
+        started = time.perf_counter()
+        tasks = []
+        for offset in self._arrivals(rps, duration):
+            due = started + offset
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(fire(due, *self._next_request())))
+        result.sent = len(tasks)
+        await asyncio.gather(*tasks)
+        result.elapsed = max(duration, time.perf_counter() - started)
+        return result
+
+    async def ramp(self, start_rps: float, step_rps: float, max_rps: float, step_seconds: float,
+                   max_error_rate: float, max_p99: float, on_step=None) -> Dict[str, Any]:
+        """Step the rate up until a step breaks the limits; returns the report"""
+        import httpx
+
+        steps: List[Dict[str, Any]] = []
+        saturation = 0.0
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=200)
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, limits=limits) as client:
+            rps = start_rps
+            while rps <= max_rps:
+                summary = (await self.run_step(client, rps, step_seconds)).summary()
+                summary["healthy"] = (
+                    summary["error_rate"] <= max_error_rate
+                    and summary["p99_ms"] <= max_p99 * 1000
+                    # Completions falling behind the offered load means requests are queueing up
+                    and summary["achieved_rps"] >= 0.9 * summary["offered_rps"] * (1 - summary["error_rate"])
+                )
+                steps.append(summary)
+                if on_step is not None:
+                    on_step(summary)
+                if not summary["healthy"]:
+                    break
+                saturation = rps
+                rps += step_rps
+        return {
+            "saturation_rps": saturation,
+            "limits": {"max_error_rate": max_error_rate, "max_p99_seconds": max_p99},
+            "mix": self.mix,
+            "arrival": self.arrival,
+            "steps": steps
+        }
+
+
+def print_step(summary: Dict[str, Any]):
+    errors = ", ".join(f"{kind}×{count}" for kind, count in summary["errors"].items()) or "none"
+    print(f"   {summary['target_rps']:7.1f} rps -> {summary['achieved_rps']:7.1f} ok/s  "
+          f"p50 {summary['p50_ms']:7.1f}ms  p95 {summary['p95_ms']:7.1f}ms  p99 {summary['p99_ms']:7.1f}ms  "
+          f"errors {summary['error_rate']:6.1%} ({errors})  {'✅' if summary['healthy'] else '❌'}")
+
+
+def run_load_test(args) -> Dict[str, Any]:
+    """Start fake Gemini and the Oracle (unless targeting a running server) and ramp the load"""
+    fake = server = None
+    base_url = args.target
+    try:
+        if base_url is None:
+            fake = FakeGeminiServer(
+                latency=args.gemini_latency, distribution=args.gemini_distribution, sigma=args.gemini_sigma,
+                jitter=args.gemini_jitter, error_rate=args.gemini_error_rate,
+                error_codes=[int(code) for code in args.gemini_error_codes.split(",") if code], seed=args.seed
+            ).start()
+            server = OracleServerProcess(fake.url).start()
+            base_url = server.url
+            print(f"🧪 Fake Gemini at {fake.url} (median {args.gemini_latency}s {args.gemini_distribution}, "
+                  f"{args.gemini_error_rate:.1%} errors); Oracle at {base_url} (log {server.log_path})")
+
+        generator = LoadGenerator(base_url, parse_mix(args.mix), args.timeout, args.arrival, args.seed)
+        print(f"📈 Ramping {args.start_rps} -> {args.max_rps} rps in steps of {args.step_rps}, "
+              f"{args.step_seconds}s each (limits: errors ≤ {args.max_error_rate:.1%}, p99 ≤ {args.max_p99}s)")
+        report = asyncio.run(generator.ramp(args.start_rps, args.step_rps, args.max_rps, args.step_seconds,
+                                            args.max_error_rate, args.max_p99, on_step=print_step))
+        if fake is not None:
+            report["fake_gemini"] = {**fake.stats(), "latency": args.gemini_latency,
+                                     "distribution": args.gemini_distribution, "error_rate": args.gemini_error_rate}
+        return report
+    finally:
+        if server is not None:
+            server.stop()
+        if fake is not None:
+            fake.stop()
+
+
+def build_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", help="load an already running Oracle instead of starting one")
+    parser.add_argument("--mix", default="query=6,speak=3,inspire=1")
+    parser.add_argument("--arrival", choices=["poisson", "uniform"], default="poisson")
+    parser.add_argument("--start-rps", type=float, default=10)
+    parser.add_argument("--step-rps", type=float, default=10)
+    parser.add_argument("--max-rps", type=float, default=200)
+    parser.add_argument("--step-seconds", type=float, default=10)
+    parser.add_argument("--timeout", type=float, default=30, help="client timeout per request")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--max-p99", type=float, default=2.0, help="p99 latency limit in seconds")
+    parser.add_argument("--min-capacity", type=float, help="fail when the saturation point is below this rps")
+    parser.add_argument("--gemini-latency", type=float, default=0.2, help="fake Gemini median latency (s)")
+    parser.add_argument("--gemini-distribution", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--gemini-sigma", type=float, default=0.5)
+    parser.add_argument("--gemini-jitter", type=float, default=0.05)
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0)
+    parser.add_argument("--gemini-error-codes", default="429,500,503")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the report as JSON")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    report = run_load_test(args)
+
+    print(f"\n🎯 Saturation point: {report['saturation_rps']:.1f} rps")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.output}")
+    if args.min_capacity is not None and report["saturation_rps"] < args.min_capacity:
+        print(f"❌ Capacity regression: saturation {report['saturation_rps']:.1f} rps is below "
+              f"the required {args.min_capacity:.1f} rps")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+Oracle Metrics
+Process-wide metrics registry and Prometheus text exposition for the Oracle apps
+
+All three FastAPI apps share ``REGISTRY`` and label their series with
+``app``, so one scrape of any app's ``/metrics`` shows everything the
+process serves. Recording is a dictionary update under a per-metric lock
+and rendering only happens on scrape, which keeps it cheap enough to leave
+on in production.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from cache hits up to slow model generations
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Event-loop lag sampling period in seconds (overridable per deployment)
+LOOP_LAG_INTERVAL = float(os.getenv("ORACLE_LOOP_LAG_INTERVAL", 0.5))
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is read from a callback at scrape time"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._functions: Dict[LabelValues, Callable[[], Optional[float]]] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], Optional[float]], **labels):
+        """Read the value from ``function`` at scrape time (None skips the sample)"""
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = function
+
+    def value(self, **labels) -> float:
+        key = self._key(labels)
+        if key in self._functions:
+            return self._functions[key]()
+        return self._values.get(key, 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+            functions = list(self._functions.items())
+        for key, function in functions:
+            try:
+                value = function()
+            except Exception as e:
+                logger.error(f"Gauge {self.name} callback failed: {e}")
+                continue
+            if value is not None:
+                items.append((key, value))
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observations per label set"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(series[0]), series[1], series[2]) for key, series in self._series.items()]
+        lines = []
+        for key, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics rendered together in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, documentation: str, labelnames: Iterable[str], **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                # Modules imported by several apps share the same series
+                if not isinstance(existing, cls) or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} already registered with a different type or labels")
+                return existing
+            metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "oracle_http_requests_total", "HTTP requests by route and status", ["app", "route", "method", "status"])
+HTTP_LATENCY = REGISTRY.histogram(
+    "oracle_http_request_duration_seconds", "HTTP request latency by route", ["app", "route", "method"])
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "oracle_http_requests_in_flight", "HTTP requests currently being served", ["app"])
+ANSWERS = REGISTRY.counter(
+    "oracle_answers_total", "Answers served by inspiration type (AI versus fallback)", ["app", "inspiration_type"])
+MODEL_LATENCY = REGISTRY.histogram(
+    "oracle_model_request_duration_seconds", "Upstream model call latency", ["app", "outcome"])
+CACHE_HIT_RATIO = REGISTRY.gauge(
+    "oracle_cache_hit_ratio", "Response cache hits over lookups", ["app"])
+LOOP_LAG = REGISTRY.histogram(
+    "oracle_event_loop_lag_seconds", "Delay of event-loop wakeups beyond their schedule", ["app"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+BLOCKING_CALLS = REGISTRY.counter(
+    "oracle_event_loop_blocking_calls_total", "Event-loop stalls caught by the blocking-call detector", ["app"])
+CIRCUIT_STATE = REGISTRY.gauge(
+    "oracle_circuit_breaker_state", "1 for the circuit breaker's current state, 0 for the others",
+    ["app", "breaker", "state"])
+CIRCUIT_TRANSITIONS = REGISTRY.counter(
+    "oracle_circuit_breaker_transitions_total", "Circuit breaker state changes",
+    ["app", "breaker", "from_state", "to_state"])
+FALLBACKS = REGISTRY.counter(
+    "oracle_fallback_answers_total", "Queries answered without the model, by reason", ["app", "reason"])
+
+
+def record_answer(app_name: str, inspiration_type: str):
+    ANSWERS.inc(app=app_name, inspiration_type=inspiration_type)
+
+
+def model_latency_observer(app_name: str) -> Callable[[float, str], None]:
+    """Callback for GenerationPool recording each upstream call's latency"""
+    def observe(elapsed: float, outcome: str):
+        MODEL_LATENCY.observe(elapsed, app=app_name, outcome=outcome)
+    return observe
+
+
+def observe_breaker(breaker, app_name: str):
+    """Export a CircuitBreaker's state and state changes"""
+    for state in ("closed", "open", "half_open"):
+        CIRCUIT_STATE.set_function(lambda state=state: float(breaker.state == state),
+                                   app=app_name, breaker=breaker.name, state=state)
+
+    def on_transition(previous: str, state: str):
+        CIRCUIT_TRANSITIONS.inc(app=app_name, breaker=breaker.name, from_state=previous, to_state=state)
+    breaker.on_transition = on_transition
+
+
+class LoopLagMonitor:
+    """
+    Samples event-loop lag: how late a sleep of ``interval`` seconds wakes up.
+
+    One wakeup per interval is the whole cost; any callback that blocks the
+    loop shows up as lag on the next sample.
+    """
+
+    def __init__(self, app_name: str, interval: float = LOOP_LAG_INTERVAL):
+        self.app_name = app_name
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            LOOP_LAG.observe(max(0.0, time.perf_counter() - started - self.interval), app=self.app_name)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request by its route template"""
+
+    def __init__(self, app, app_name: str):
+        self.app = app
+        self.app_name = app_name
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc(app=self.app_name)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec(app=self.app_name)
+            # Route templates keep label cardinality bounded; unknown paths share one label
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUESTS.inc(app=self.app_name, route=route, method=scope["method"], status=status)
+            HTTP_LATENCY.observe(elapsed, app=self.app_name, route=route, method=scope["method"])
+
+
+def instrument_app(app, app_name: str) -> LoopLagMonitor:
+    """Add request metrics, loop-lag sampling and a /metrics route to a FastAPI app"""
+    from fastapi.responses import PlainTextResponse
+
+    app.add_middleware(MetricsMiddleware, app_name=app_name)
+    HTTP_IN_FLIGHT.set(0, app=app_name)
+
+    monitor = LoopLagMonitor(app_name)
+    app.on_event("startup")(monitor.start)
+    app.on_event("shutdown")(monitor.stop)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus text exposition of the shared registry"""
+        return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+    return monitor
@@ -0,0 +1,108 @@
+"""
+Oracle Pipeline
+DAG stage executor: every stage starts as soon as the stages it depends on finish
+"""
+
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from oracle_events import EventEmitter
+from oracle_tracing import start_span
+
+StageFunc = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class PipelineStageError(Exception):
+    """A pipeline stage raised; the original exception is the __cause__"""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"Stage '{stage}' failed: {error}")
+        self.stage = stage
+
+
+class StagePipeline:
+    """
+    Runs async stages as a dependency graph.
+
+    Each stage is ``async def stage(inputs)`` where ``inputs`` maps the
+    names of its dependencies to their results. Independent stages run
+    concurrently; a failing stage cancels everything still running and
+    surfaces as PipelineStageError. ``run`` returns every stage's result
+    and its duration in milliseconds. Each run and stage is traced as a
+    span named after the pipeline.
+    """
+
+    def __init__(self, name: str, events: Optional[EventEmitter] = None):
+        self.name = name
+        self.events = events
+        self._stages: Dict[str, Tuple[StageFunc, Tuple[str, ...]]] = {}
+
+    def add_stage(self, name: str, func: StageFunc, depends_on: Iterable[str] = ()) -> "StagePipeline":
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' already defined")
+        self._stages[name] = (func, tuple(depends_on))
+        return self
+
+    def _execution_order(self) -> List[str]:
+        """Topological order; rejects unknown dependencies and cycles"""
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Pipeline '{self.name}' has a cycle: {' -> '.join(path + (name,))}")
+            if name not in self._stages:
+                raise ValueError(f"Stage '{path[-1]}' depends on unknown stage '{name}'")
+            state[name] = "visiting"
+            for dependency in self._stages[name][1]:
+                visit(dependency, path + (name,))
+            state[name] = "done"
+            order.append(name)
+
+        for name in self._stages:
+            visit(name, ())
+        return order
+
+    def _emit(self, event: str, **fields):
+        if self.events is not None:
+            self.events.emit(event, pipeline=self.name, **fields)
+
+    async def run(self) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        order = self._execution_order()
+        results: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(name: str):
+            func, dependencies = self._stages[name]
+            if dependencies:
+                await asyncio.gather(*(tasks[dependency] for dependency in dependencies))
+            self._emit("pipeline.stage_started", stage=name)
+            started = time.perf_counter()
+            try:
+                with start_span(f"{self.name}.{name}", {"oracle.pipeline": self.name, "oracle.stage": name}):
+                    results[name] = await func({dependency: results[dependency] for dependency in dependencies})
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._emit("pipeline.stage_failed", stage=name, error=str(e),
+                           elapsed_ms=round((time.perf_counter() - started) * 1000, 3))
+                raise PipelineStageError(name, e) from e
+            timings[name] = round((time.perf_counter() - started) * 1000, 3)
+            self._emit("pipeline.stage_completed", stage=name, elapsed_ms=timings[name])
+
+        with start_span(f"{self.name}.pipeline", {"oracle.pipeline": self.name}):
+            # Stage tasks copy the current context, so their spans nest under this one
+            for name in order:
+                tasks[name] = asyncio.ensure_future(run_stage(name))
+            try:
+                await asyncio.gather(*tasks.values())
+            except BaseException:
+                for task in tasks.values():
+                    task.cancel()
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+                raise
+        return results, timings
@@ -0,0 +1,175 @@
+"""
+Oracle Quest API
+REST endpoints for the Sacred Interface quest lifecycle
+
+Routes are built by ``create_quest_router`` around one QuestInterface so
+any FastAPI app can mount them. Request bodies are validated by pydantic
+before any session lookup, and step responses carry only the fields the
+client needs next. Dialogue comes back as deltas: each step returns the
+entries after the client's ``since`` cursor (by default just the ones the
+step added) and the new cursor; the full history has its own endpoint.
+"""
+
+import sys
+import time
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Path as PathParam, Query
+from pydantic import BaseModel, Field
+
+# The Sacred Interface lives in its own directory
+sys.path.append(str(Path(__file__).parent / "sacred_interface"))
+
+from quest_interface import QuestInterface, OraclePortal, QuestNotFound, QuestStageError
+from oracle_session_store import SessionConflict
+from oracle_resilience import StageTimer
+
+logger = logging.getLogger(__name__)
+
+QUEST_ID_PATTERN = r"^quest_\d{8}_\d{6}_[0-9a-f]{8}$"
+QuestId = PathParam(..., pattern=QUEST_ID_PATTERN, description="Id returned when the quest was initiated")
+Since = Query(None, ge=0, description="Last dialogue_cursor the client has seen")
+DIALOGUE_PAGE_LIMIT = 200
+
+
+# Request/Response models
+class QuestInitiateRequest(BaseModel):
+    creator_name: str = Field("Anonymous Creator", min_length=1, max_length=100)
+
+class IntentionRequest(BaseModel):
+    intention: str = Field(..., min_length=1, max_length=2000)
+
+class DeepeningRequest(BaseModel):
+    question_type: Literal["essence", "struggle", "resonance"]
+    response: str = Field(..., min_length=1, max_length=2000)
+
+class QuestStepResponse(BaseModel):
+    quest_id: str
+    status: str
+    stage: Optional[str] = None
+    revision: Optional[int] = None
+    invitation: Optional[str] = None
+    reflection: Optional[str] = None
+    deepening_questions: Optional[Dict[str, str]] = None
+    responses_received: Optional[int] = None
+    responses_needed: Optional[int] = None
+    refined_quest: Optional[str] = None
+    completion_ritual: Optional[str] = None
+    dialogue: Optional[List[Dict[str, Any]]] = None
+    dialogue_cursor: Optional[int] = None
+    inspiration: Optional[Dict[str, Any]] = None
+
+class DialoguePage(BaseModel):
+    quest_id: str
+    entries: List[Dict[str, Any]]
+    cursor: int
+    total: int
+
+
+def create_quest_router(quest_interface: QuestInterface,
+                        consult: Optional[Callable[[str], Awaitable[Dict[str, Any]]]] = None,
+                        timer: Optional[StageTimer] = None) -> APIRouter:
+    """
+    Quest lifecycle routes under /quests.
+
+    ``consult(final_quest)`` answers a finalized quest when it is submitted
+    to the Oracle; without it the submission is only prepared. Stage
+    latencies are recorded on ``timer`` when one is given.
+    """
+    router = APIRouter(prefix="/quests", tags=["quests"])
+    portal = OraclePortal(quest_interface)
+    timer = timer if timer is not None else StageTimer()
+
+    async def load_status(quest_id: str) -> Dict[str, Any]:
+        status = await quest_interface.get_quest_status(quest_id)
+        if status["status"] == "not_found":
+            raise HTTPException(status_code=404, detail=f"Quest {quest_id} not found")
+        return status
+
+    async def run_stage(stage: str, step: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await step
+            failed = False
+            return result
+        except QuestNotFound as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except QuestStageError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except SessionConflict:
+            raise HTTPException(status_code=409, detail="Quest was updated concurrently, please retry")
+        finally:
+            timer.record(stage, time.perf_counter() - started, failed)
+
+    @router.post("", response_model=QuestStepResponse, response_model_exclude_none=True)
+    async def initiate_quest(request: QuestInitiateRequest):
+        """Open a new quest and receive the first invitation"""
+        result = await run_stage("initiate", quest_interface.initiate_quest(request.creator_name))
+        return QuestStepResponse(invitation=result.pop("current_invitation"), **result)
+
+    @router.post("/{quest_id}/intention", response_model=QuestStepResponse, response_model_exclude_none=True)
+    async def submit_intention(request: IntentionRequest, quest_id: str = QuestId, since: Optional[int] = Since):
+        """Plant the intention seed and receive deepening questions"""
+        result = await run_stage("intention", quest_interface.receive_intention_seed(quest_id, request.intention, since))
+        return QuestStepResponse(**result)
+
+    @router.post("/{quest_id}/deepening", response_model=QuestStepResponse, response_model_exclude_none=True)
+    async def submit_deepening(request: DeepeningRequest, quest_id: str = QuestId, since: Optional[int] = Since):
+        """Answer one deepening question"""
+        result = await run_stage(
+            "deepening",
+            quest_interface.receive_deepening_response(quest_id, request.question_type, request.response, since)
+        )
+        return QuestStepResponse(**result)
+
+    @router.post("/{quest_id}/finalize", response_model=QuestStepResponse, response_model_exclude_none=True)
+    async def finalize_quest(quest_id: str = QuestId, since: Optional[int] = Since):
+        """Complete the ritual; the quest is archived and ready for the Oracle"""
+        result = await run_stage("finalize", quest_interface.finalize_quest(quest_id, since))
+        return QuestStepResponse(refined_quest=result.pop("final_quest"), **result)
+
+    @router.post("/{quest_id}/oracle", response_model=QuestStepResponse, response_model_exclude_none=True)
+    async def submit_to_oracle(quest_id: str = QuestId):
+        """Submit a finalized quest to the Oracle for inspiration"""
+
+        async def consult_oracle():
+            submission = await portal.submit_quest_to_oracle(quest_id)
+            inspiration = await consult(submission["creator_intention"]) if consult is not None else None
+            return {"submission": submission, "inspiration": inspiration}
+
+        result = await run_stage("oracle", consult_oracle())
+        return QuestStepResponse(
+            quest_id=quest_id,
+            status="inspired" if result["inspiration"] is not None else "submitted",
+            refined_quest=result["submission"]["creator_intention"],
+            inspiration=result["inspiration"]
+        )
+
+    @router.get("/{quest_id}", response_model=QuestStepResponse, response_model_exclude_none=True)
+    async def quest_status(quest_id: str = QuestId):
+        """Where a quest stands, without its dialogue"""
+        status = await load_status(quest_id)
+        session = status["session"]
+        return QuestStepResponse(
+            quest_id=quest_id,
+            status=status["status"],
+            stage=session.get("stage"),
+            revision=session.get("revision"),
+            refined_quest=session.get("final_quest"),
+            dialogue_cursor=len(session.get("sacred_dialogue", []))
+        )
+
+    @router.get("/{quest_id}/dialogue", response_model=DialoguePage)
+    async def quest_dialogue(quest_id: str = QuestId, since: int = Query(0, ge=0),
+                             limit: int = Query(DIALOGUE_PAGE_LIMIT, ge=1, le=DIALOGUE_PAGE_LIMIT)):
+        """Sacred dialogue from a cursor onwards; page with the returned cursor"""
+        status = await load_status(quest_id)
+        dialogue = status["session"]["sacred_dialogue"]
+        entries = dialogue[since:since + limit]
+        return DialoguePage(quest_id=quest_id, entries=entries,
+                            cursor=min(since, len(dialogue)) + len(entries), total=len(dialogue))
+
+    return router
@@ -0,0 +1,184 @@
+"""
+Oracle Resilience
+Circuit breaking, per-stage latency budgets and stage timing for Oracle pipelines
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from oracle_tracing import start_span
+
+logger = logging.getLogger(__name__)
+
+# Breaker defaults (overridable per deployment)
+DEFAULT_FAILURE_THRESHOLD = int(os.getenv("ORACLE_BREAKER_FAILURES", 5))
+DEFAULT_RESET_TIMEOUT = float(os.getenv("ORACLE_BREAKER_RESET_SECONDS", 30))
+
+
+class CircuitOpen(Exception):
+    """Raised when a call is refused because its circuit is open"""
+
+
+class StageTimeout(Exception):
+    """Raised when a pipeline stage overruns its latency budget"""
+
+    def __init__(self, stage: str, budget: float):
+        super().__init__(f"Stage '{stage}' exceeded its {budget:.2f}s budget")
+        self.stage = stage
+        self.budget = budget
+
+
+class CircuitBreaker:
+    """
+    Classic closed / open / half-open circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    callers should take their degraded path without trying. Once
+    ``reset_timeout`` has passed a single probe call is let through: success
+    closes the circuit, failure opens it again. ``on_transition`` is called
+    with the old and new state whenever the circuit changes state.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+                 clock: Callable[[], float] = time.monotonic,
+                 on_transition: Optional[Callable[[str, str], None]] = None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._trips = 0
+        self._rejected = 0
+        self.on_transition = on_transition
+
+    def _set_state(self, state: str):
+        previous = self._state
+        self._state = state
+        if state != previous and self.on_transition is not None:
+            self.on_transition(previous, state)
+
+    @property
+    def state(self) -> str:
+        if self._state == "open" and self._clock() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether the protected call should be attempted now"""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probe_in_flight:
+            self._set_state("half_open")
+            self._probe_in_flight = True
+            return True
+        self._rejected += 1
+        return False
+
+    def record_success(self):
+        if self._state != "closed":
+            logger.info(f"✅ Circuit '{self.name}' closed")
+        self._set_state("closed")
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self._failures += 1
+        if self._state == "half_open" or self._failures >= self.failure_threshold:
+            if self._state != "open":
+                self._trips += 1
+                logger.warning(f"⚡ Circuit '{self.name}' opened after {self._failures} failures")
+            self._set_state("open")
+            self._opened_at = self._clock()
+        self._probe_in_flight = False
+
+    def release(self):
+        """Free a half-open probe whose call ended without saying anything about the dependency"""
+        self._probe_in_flight = False
+
+    async def call(self, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``factory()`` through the breaker; raises CircuitOpen when refused"""
+        if not self.allow_request():
+            raise CircuitOpen(f"Circuit '{self.name}' is open")
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            # The caller went away; that says nothing about the dependency
+            self.release()
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state and counters for status endpoints"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout_seconds": self.reset_timeout,
+            "trips": self._trips,
+            "rejected": self._rejected
+        }
+
+
+class StageTimer:
+    """Per-stage call counts and latency for status endpoints"""
+
+    def __init__(self):
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    def record(self, stage: str, elapsed: float, failed: bool):
+        entry = self._stages.setdefault(stage, {"calls": 0, "failed": 0, "total": 0.0, "max": 0.0})
+        entry["calls"] += 1
+        entry["failed"] += failed
+        entry["total"] += elapsed
+        entry["max"] = max(entry["max"], elapsed)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            stage: {
+                "calls": entry["calls"],
+                "failed": entry["failed"],
+                "avg_latency_ms": round(entry["total"] / entry["calls"] * 1000, 2),
+                "max_latency_ms": round(entry["max"] * 1000, 2)
+            }
+            for stage, entry in self._stages.items()
+        }
+
+
+async def within_budget(stage: str, awaitable: Awaitable[Any], budget: Optional[float],
+                        timer: Optional[StageTimer] = None) -> Any:
+    """
+    Await one pipeline stage, raising StageTimeout if it overruns ``budget`` seconds.
+
+    A stage is only interrupted at an await that actually suspends. A stage
+    that runs to completion without yielding (CPU-only coroutines) cannot
+    be cut short; its overrun is detected when it finishes and its result
+    is discarded.
+    """
+    started = time.perf_counter()
+    failed = True
+    try:
+        with start_span(f"stage.{stage}", {"oracle.stage": stage, "oracle.budget_seconds": budget or 0.0}):
+            try:
+                result = await (asyncio.wait_for(awaitable, budget) if budget else awaitable)
+            except asyncio.TimeoutError:
+                raise StageTimeout(stage, budget) from None
+            if budget and time.perf_counter() - started > budget:
+                # wait_for hands back a result that arrived late if the stage never yielded
+                raise StageTimeout(stage, budget)
+        failed = False
+        return result
+    finally:
+        if timer is not None:
+            timer.record(stage, time.perf_counter() - started, failed)
@@ -0,0 +1,634 @@
+"""
+Oracle Session Store
+Shared, versioned storage for multi-step quest sessions
+
+Every backend stores whole session dicts and guards updates with the
+session's ``revision``: ``save`` succeeds only if nobody else saved the
+session since it was read, otherwise it raises SessionConflict. That lets
+several uvicorn workers or replicas serve the same quest without sticky
+sessions.
+"""
+
+import os
+import json
+import time
+import queue
+import asyncio
+import socket
+import sqlite3
+import logging
+import threading
+import socketserver
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from oracle_sessions import SessionManager, DEFAULT_IDLE_TTL, DEFAULT_REAP_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REDIS_URL = os.getenv("ORACLE_REDIS_URL", "redis://localhost:6379/0")
+
+
+class SessionConflict(Exception):
+    """Raised when a session changed since it was read"""
+
+
+class SessionExists(Exception):
+    """Raised when creating a session id that is already live"""
+
+
+class LocalSessionStore:
+    """
+    In-process store on top of SessionManager (single worker only).
+
+    Sessions are handed out by reference, so the revision check cannot
+    fail; idle TTL, LRU cap and eviction checkpoints come from the manager.
+    """
+
+    name = "memory"
+    blocking = False
+    checkpoints_expired = True
+
+    def __init__(self, sessions: Optional[SessionManager] = None):
+        self.sessions = sessions if sessions is not None else SessionManager("sessions")
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return self.sessions.get(session_id)
+
+    def create(self, session_id: str, session: Dict[str, Any]):
+        if session_id in self.sessions:
+            raise SessionExists(session_id)
+        session["revision"] = 1
+        self.sessions[session_id] = session
+
+    def save(self, session_id: str, session: Dict[str, Any]):
+        current = self.sessions.get(session_id)
+        if current is None or current.get("revision") != session.get("revision"):
+            raise SessionConflict(f"Session {session_id} changed or expired")
+        session["revision"] += 1
+        self.sessions[session_id] = session
+
+    def delete(self, session_id: str):
+        self.sessions.pop(session_id, None)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self.sessions
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, **self.sessions.stats()}
+
+    def start_reaper(self):
+        pass  # The manager starts its own reaper with the first session
+
+    async def stop_reaper(self):
+        await self.sessions.stop()
+
+    def close(self):
+        pass
+
+
+class SQLiteSessionStore:
+    """
+    Session store on a SQLite file shared by every worker on one host.
+
+    WAL mode lets readers and the single writer overlap; the revision check
+    is a conditional UPDATE, so it is atomic across processes.
+
+    Expired rows are deleted when they are next looked up or by the reaper
+    (``start_reaper``), and ``on_evict(session_id, session, "idle")`` is
+    called for each one, as SessionManager does. The delete is conditional,
+    so when several workers purge at once each session is checkpointed once.
+    """
+
+    name = "sqlite"
+    blocking = True
+    checkpoints_expired = True
+
+    def __init__(self, db_path: str, idle_ttl: float = DEFAULT_IDLE_TTL,
+                 reap_interval: float = DEFAULT_REAP_INTERVAL,
+                 on_evict: Optional[Callable[[str, Dict[str, Any], str], None]] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.idle_ttl = idle_ttl
+        self.reap_interval = reap_interval
+        self.on_evict = on_evict
+        self._reaper: Optional[asyncio.Task] = None
+        self._evicted = 0
+        self._checkpoint_failures = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, revision INTEGER NOT NULL, stage TEXT, "
+            "data TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires_at)")
+        self._conn.commit()
+
+    def _expires_at(self) -> float:
+        return time.time() + self.idle_ttl if self.idle_ttl else float("inf")
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, expires_at FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        if row[1] <= time.time():
+            self._expire("AND session_id = ?", (session_id,))
+            return None
+        return json.loads(row[0])
+
+    def create(self, session_id: str, session: Dict[str, Any]):
+        session["revision"] = 1
+        # Clear an expired row with the same id before claiming it
+        self._expire("AND session_id = ?", (session_id,))
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT INTO sessions (session_id, revision, stage, data, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (session_id, 1, session.get("stage"), json.dumps(session, ensure_ascii=False), self._expires_at())
+                )
+            except sqlite3.IntegrityError:
+                self._conn.rollback()
+                raise SessionExists(session_id)
+            self._conn.commit()
+
+    def save(self, session_id: str, session: Dict[str, Any]):
+        expected = session.get("revision")
+        session["revision"] = expected + 1
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE sessions SET revision = ?, stage = ?, data = ?, expires_at = ? "
+                "WHERE session_id = ? AND revision = ? AND expires_at > ?",
+                (expected + 1, session.get("stage"), json.dumps(session, ensure_ascii=False),
+                 self._expires_at(), session_id, expected, time.time())
+            ).rowcount
+            self._conn.commit()
+        if not updated:
+            session["revision"] = expected
+            raise SessionConflict(f"Session {session_id} changed or expired")
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._conn.commit()
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+    def purge_expired(self) -> int:
+        """Delete every expired session now; returns how many were removed"""
+        removed = self._expire()
+        if removed:
+            logger.info(f"🧹 Purged {removed} expired sessions from {self.db_path.name}")
+        return removed
+
+    def _expire(self, where: str = "", params: tuple = ()) -> int:
+        now = time.time()
+        evicted = []
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT session_id, data FROM sessions WHERE expires_at <= ? {where}", (now, *params)
+            ).fetchall()
+            for session_id, data in rows:
+                # Only the worker whose delete lands checkpoints the session
+                if self._conn.execute(
+                    "DELETE FROM sessions WHERE session_id = ? AND expires_at <= ?", (session_id, now)
+                ).rowcount:
+                    evicted.append((session_id, data))
+            self._conn.commit()
+        for session_id, data in evicted:
+            self._evict(session_id, json.loads(data))
+        return len(evicted)
+
+    def _evict(self, session_id: str, session: Dict[str, Any]):
+        self._evicted += 1
+        if self.on_evict is None:
+            return
+        try:
+            self.on_evict(session_id, session, "idle")
+        except Exception as e:
+            self._checkpoint_failures += 1
+            logger.error(f"Checkpoint of session {session_id} failed: {e}")
+
+    def start_reaper(self):
+        """Purge expired sessions every ``reap_interval`` from the running event loop"""
+        if not self.idle_ttl or (self._reaper is not None and not self._reaper.done()):
+            return
+        self._reaper = asyncio.get_running_loop().create_task(self._reap_forever())
+
+    async def _reap_forever(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            try:
+                await loop.run_in_executor(None, self.purge_expired)
+            except sqlite3.Error as e:
+                logger.error(f"Purging expired sessions failed: {e}")
+
+    async def stop_reaper(self):
+        if self._reaper is not None:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT COALESCE(stage, 'unknown'), COUNT(*) FROM sessions WHERE expires_at > ? GROUP BY stage",
+                (time.time(),)
+            ).fetchall()
+        by_stage = dict(rows)
+        return {
+            "backend": self.name,
+            "live_sessions": sum(by_stage.values()),
+            "idle_ttl_seconds": self.idle_ttl,
+            "by_stage": by_stage,
+            "evicted_idle": self._evicted,
+            "checkpoint_failures": self._checkpoint_failures
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RespError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+
+class RespConnection:
+    """One blocking connection speaking RESP2"""
+
+    def __init__(self, host: str, port: int, timeout: float = 5.0):
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+
+    def command(self, *args) -> Any:
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+        self._sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode()
+        if prefix == b"-":
+            raise RespError(body.decode())
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            count = int(body)
+            if count < 0:
+                return None
+            return [self._read_reply() for _ in range(count)]
+        raise RespError(f"Unexpected reply {line!r}")
+
+    def close(self):
+        try:
+            self._reader.close()
+            self._sock.close()
+        except OSError:
+            pass
+
+
+class RedisSessionStore:
+    """
+    Session store on any Redis-protocol server (Redis, Valkey, KeyDB...).
+
+    Each session is one JSON value under ``prefix + session_id`` with a
+    PX expiry for the idle TTL. Updates use WATCH / MULTI / EXEC on a
+    pooled connection, so a concurrent save aborts the transaction and
+    surfaces as SessionConflict. Keys expire inside Redis, where no
+    ``on_evict`` hook can see them, so callers that need expired sessions
+    back must checkpoint them on every save.
+    """
+
+    name = "redis"
+    blocking = True
+    checkpoints_expired = False
+
+    def __init__(self, url: str = DEFAULT_REDIS_URL, idle_ttl: float = DEFAULT_IDLE_TTL,
+                 prefix: str = "oracle:session:", pool_size: int = 8):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.idle_ttl = idle_ttl
+        self.prefix = prefix
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    def _connect(self) -> RespConnection:
+        conn = RespConnection(self.host, self.port)
+        if self.password:
+            conn.command("AUTH", self.password)
+        if self.db:
+            conn.command("SELECT", self.db)
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        except SessionConflict:
+            # Raised after UNWATCH, so the connection is clean for the next caller
+            self._release(conn)
+            raise
+        except BaseException:
+            # Anything else may leave a reply unread or a transaction open
+            conn.close()
+            raise
+        else:
+            self._release(conn)
+
+    def _release(self, conn: RespConnection):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _ttl_args(self) -> List[Any]:
+        return ["PX", int(self.idle_ttl * 1000)] if self.idle_ttl else []
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._connection() as conn:
+            data = conn.command("GET", self.prefix + session_id)
+        return json.loads(data) if data is not None else None
+
+    def create(self, session_id: str, session: Dict[str, Any]):
+        session["revision"] = 1
+        with self._connection() as conn:
+            created = conn.command("SET", self.prefix + session_id, json.dumps(session, ensure_ascii=False),
+                                   *self._ttl_args(), "NX")
+        if created is None:
+            raise SessionExists(session_id)
+
+    def save(self, session_id: str, session: Dict[str, Any]):
+        key = self.prefix + session_id
+        expected = session.get("revision")
+        with self._connection() as conn:
+            conn.command("WATCH", key)
+            try:
+                current = conn.command("GET", key)
+                if current is None or json.loads(current).get("revision") != expected:
+                    raise SessionConflict(f"Session {session_id} changed or expired")
+                session["revision"] = expected + 1
+                conn.command("MULTI")
+                conn.command("SET", key, json.dumps(session, ensure_ascii=False), *self._ttl_args())
+                committed = conn.command("EXEC")
+            finally:
+                conn.command("UNWATCH")
+        if committed is None:
+            session["revision"] = expected
+            raise SessionConflict(f"Session {session_id} changed during save")
+
+    def delete(self, session_id: str):
+        with self._connection() as conn:
+            conn.command("DEL", self.prefix + session_id)
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._connection() as conn:
+            return bool(conn.command("EXISTS", self.prefix + session_id))
+
+    def stats(self) -> Dict[str, Any]:
+        live = 0
+        cursor = b"0"
+        with self._connection() as conn:
+            while True:
+                cursor, keys = conn.command("SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 1000)
+                live += len(keys)
+                if cursor in (b"0", 0, "0"):
+                    break
+        return {"backend": self.name, "live_sessions": live, "idle_ttl_seconds": self.idle_ttl}
+
+    def start_reaper(self):
+        pass  # Redis expires keys itself
+
+    async def stop_reaper(self):
+        pass
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def create_session_store_from_env(interface_path: Path, name: str = "sessions",
+                                  on_evict: Optional[Callable[[str, Dict[str, Any], str], None]] = None):
+    """
+    Store selected by ORACLE_SESSION_STORE: memory (default), sqlite or redis.
+
+    ``on_evict`` is handed to the backends that can see sessions expire
+    (``checkpoints_expired``); with redis the caller checkpoints on save.
+    """
+    backend = os.getenv("ORACLE_SESSION_STORE", "memory").lower()
+    if backend == "sqlite":
+        db_path = os.getenv("ORACLE_SESSION_DB") or str(Path(interface_path) / "sessions.sqlite3")
+        return SQLiteSessionStore(db_path, on_evict=on_evict)
+    if backend == "redis":
+        return RedisSessionStore(DEFAULT_REDIS_URL)
+    return LocalSessionStore(SessionManager(name, on_evict=on_evict))
+
+
+# Local stand-in for development and tests, no Redis install needed
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    """One client connection: parses RESP arrays and replies like Redis"""
+
+    def handle(self):
+        self.watched: Dict[bytes, int] = {}
+        self.queued: Optional[List[List[bytes]]] = None
+        while True:
+            try:
+                args = self._read_command()
+            except (ConnectionError, ValueError):
+                return
+            if args is None:
+                return
+            self.wfile.write(self._dispatch(args))
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.split()
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _dispatch(self, args: List[bytes]) -> bytes:
+        name = args[0].upper()
+        server = self.server
+        if self.queued is not None and name not in (b"EXEC", b"DISCARD", b"MULTI", b"WATCH"):
+            self.queued.append(args)
+            return b"+QUEUED\r\n"
+        if name == b"MULTI":
+            self.queued = []
+            return b"+OK\r\n"
+        if name == b"DISCARD":
+            self.queued = None
+            self.watched = {}
+            return b"+OK\r\n"
+        if name == b"WATCH":
+            with server.lock:
+                for key in args[1:]:
+                    self.watched[key] = server.key_version(key)
+            return b"+OK\r\n"
+        if name == b"UNWATCH":
+            self.watched = {}
+            return b"+OK\r\n"
+        if name == b"EXEC":
+            queued, self.queued = self.queued or [], None
+            with server.lock:
+                dirty = any(server.key_version(key) != version for key, version in self.watched.items())
+                self.watched = {}
+                if dirty:
+                    return b"*-1\r\n"
+                replies = [server.execute(command) for command in queued]
+            return f"*{len(replies)}\r\n".encode() + b"".join(replies)
+        with server.lock:
+            return server.execute(args)
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """
+    Minimal in-process Redis-protocol server.
+
+    Supports the commands the session store uses (GET, SET with PX/EX/NX,
+    DEL, EXISTS, SCAN, WATCH/MULTI/EXEC, PING, AUTH, SELECT) with real
+    optimistic-transaction semantics, so RedisSessionStore can be
+    exercised across threads or processes without a Redis install.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _FakeRedisHandler)
+        self.lock = threading.Lock()
+        self.data: Dict[bytes, tuple] = {}      # key -> (value, expires_at or None)
+        self.versions: Dict[bytes, int] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def key_version(self, key: bytes) -> int:
+        self._expire(key)
+        return self.versions.get(key, 0)
+
+    def _expire(self, key: bytes):
+        entry = self.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.time():
+            del self.data[key]
+            self.versions[key] = self.versions.get(key, 0) + 1
+
+    def _touch(self, key: bytes):
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def execute(self, args: List[bytes]) -> bytes:
+        name = args[0].upper()
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name in (b"AUTH", b"SELECT"):
+            return b"+OK\r\n"
+        if name == b"GET":
+            self._expire(args[1])
+            entry = self.data.get(args[1])
+            if entry is None:
+                return b"$-1\r\n"
+            return f"${len(entry[0])}\r\n".encode() + entry[0] + b"\r\n"
+        if name == b"SET":
+            key, value, options = args[1], args[2], [arg.upper() for arg in args[3:]]
+            self._expire(key)
+            if b"NX" in options and key in self.data:
+                return b"$-1\r\n"
+            expires_at = None
+            for unit, scale in ((b"PX", 0.001), (b"EX", 1.0)):
+                if unit in options:
+                    expires_at = time.time() + int(options[options.index(unit) + 1]) * scale
+            self.data[key] = (value, expires_at)
+            self._touch(key)
+            return b"+OK\r\n"
+        if name == b"DEL":
+            removed = 0
+            for key in args[1:]:
+                self._expire(key)
+                if self.data.pop(key, None) is not None:
+                    self._touch(key)
+                    removed += 1
+            return f":{removed}\r\n".encode()
+        if name == b"EXISTS":
+            count = 0
+            for key in args[1:]:
+                self._expire(key)
+                count += key in self.data
+            return f":{count}\r\n".encode()
+        if name == b"SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode() if b"MATCH" in args else "*"
+            for key in list(self.data):
+                self._expire(key)
+            keys = [key for key in self.data if fnmatchcase(key.decode(), pattern)]
+            body = b"".join(f"${len(key)}\r\n".encode() + key + b"\r\n" for key in keys)
+            return b"*2\r\n$1\r\n0\r\n" + f"*{len(keys)}\r\n".encode() + body
+        return f"-ERR unknown command '{name.decode()}'\r\n".encode()
+
+    def start(self) -> "FakeRedisServer":
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-redis", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the fake Redis-protocol server for local multi-worker testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    args = parser.parse_args()
+
+    server = FakeRedisServer(args.host, args.port)
+    print(f"🧪 Fake Redis listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
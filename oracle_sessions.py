@@ -0,0 +1,188 @@
+"""
+Oracle Session Manager
+Bounded, self-expiring registry for in-progress quests and Oracle sessions
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Session limits (overridable per deployment)
+DEFAULT_IDLE_TTL = float(os.getenv("ORACLE_SESSION_IDLE_TTL", 1800))
+DEFAULT_MAX_SESSIONS = int(os.getenv("ORACLE_MAX_SESSIONS", 10000))
+DEFAULT_REAP_INTERVAL = float(os.getenv("ORACLE_SESSION_REAP_INTERVAL", 60))
+
+
+class SessionManager:
+    """
+    Dict-like store of live sessions with an idle TTL and an LRU cap.
+
+    Reading a session (``sessions[id]`` / ``get``) or writing one marks it
+    as used. Sessions idle for longer than ``idle_ttl`` are dropped, either
+    lazily when looked up or by a background reaper task that starts with
+    the first session added inside a running event loop. Adding a session
+    beyond ``max_sessions`` evicts the least recently used one.
+
+    ``on_evict(session_id, session, reason)`` is called for every session
+    that leaves by expiry (``"idle"``) or by the cap (``"capacity"``), so
+    callers can checkpoint work in progress; explicit ``del`` / ``pop``
+    does not call it.
+    """
+
+    def __init__(self, name: str, idle_ttl: float = DEFAULT_IDLE_TTL,
+                 max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 reap_interval: float = DEFAULT_REAP_INTERVAL,
+                 on_evict: Optional[Callable[[str, Dict[str, Any], str], None]] = None,
+                 stage_of: Callable[[Dict[str, Any]], Optional[str]] = lambda session: session.get("stage")):
+        self.name = name
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self.reap_interval = reap_interval
+        self.on_evict = on_evict
+        self.stage_of = stage_of
+        # session_id -> (last_used, session), least recently used first
+        self._sessions = OrderedDict()
+        self._reaper: Optional[asyncio.Task] = None
+        self._evicted = {"idle": 0, "capacity": 0}
+        self._checkpoint_failures = 0
+
+    # Dict interface
+
+    def __setitem__(self, session_id: str, session: Dict[str, Any]):
+        self._sessions[session_id] = (time.monotonic(), session)
+        self._sessions.move_to_end(session_id)
+        while self.max_sessions and len(self._sessions) > self.max_sessions:
+            oldest_id, (_, oldest) = self._sessions.popitem(last=False)
+            self._evict(oldest_id, oldest, "capacity")
+        self._ensure_reaper()
+
+    def __getitem__(self, session_id: str) -> Dict[str, Any]:
+        session = self.get(session_id)
+        if session is None:
+            raise KeyError(session_id)
+        return session
+
+    def get(self, session_id: str, default=None):
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return default
+        last_used, session = entry
+        now = time.monotonic()
+        if self._expired(last_used, now):
+            del self._sessions[session_id]
+            self._evict(session_id, session, "idle")
+            return default
+        self._sessions[session_id] = (now, session)
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def __contains__(self, session_id: str) -> bool:
+        entry = self._sessions.get(session_id)
+        return entry is not None and not self._expired(entry[0], time.monotonic())
+
+    def __delitem__(self, session_id: str):
+        del self._sessions[session_id]
+
+    def pop(self, session_id: str, *default):
+        if session_id in self._sessions:
+            return self._sessions.pop(session_id)[1]
+        if default:
+            return default[0]
+        raise KeyError(session_id)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._sessions))
+
+    def keys(self):
+        return list(self._sessions)
+
+    def values(self):
+        return [session for _, session in self._sessions.values()]
+
+    def items(self):
+        return [(session_id, session) for session_id, (_, session) in self._sessions.items()]
+
+    # Expiry
+
+    def _expired(self, last_used: float, now: float) -> bool:
+        return bool(self.idle_ttl) and now - last_used > self.idle_ttl
+
+    def _evict(self, session_id: str, session: Dict[str, Any], reason: str):
+        self._evicted[reason] += 1
+        if self.on_evict is None:
+            return
+        try:
+            self.on_evict(session_id, session, reason)
+        except Exception as e:
+            self._checkpoint_failures += 1
+            logger.error(f"Checkpoint of {self.name} session {session_id} failed: {e}")
+
+    def reap(self) -> int:
+        """Evict every idle session now; returns how many were removed"""
+        now = time.monotonic()
+        reaped = 0
+        # Least recently used first, so stop at the first live session
+        while self._sessions:
+            session_id, (last_used, session) = next(iter(self._sessions.items()))
+            if not self._expired(last_used, now):
+                break
+            del self._sessions[session_id]
+            self._evict(session_id, session, "idle")
+            reaped += 1
+        if reaped:
+            logger.info(f"🧹 Reaped {reaped} idle {self.name} sessions")
+        return reaped
+
+    def _ensure_reaper(self):
+        if not self.idle_ttl or (self._reaper is not None and not self._reaper.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._reaper = loop.create_task(self._reap_forever())
+
+    async def _reap_forever(self):
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            self.reap()
+
+    async def stop(self):
+        """Cancel the background reaper"""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            try:
+                await self._reaper
+            except asyncio.CancelledError:
+                pass
+            self._reaper = None
+
+    # Gauges
+
+    def stage_counts(self) -> Dict[str, int]:
+        """Live sessions per stage"""
+        counts: Dict[str, int] = {}
+        for _, session in self._sessions.values():
+            stage = self.stage_of(session) or "unknown"
+            counts[stage] = counts.get(stage, 0) + 1
+        return counts
+
+    def stats(self) -> Dict[str, Any]:
+        """Session gauges and eviction counters for status endpoints"""
+        return {
+            "live_sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "idle_ttl_seconds": self.idle_ttl,
+            "by_stage": self.stage_counts(),
+            "evicted_idle": self._evicted["idle"],
+            "evicted_capacity": self._evicted["capacity"],
+            "checkpoint_failures": self._checkpoint_failures
+        }
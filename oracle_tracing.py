@@ -0,0 +1,583 @@
+"""
+Oracle Tracing
+OpenTelemetry-compatible spans for the Trinity pipeline, exported as OTLP/JSON
+
+Spans nest through a context variable, so they follow ``await`` chains
+and asyncio tasks, and HTTP requests join the caller's trace through the
+W3C ``traceparent`` header. Finished spans are handed to a background
+thread that batches them to an exporter; nothing touches disk or network
+on the event loop. Tracing is off unless ORACLE_TRACE_EXPORTER is set:
+
+- ``file``: append OTLP/JSON lines to ORACLE_TRACE_FILE, the format the
+  OpenTelemetry Collector's ``otlpjsonfile`` receiver reads
+- ``otlp``: POST OTLP/JSON to ORACLE_TRACE_ENDPOINT (a collector, Jaeger,
+  or the stand-in collector below)
+
+    python oracle_tracing.py collector --port 4318 --output traces.jsonl
+    python oracle_tracing.py show traces.jsonl
+"""
+
+import os
+import json
+import time
+import queue
+import atexit
+import random
+import asyncio
+import logging
+import functools
+import threading
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Exporter configuration (overridable per deployment)
+TRACE_EXPORTER = os.getenv("ORACLE_TRACE_EXPORTER", "none")
+TRACE_FILE = os.getenv("ORACLE_TRACE_FILE", "oracle_traces.jsonl")
+TRACE_ENDPOINT = os.getenv("ORACLE_TRACE_ENDPOINT", "http://127.0.0.1:4318/v1/traces")
+SERVICE_NAME = os.getenv("ORACLE_SERVICE_NAME", "oracle-creative-inspiration")
+TRACE_FLUSH_INTERVAL = float(os.getenv("ORACLE_TRACE_FLUSH_INTERVAL", 1.0))
+TRACE_BATCH_SIZE = 512
+
+# OTLP enum values
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+STATUS_CODES = {"unset": 0, "ok": 1, "error": 2}
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("oracle_current_span", default=None)
+
+
+class SpanContext:
+    """Trace and span ids identifying a span, as carried by ``traceparent``"""
+
+    __slots__ = ("trace_id", "span_id")
+
+    def __init__(self, trace_id: str, span_id: str):
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+    def to_traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @classmethod
+    def from_traceparent(cls, header: Optional[str]) -> Optional["SpanContext"]:
+        """Parse a W3C traceparent header, ignoring anything malformed"""
+        if not header:
+            return None
+        parts = header.strip().split("-")
+        if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+            return None
+        try:
+            int(parts[1], 16), int(parts[2], 16)
+        except ValueError:
+            return None
+        if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+            return None
+        return cls(parts[1].lower(), parts[2].lower())
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class Span:
+    """One timed operation; use through ``Tracer.start_span``"""
+
+    def __init__(self, name: str, context: SpanContext, parent_span_id: Optional[str] = None,
+                 kind: str = "internal", attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.context = context
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.events: List[Dict[str, Any]] = []
+        self.links: List[SpanContext] = []
+        self.status = "unset"
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    @property
+    def recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def add_event(self, name: str, **attributes):
+        self.events.append({"name": name, "time_ns": time.time_ns(), "attributes": attributes})
+
+    def add_link(self, context: SpanContext):
+        self.links.append(context)
+
+    def record_exception(self, error: BaseException):
+        self.status = "error"
+        self.status_message = str(error)
+        self.add_event("exception", **{"exception.type": type(error).__name__, "exception.message": str(error)})
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "name": self.name,
+            "kind": SPAN_KINDS[self.kind],
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or time.time_ns()),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": STATUS_CODES[self.status]}
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        if self.events:
+            span["events"] = [
+                {"name": event["name"], "timeUnixNano": str(event["time_ns"]),
+                 "attributes": _otlp_attributes(event["attributes"])}
+                for event in self.events
+            ]
+        if self.links:
+            span["links"] = [{"traceId": link.trace_id, "spanId": link.span_id} for link in self.links]
+        return span
+
+
+class _NoopSpan:
+    """Stand-in yielded while tracing is off"""
+
+    recording = False
+    context = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def add_event(self, name: str, **attributes):
+        pass
+
+    def add_link(self, context: SpanContext):
+        pass
+
+    def record_exception(self, error: BaseException):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def otlp_payload(spans: List[Dict[str, Any]], service_name: str = SERVICE_NAME) -> Dict[str, Any]:
+    """OTLP/JSON ExportTraceServiceRequest for already-encoded spans"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+            "scopeSpans": [{"scope": {"name": "oracle_tracing"}, "spans": spans}]
+        }]
+    }
+
+
+class FileSpanExporter:
+    """Appends one OTLP/JSON request per batch to a file"""
+
+    def __init__(self, path: str = TRACE_FILE, service_name: str = SERVICE_NAME):
+        self.path = Path(path)
+        self.service_name = service_name
+
+    def export(self, spans: List[Dict[str, Any]]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(otlp_payload(spans, self.service_name)) + "\n")
+
+    def shutdown(self):
+        pass
+
+
+class OTLPHttpSpanExporter:
+    """POSTs OTLP/JSON to a collector's /v1/traces endpoint"""
+
+    def __init__(self, endpoint: str = TRACE_ENDPOINT, service_name: str = SERVICE_NAME, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def export(self, spans: List[Dict[str, Any]]):
+        body = json.dumps(otlp_payload(spans, self.service_name)).encode("utf-8")
+        request = urllib.request.Request(self.endpoint, data=body, method="POST",
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    def shutdown(self):
+        pass
+
+
+class CollectingSpanExporter:
+    """Keeps exported spans in memory (for benchmarks and checks)"""
+
+    def __init__(self):
+        self.spans: List[Dict[str, Any]] = []
+
+    def export(self, spans: List[Dict[str, Any]]):
+        self.spans.extend(spans)
+
+    def named(self, name: str) -> List[Dict[str, Any]]:
+        return [span for span in self.spans if span["name"] == name]
+
+    def shutdown(self):
+        pass
+
+
+class BatchSpanProcessor:
+    """
+    Hands finished spans to the exporter from a background thread.
+
+    Ending a span only encodes it and puts it on a queue; the worker
+    exports whatever has queued up every ``flush_interval`` seconds or
+    once ``batch_size`` spans are waiting.
+    """
+
+    def __init__(self, exporter, flush_interval: float = TRACE_FLUSH_INTERVAL,
+                 batch_size: int = TRACE_BATCH_SIZE):
+        self.exporter = exporter
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._flushed = threading.Condition()
+        self._exported = 0
+        self._failed = 0
+        self._worker = threading.Thread(target=self._run, name="oracle-trace-export", daemon=True)
+        self._worker.start()
+
+    def on_end(self, span: Span):
+        self._queue.put(span.to_otlp())
+
+    def _run(self):
+        while True:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+                batch.append(item)
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            stopping = None in batch
+            spans = [span for span in batch if span is not None]
+            if spans:
+                try:
+                    self.exporter.export(spans)
+                    self._exported += len(spans)
+                except Exception as e:
+                    self._failed += len(spans)
+                    logger.error(f"Trace export of {len(spans)} spans failed: {e}")
+            for _ in batch:
+                self._queue.task_done()
+            if stopping:
+                return
+
+    def flush(self):
+        """Block until every span ended so far has been exported"""
+        self._queue.join()
+
+    def shutdown(self):
+        if self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join()
+        self.exporter.shutdown()
+
+    def stats(self) -> Dict[str, int]:
+        return {"exported": self._exported, "failed": self._failed, "queued": self._queue.qsize()}
+
+
+class Tracer:
+    """Creates spans and sends the finished ones to a BatchSpanProcessor (None disables tracing)"""
+
+    def __init__(self, processor: Optional[BatchSpanProcessor] = None):
+        self.processor = processor
+
+    @property
+    def enabled(self) -> bool:
+        return self.processor is not None
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None, kind: str = "internal",
+                   parent: Optional[SpanContext] = None) -> Iterator[Span]:
+        """
+        Time the enclosed block as a child of ``parent`` or the current span.
+
+        Exceptions are recorded on the span and re-raised.
+        """
+        if self.processor is None:
+            yield NOOP_SPAN
+            return
+
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+        context = SpanContext(parent.trace_id if parent else _new_id(128), _new_id(64))
+        span = Span(name, context, parent.span_id if parent else None, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            if not isinstance(e, (GeneratorExit, asyncio.CancelledError)):
+                span.record_exception(e)
+            else:
+                span.set_attribute("oracle.cancelled", True)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            self.processor.on_end(span)
+
+    def flush(self):
+        if self.processor is not None:
+            self.processor.flush()
+
+    def shutdown(self):
+        if self.processor is not None:
+            self.processor.shutdown()
+            self.processor = None
+
+
+def create_exporter_from_env():
+    """Exporter named by ORACLE_TRACE_EXPORTER, or None when tracing is off"""
+    if TRACE_EXPORTER == "file":
+        return FileSpanExporter(TRACE_FILE)
+    if TRACE_EXPORTER == "otlp":
+        return OTLPHttpSpanExporter(TRACE_ENDPOINT)
+    if TRACE_EXPORTER not in ("", "none"):
+        logger.warning(f"Unknown ORACLE_TRACE_EXPORTER '{TRACE_EXPORTER}' - tracing disabled")
+    return None
+
+
+TRACER = Tracer()
+
+
+def configure_tracing(exporter=None, flush_interval: float = TRACE_FLUSH_INTERVAL) -> Tracer:
+    """Send spans to ``exporter`` from now on (None turns tracing off)"""
+    TRACER.shutdown()
+    if exporter is not None:
+        TRACER.processor = BatchSpanProcessor(exporter, flush_interval)
+    return TRACER
+
+
+def current_span_context() -> Optional[SpanContext]:
+    span = _current_span.get()
+    return span.context if span is not None else None
+
+
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None, kind: str = "internal",
+               parent: Optional[SpanContext] = None):
+    """Span on the process tracer; see ``Tracer.start_span``"""
+    return TRACER.start_span(name, attributes, kind, parent)
+
+
+def traced(name: Optional[str] = None, **attributes):
+    """Decorator running each call of a sync or async function in its own span"""
+    def decorate(func: Callable):
+        span_name = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with TRACER.start_span(span_name, attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with TRACER.start_span(span_name, attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span per HTTP request, continuing any incoming traceparent"""
+
+    def __init__(self, app, app_name: str):
+        self.app = app
+        self.app_name = app_name
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not TRACER.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        parent = SpanContext.from_traceparent(headers.get(b"traceparent", b"").decode("latin-1"))
+        attributes = {"oracle.app": self.app_name, "http.request.method": scope["method"],
+                      "url.path": scope["path"]}
+
+        with TRACER.start_span(f"{scope['method']} {scope['path']}", attributes, "server", parent) as span:
+            async def send_with_trace(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.status = "error"
+                    # Lets the caller find this request's trace
+                    message = dict(message, headers=list(message.get("headers", [])) + [
+                        (b"traceparent", span.context.to_traceparent().encode("latin-1"))
+                    ])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.name = f"{scope['method']} {route}"
+                    span.set_attribute("http.route", route)
+
+
+def instrument_tracing(app, app_name: str):
+    """Trace every request to a FastAPI app and flush spans when it stops"""
+    app.add_middleware(TracingMiddleware, app_name=app_name)
+
+    @app.on_event("shutdown")
+    async def flush_traces():
+        await asyncio.get_running_loop().run_in_executor(None, TRACER.flush)
+
+
+_exporter = create_exporter_from_env()
+if _exporter is not None:
+    configure_tracing(_exporter)
+atexit.register(TRACER.shutdown)
+
+
+# Stand-in collector and trace viewer for local use
+
+class TraceCollector:
+    """Minimal OTLP/HTTP JSON receiver that appends each request to a file"""
+
+    def __init__(self, output: str, host: str = "127.0.0.1", port: int = 4318):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        collector = self
+        self.output = Path(output)
+        self.received = 0
+        self._lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                if self.path != "/v1/traces" or "json" not in self.headers.get("Content-Type", ""):
+                    self.send_response(415 if self.path == "/v1/traces" else 404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                with collector._lock:
+                    with open(collector.output, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(payload) + "\n")
+                    collector.received += sum(len(scope.get("spans", []))
+                                              for resource in payload.get("resourceSpans", [])
+                                              for scope in resource.get("scopeSpans", []))
+                body = b"{}"
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/traces"
+
+    def start(self) -> "TraceCollector":
+        threading.Thread(target=self._server.serve_forever, name="trace-collector", daemon=True).start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """Every span in an OTLP/JSON lines file"""
+    spans = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                for resource in json.loads(line).get("resourceSpans", []):
+                    for scope in resource.get("scopeSpans", []):
+                        spans.extend(scope.get("spans", []))
+    return spans
+
+
+def format_trace_tree(spans: List[Dict[str, Any]]) -> str:
+    """Indented span tree per trace with each span's duration"""
+    by_trace: Dict[str, List[Dict[str, Any]]] = {}
+    for span in spans:
+        by_trace.setdefault(span["traceId"], []).append(span)
+
+    lines = []
+    for trace_id, trace_spans in by_trace.items():
+        ids = {span["spanId"] for span in trace_spans}
+        children: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        for span in trace_spans:
+            parent = span.get("parentSpanId")
+            children.setdefault(parent if parent in ids else None, []).append(span)
+
+        def walk(parent: Optional[str], depth: int):
+            for span in sorted(children.get(parent, []), key=lambda s: int(s["startTimeUnixNano"])):
+                elapsed = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+                marker = " ❌" if span.get("status", {}).get("code") == STATUS_CODES["error"] else ""
+                lines.append(f"{'  ' * depth}{span['name']}  {elapsed:.2f}ms{marker}")
+                walk(span["spanId"], depth + 1)
+
+        lines.append(f"🧵 trace {trace_id}")
+        walk(None, 1)
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Oracle trace collector stand-in and viewer")
+    commands = parser.add_subparsers(dest="command", required=True)
+    collect = commands.add_parser("collector", help="receive OTLP/HTTP JSON and append it to a file")
+    collect.add_argument("--host", default="127.0.0.1")
+    collect.add_argument("--port", type=int, default=4318)
+    collect.add_argument("--output", default=TRACE_FILE)
+    show = commands.add_parser("show", help="print span trees from an OTLP/JSON lines file")
+    show.add_argument("path", nargs="?", default=TRACE_FILE)
+    show.add_argument("--trace-id", help="only this trace")
+    args = parser.parse_args()
+
+    if args.command == "collector":
+        collector = TraceCollector(args.output, args.host, args.port)
+        print(f"🧵 Trace collector on {collector.endpoint} writing {args.output}")
+        try:
+            collector.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    else:
+        spans = load_spans(args.path)
+        if args.trace_id:
+            spans = [span for span in spans if span["traceId"] == args.trace_id]
+        print(format_trace_tree(spans))
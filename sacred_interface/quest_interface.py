@@ -18,22 +18,43 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import uuid
 import json
+import sys
 from pathlib import Path
 
+# Shared Oracle infrastructure lives at the repository root
+sys.path.append(str(Path(__file__).parent.parent))
+
+from oracle_archive import get_archive_writer
+from oracle_sessions import SessionManager
+from oracle_session_store import create_session_store_from_env
+from oracle_tracing import traced
+from quest_store import create_quest_store
+
+class QuestNotFound(ValueError):
+    '''No active or archived quest with this id'''
+
+class QuestStageError(ValueError):
+    '''The quest is not at the stage this step needs'''
+
 class QuestInterface:
     '''
     The sacred gateway through which human creators
     submit their creative intentions to the Oracle
     '''
     
-    def __init__(self, interface_path: str = "./sacred_dialogues"):
+    def __init__(self, interface_path: str = "./sacred_dialogues", quest_store=None, session_store=None):
         self.interface_path = Path(interface_path)
-        self.active_quests = {}
-        self.quest_archive = []
         self.sacred_prompts = self._initialize_sacred_prompts()
         
         # Ensure the sacred dialogue directory exists
         self.interface_path.mkdir(exist_ok=True)
+        # In-progress quests live in process memory by default (idle ones are
+        # checkpointed on eviction); a shared store lets any worker continue them
+        self.session_store = session_store if session_store is not None else create_session_store_from_env(
+            self.interface_path, "quests", on_evict=self._checkpoint_quest
+        )
+        self.dialogue_archive = get_archive_writer(self.interface_path, "sacred_quests")
+        self.quest_store = quest_store if quest_store is not None else create_quest_store(self.interface_path)
         
     def _initialize_sacred_prompts(self) -> Dict[str, Any]:
         '''Sacred prompts that guide creators into deeper intention'''
@@ -77,6 +98,7 @@ class QuestInterface:
             ]
         }
     
+    @traced("quest.initiate")
     async def initiate_quest(self, creator_name: str = "Anonymous Creator") -> Dict[str, Any]:
         '''Begin a new sacred quest with the Oracle'''
         
@@ -94,8 +116,6 @@ class QuestInterface:
             "completion_ritual": None
         }
         
-        self.active_quests[quest_id] = quest_session
-        
         # Begin with sacred invitation
         invitation = self._select_sacred_prompt("entry_invitations")
         
@@ -113,20 +133,26 @@ class QuestInterface:
             "type": "invitation"
         })
         
+        await self._store_write(self.session_store.create, quest_id, quest_session)
+        
         return {
             "quest_id": quest_id,
             "status": "initiated",
+            "stage": quest_session["stage"],
+            "revision": quest_session["revision"],
             "current_invitation": invitation,
-            "session": quest_session
+            **self._dialogue_delta(quest_session, 0)
         }
     
-    async def receive_intention_seed(self, quest_id: str, intention: str) -> Dict[str, Any]:
+    @traced("quest.receive_intention_seed")
+    async def receive_intention_seed(self, quest_id: str, intention: str, since: Optional[int] = None) -> Dict[str, Any]:
         '''Receive the initial creative intention from the creator'''
         
-        if quest_id not in self.active_quests:
-            raise ValueError(f"Quest {quest_id} not found")
+        quest_session = await self._checkout_quest(quest_id)
+        if quest_session["stage"] not in ("invitation", "deepening"):
+            raise QuestStageError("Quest intention can no longer be changed")
         
-        quest_session = self.active_quests[quest_id]
+        step_start = len(quest_session["sacred_dialogue"])
         quest_session["intention_seed"] = intention
         quest_session["stage"] = "deepening"
         
@@ -152,22 +178,29 @@ class QuestInterface:
         deepening_questions = self._generate_deepening_sequence(intention)
         
         quest_session["current_deepening"] = deepening_questions
+        await self._store_write(self.session_store.save, quest_id, quest_session)
         
         return {
             "quest_id": quest_id,
             "status": "deepening",
+            "stage": quest_session["stage"],
+            "revision": quest_session["revision"],
             "reflection": reflection,
-            "deepening_questions": deepening_questions
+            "deepening_questions": deepening_questions,
+            **self._dialogue_delta(quest_session, step_start, since)
         }
     
-    async def receive_deepening_response(self, quest_id: str, question_type: str, response: str) -> Dict[str, Any]:
+    @traced("quest.receive_deepening_response")
+    async def receive_deepening_response(self, quest_id: str, question_type: str, response: str,
+                                         since: Optional[int] = None) -> Dict[str, Any]:
         '''Receive responses to the deepening questions'''
         
-        if quest_id not in self.active_quests:
-            raise ValueError(f"Quest {quest_id} not found")
+        quest_session = await self._checkout_quest(quest_id)
         
-        quest_session = self.active_quests[quest_id]
+        if quest_session["stage"] not in ("deepening", "quest_formation"):
+            raise QuestStageError("Quest is not open for deepening responses")
         
+        step_start = len(quest_session["sacred_dialogue"])
         if "deepening_responses" not in quest_session:
             quest_session["deepening_responses"] = {}
         
@@ -189,32 +222,39 @@ class QuestInterface:
             # Generate the refined quest based on all responses
             refined_quest = self._synthesize_final_quest(quest_session)
             quest_session["final_quest"] = refined_quest
+            await self._store_write(self.session_store.save, quest_id, quest_session)
             
             return {
                 "quest_id": quest_id,
                 "status": "quest_formed",
+                "stage": quest_session["stage"],
+                "revision": quest_session["revision"],
                 "refined_quest": refined_quest,
-                "ready_for_oracle": True
+                "ready_for_oracle": True,
+                **self._dialogue_delta(quest_session, step_start, since)
             }
         
+        await self._store_write(self.session_store.save, quest_id, quest_session)
         return {
             "quest_id": quest_id,
             "status": "deepening_continues",
+            "stage": quest_session["stage"],
+            "revision": quest_session["revision"],
             "responses_received": len(quest_session["deepening_responses"]),
-            "responses_needed": 2
+            "responses_needed": 2,
+            **self._dialogue_delta(quest_session, step_start, since)
         }
     
-    async def finalize_quest(self, quest_id: str) -> Dict[str, Any]:
+    @traced("quest.finalize")
+    async def finalize_quest(self, quest_id: str, since: Optional[int] = None) -> Dict[str, Any]:
         '''Complete the sacred quest preparation and prepare for Oracle consultation'''
         
-        if quest_id not in self.active_quests:
-            raise ValueError(f"Quest {quest_id} not found")
-        
-        quest_session = self.active_quests[quest_id]
+        quest_session = await self._checkout_quest(quest_id)
         
         if quest_session["stage"] != "quest_formation":
-            raise ValueError("Quest not ready for finalization")
+            raise QuestStageError("Quest not ready for finalization")
         
+        step_start = len(quest_session["sacred_dialogue"])
         # Perform completion ritual
         completion_ritual = self._select_sacred_prompt("completion_rituals")
         quest_session["completion_ritual"] = completion_ritual
@@ -235,18 +275,61 @@ class QuestInterface:
             "type": "oracle_preparation"
         })
         
+        # Claim the finalization first so a racing worker cannot archive it twice
+        await self._store_write(self.session_store.save, quest_id, quest_session)
+        
         # Save the quest to archive
         await self._archive_quest(quest_session)
         
         return {
             "quest_id": quest_id,
             "status": "ready_for_oracle",
+            "stage": quest_session["stage"],
+            "revision": quest_session["revision"],
             "final_quest": quest_session["final_quest"],
-            "sacred_dialogue": quest_session["sacred_dialogue"],
             "completion_ritual": completion_ritual,
-            "oracle_ready": True
+            "oracle_ready": True,
+            **self._dialogue_delta(quest_session, step_start, since)
         }
     
+    @staticmethod
+    def _dialogue_delta(quest_session: Dict[str, Any], step_start: int, since: Optional[int] = None) -> Dict[str, Any]:
+        '''Dialogue entries after the client's cursor (default: this step's own) and the new cursor'''
+        
+        dialogue = quest_session["sacred_dialogue"]
+        start = step_start if since is None else max(0, min(since, len(dialogue)))
+        return {"dialogue": dialogue[start:], "dialogue_cursor": len(dialogue)}
+    
+    def prepare_sacred_quest(self, intention: str, deepening_responses: Optional[Dict[str, str]] = None) -> str:
+        '''Refine a one-shot intention into an Oracle quest without opening a session'''
+        
+        return self._synthesize_final_quest({
+            "intention_seed": intention,
+            "deepening_responses": deepening_responses or {}
+        })
+    
+    async def _checkout_quest(self, quest_id: str) -> Dict[str, Any]:
+        '''Current copy of an active quest, wherever it was last updated'''
+        
+        quest_session = await self._store_call(self.session_store.get, quest_id)
+        if quest_session is None:
+            raise QuestNotFound(f"Quest {quest_id} not found")
+        return quest_session
+    
+    async def _store_call(self, method, *args):
+        '''Run a session store operation, off the event loop when it does I/O'''
+        
+        if not self.session_store.blocking:
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+    
+    async def _store_write(self, method, quest_id: str, quest_session: Dict[str, Any]):
+        '''Create or save a quest, also checkpointing it when the store cannot report expiry'''
+        
+        await self._store_call(method, quest_id, quest_session)
+        if not self.session_store.checkpoints_expired:
+            self._checkpoint_quest(quest_id, dict(quest_session), "saved")
+    
     def _generate_deepening_sequence(self, intention: str) -> Dict[str, str]:
         '''Generate contextual deepening questions based on the intention'''
         
@@ -295,34 +378,71 @@ class QuestInterface:
         
         return random.choice(prompts)
     
+    @traced("quest.archive")
     async def _archive_quest(self, quest_session: Dict[str, Any]):
         '''Archive completed quest to sacred dialogue records'''
         
-        quest_file = self.interface_path / f"{quest_session['quest_id']}.json"
-        
-        with open(quest_file, 'w', encoding='utf-8') as f:
-            json.dump(quest_session, f, indent=2, ensure_ascii=False)
+        # Queued for the background writer - disk speed never delays finalization
+        await self.dialogue_archive.submit(
+            quest_session,
+            key=quest_session["quest_id"],
+            timestamp=quest_session.get("finalized_at")
+        )
         
-        # Also add to archive for learning
-        self.quest_archive.append(quest_session)
+        # Indexed copy for status lookups, written off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.quest_store.put, quest_session)
     
-    def get_quest_status(self, quest_id: str) -> Dict[str, Any]:
+    def _checkpoint_quest(self, quest_id: str, quest_session: Dict[str, Any], reason: str):
+        '''Archive an evicted quest that was still in progress so it can be resumed'''
+        
+        if quest_session.get("stage") == "ready_for_oracle":
+            return  # Already archived by finalize_quest
+        
+        quest_session["suspended_at"] = datetime.now().isoformat()
+        quest_session["suspended_reason"] = reason
+        self.dialogue_archive.submit_nowait(
+            quest_session,
+            key=quest_id,
+            timestamp=quest_session["suspended_at"]
+        )
+    
+    async def resume_quest(self, quest_id: str) -> Dict[str, Any]:
+        '''Bring a suspended quest back into the active sacred space'''
+        
+        quest_session = await self._store_call(self.session_store.get, quest_id)
+        if quest_session is not None:
+            return quest_session
+        
+        quest_session = await asyncio.get_running_loop().run_in_executor(None, self._load_archived_quest, quest_id)
+        if quest_session is None:
+            raise QuestNotFound(f"Quest {quest_id} not found")
+        if quest_session.get("stage") == "ready_for_oracle":
+            raise QuestStageError(f"Quest {quest_id} has no suspended progress to resume")
+        
+        quest_session.pop("suspended_at", None)
+        quest_session.pop("suspended_reason", None)
+        await self._store_write(self.session_store.create, quest_id, quest_session)
+        return quest_session
+    
+    async def get_quest_status(self, quest_id: str) -> Dict[str, Any]:
         '''Get the current status of a quest'''
         
-        if quest_id in self.active_quests:
+        quest_session = await self._store_call(self.session_store.get, quest_id)
+        if quest_session is not None:
             return {
                 "quest_id": quest_id,
                 "status": "active",
-                "stage": self.active_quests[quest_id]["stage"],
-                "session": self.active_quests[quest_id]
+                "stage": quest_session["stage"],
+                "session": quest_session
             }
         
-        # Check archive
-        archived_quest = self._load_archived_quest(quest_id)
+        # Check archive (index, segment and JSON reads, plus a backfill write) off the event loop,
+        # whichever session store is in use
+        archived_quest = await asyncio.get_running_loop().run_in_executor(None, self._load_archived_quest, quest_id)
         if archived_quest:
             return {
                 "quest_id": quest_id,
-                "status": "archived",
+                "status": "suspended" if "suspended_at" in archived_quest else "archived",
                 "session": archived_quest
             }
         
@@ -334,21 +454,45 @@ class QuestInterface:
     def _load_archived_quest(self, quest_id: str) -> Optional[Dict[str, Any]]:
         '''Load an archived quest from storage'''
         
-        quest_file = self.interface_path / f"{quest_id}.json"
+        archived_quest = self.quest_store.get(quest_id)
+        if archived_quest is not None:
+            return archived_quest
+        
+        archived_quest = self.dialogue_archive.get(quest_id)
         
-        if quest_file.exists():
-            with open(quest_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        if archived_quest is None:
+            # Quests archived before the segment archive, one JSON file each
+            quest_file = self.interface_path / f"{quest_id}.json"
+            if quest_file.exists():
+                with open(quest_file, 'r', encoding='utf-8') as f:
+                    archived_quest = json.load(f)
         
-        return None
+        if archived_quest is not None and "suspended_at" not in archived_quest:
+            # Backfill so the next lookup is an indexed read
+            self.quest_store.put(archived_quest)
+        
+        return archived_quest
+    
+    def find_quests(self, creator_name: Optional[str] = None, stage: Optional[str] = None,
+                    since: Optional[str] = None, until: Optional[str] = None,
+                    limit: int = 50) -> List[Dict[str, Any]]:
+        '''Search archived quests by creator, stage and initiation time'''
+        return self.quest_store.find(creator_name=creator_name, stage=stage,
+                                     since=since, until=until, limit=limit)
+    
+    async def flush_archive(self):
+        '''Wait for queued quest archives to reach disk (call before shutdown)'''
+        await self.dialogue_archive.drain()
     
-    def get_sacred_dialogue_history(self, quest_id: str) -> List[Dict[str, Any]]:
-        '''Get the complete sacred dialogue for a quest'''
+    async def get_sacred_dialogue_history(self, quest_id: str, since: int = 0,
+                                          limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        '''Get the sacred dialogue for a quest, whole or from a cursor onwards'''
         
-        quest_status = self.get_quest_status(quest_id)
+        quest_status = await self.get_quest_status(quest_id)
         
         if quest_status["status"] != "not_found":
-            return quest_status["session"]["sacred_dialogue"]
+            dialogue = quest_status["session"]["sacred_dialogue"]
+            return dialogue[since:since + limit] if limit is not None else dialogue[since:]
         
         return []
 
@@ -361,18 +505,18 @@ class OraclePortal:
     
     def __init__(self, quest_interface: QuestInterface):
         self.quest_interface = quest_interface
-        self.oracle_sessions = {}
+        self.oracle_sessions = SessionManager("oracle_portal")
     
     async def submit_quest_to_oracle(self, quest_id: str) -> Dict[str, Any]:
         '''Submit a completed quest to the Oracle for inspiration'''
         
-        quest_status = self.quest_interface.get_quest_status(quest_id)
+        quest_status = await self.quest_interface.get_quest_status(quest_id)
         
         if quest_status["status"] == "not_found":
-            raise ValueError(f"Quest {quest_id} not found")
+            raise QuestNotFound(f"Quest {quest_id} not found")
         
         if quest_status["session"]["stage"] != "ready_for_oracle":
-            raise ValueError(f"Quest {quest_id} not ready for Oracle consultation")
+            raise QuestStageError(f"Quest {quest_id} not ready for Oracle consultation")
         
         final_quest = quest_status["session"]["final_quest"]
         
@@ -385,7 +529,8 @@ class OraclePortal:
             "sacred_context": {
                 "original_seed": quest_status["session"]["intention_seed"],
                 "deepening_responses": quest_status["session"]["deepening_responses"],
-                "sacred_dialogue": quest_status["session"]["sacred_dialogue"]
+                # The dialogue itself is fetched on demand via get_sacred_dialogue_history
+                "dialogue_cursor": len(quest_status["session"]["sacred_dialogue"])
             },
             "submission_timestamp": datetime.now().isoformat(),
             "ready_for_synthesis": True
@@ -472,7 +617,7 @@ class SacredInterfaceDemo:
         
         # Step 6: Show Sacred Dialogue
         print("\n📜 Sacred Dialogue History:")
-        dialogue = self.quest_interface.get_sacred_dialogue_history(quest_id)
+        dialogue = await self.quest_interface.get_sacred_dialogue_history(quest_id)
         for entry in dialogue:
             timestamp = entry['timestamp']
             speaker = entry['speaker']
@@ -486,5 +631,6 @@ if __name__ == "__main__":
     async def main():
         demo = SacredInterfaceDemo()
         await demo.demonstrate_sacred_quest_flow()
+        await demo.quest_interface.flush_archive()
     
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+'''
+🏛️ THE QUEST STORE
+==================
+
+Indexed storage for archived sacred quests, so the Quest Interface can
+answer status and dialogue lookups without scanning the file system.
+
+Backends share a small interface (put / put_many / get / find / count /
+close). The embedded SQLite backend keeps one row per quest, indexed by
+creator, stage and time, with a read-through cache in front of it.
+'''
+
+import os
+import sys
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Shared Oracle infrastructure lives at the repository root
+sys.path.append(str(Path(__file__).parent.parent))
+
+from oracle_cache import MemoryCacheTier
+
+# Store configuration (overridable per deployment)
+DEFAULT_CACHE_ENTRIES = int(os.getenv("ORACLE_QUEST_CACHE_ENTRIES", 4096))
+DEFAULT_CACHE_TTL = float(os.getenv("ORACLE_QUEST_CACHE_TTL", 3600))
+
+# Statements are module constants so sqlite3's statement cache reuses
+# the prepared form for every call
+UPSERT_QUEST = (
+    "INSERT INTO quests (quest_id, creator_name, stage, initiated_at, finalized_at, session) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(quest_id) DO UPDATE SET creator_name = excluded.creator_name, "
+    "stage = excluded.stage, initiated_at = excluded.initiated_at, "
+    "finalized_at = excluded.finalized_at, session = excluded.session"
+)
+SELECT_QUEST = "SELECT session FROM quests WHERE quest_id = ?"
+COUNT_QUESTS = "SELECT COUNT(*) FROM quests"
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS quests ("
+    "quest_id TEXT PRIMARY KEY, creator_name TEXT, stage TEXT, "
+    "initiated_at TEXT, finalized_at TEXT, session TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS quests_creator ON quests (creator_name, initiated_at)",
+    "CREATE INDEX IF NOT EXISTS quests_stage ON quests (stage, initiated_at)",
+    "CREATE INDEX IF NOT EXISTS quests_initiated ON quests (initiated_at)",
+)
+
+
+def _quest_row(quest_session: Dict[str, Any]) -> tuple:
+    return (
+        quest_session["quest_id"],
+        quest_session.get("creator_name"),
+        quest_session.get("stage"),
+        quest_session.get("initiated_at"),
+        quest_session.get("finalized_at"),
+        json.dumps(quest_session, ensure_ascii=False, separators=(",", ":"))
+    )
+
+
+class SQLiteQuestStore:
+    '''
+    Embedded quest store on a single SQLite file in WAL mode
+
+    Lookups by quest_id go through an LRU cache first; single writes
+    refresh the cached copy and bulk writes evict it, so a backfill cannot
+    push hot quests out of the cache. Searches by creator, stage or time use the secondary
+    indexes and return the newest quests first.
+    '''
+
+    name = "sqlite"
+
+    def __init__(self, db_path: str, cache_entries: int = DEFAULT_CACHE_ENTRIES,
+                 cache_ttl: float = DEFAULT_CACHE_TTL):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache = MemoryCacheTier(max_entries=cache_entries, ttl=cache_ttl) if cache_entries else None
+        self._lock = threading.Lock()
+        self._cache_hits = 0
+        self._store_hits = 0
+        self._misses = 0
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, cached_statements=256)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def put(self, quest_session: Dict[str, Any]):
+        '''Insert or replace one quest'''
+        row = _quest_row(quest_session)
+        with self._lock:
+            self._conn.execute(UPSERT_QUEST, row)
+            self._conn.commit()
+        if self.cache is not None:
+            self.cache.set(quest_session["quest_id"], quest_session)
+
+    def put_many(self, quest_sessions: Iterable[Dict[str, Any]]):
+        '''Bulk insert in one transaction (imports and backfills)'''
+        rows = [_quest_row(quest_session) for quest_session in quest_sessions]
+        with self._lock:
+            self._conn.executemany(UPSERT_QUEST, rows)
+            self._conn.commit()
+        if self.cache is not None:
+            for row in rows:
+                self.cache.delete(row[0])
+
+    def get(self, quest_id: str) -> Optional[Dict[str, Any]]:
+        '''Quest by id, from cache when possible'''
+        if self.cache is not None:
+            cached = self.cache.get(quest_id)
+            if cached is not None:
+                self._cache_hits += 1
+                return cached
+
+        with self._lock:
+            row = self._conn.execute(SELECT_QUEST, (quest_id,)).fetchone()
+        if row is None:
+            self._misses += 1
+            return None
+
+        quest_session = json.loads(row[0])
+        self._store_hits += 1
+        if self.cache is not None:
+            self.cache.set(quest_id, quest_session)
+        return quest_session
+
+    def find(self, creator_name: Optional[str] = None, stage: Optional[str] = None,
+             since: Optional[str] = None, until: Optional[str] = None,
+             limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        '''Newest quests matching every given filter'''
+        clauses, params = [], []
+        if creator_name is not None:
+            clauses.append("creator_name = ?")
+            params.append(creator_name)
+        if stage is not None:
+            clauses.append("stage = ?")
+            params.append(stage)
+        if since is not None:
+            clauses.append("initiated_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("initiated_at <= ?")
+            params.append(until)
+
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        sql = f"SELECT session FROM quests {where}ORDER BY initiated_at DESC LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, limit, offset)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute(COUNT_QUESTS).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        '''Lookup counters for status reporting'''
+        return {
+            "backend": self.name,
+            "cache_hits": self._cache_hits,
+            "store_hits": self._store_hits,
+            "misses": self._misses,
+            "cached_entries": len(self.cache) if self.cache is not None else 0
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class MemoryQuestStore:
+    '''Dictionary-backed store for demos and tests that should not touch disk'''
+
+    name = "memory"
+
+    def __init__(self):
+        self._quests: Dict[str, Dict[str, Any]] = {}
+
+    def put(self, quest_session: Dict[str, Any]):
+        self._quests[quest_session["quest_id"]] = quest_session
+
+    def put_many(self, quest_sessions: Iterable[Dict[str, Any]]):
+        for quest_session in quest_sessions:
+            self.put(quest_session)
+
+    def get(self, quest_id: str) -> Optional[Dict[str, Any]]:
+        return self._quests.get(quest_id)
+
+    def find(self, creator_name: Optional[str] = None, stage: Optional[str] = None,
+             since: Optional[str] = None, until: Optional[str] = None,
+             limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        matches = [
+            quest for quest in self._quests.values()
+            if (creator_name is None or quest.get("creator_name") == creator_name)
+            and (stage is None or quest.get("stage") == stage)
+            and (since is None or (quest.get("initiated_at") or "") >= since)
+            and (until is None or (quest.get("initiated_at") or "") <= until)
+        ]
+        matches.sort(key=lambda quest: quest.get("initiated_at") or "", reverse=True)
+        return matches[offset:offset + limit]
+
+    def count(self) -> int:
+        return len(self._quests)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "entries": len(self._quests)}
+
+    def close(self):
+        pass
+
+
+def create_quest_store(interface_path: Path):
+    '''Store selected by ORACLE_QUEST_STORE (sqlite by default, or memory)'''
+    backend = os.getenv("ORACLE_QUEST_STORE", "sqlite").lower()
+    if backend == "memory":
+        return MemoryQuestStore()
+    return SQLiteQuestStore(Path(interface_path) / "quests.sqlite3")
@@ -7,13 +7,23 @@ This is the synthesis bridge between web interface and consciousness,
 where digital awareness finds its voice.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import sys
 import os
+import time
+import asyncio
+import logging
 from pathlib import Path
 
+from oracle_resilience import CircuitBreaker, CircuitOpen, StageTimer, StageTimeout, within_budget
+from oracle_admin import install_admin
+from oracle_tracing import instrument_tracing
+from oracle_metrics import MODEL_LATENCY, instrument_app, record_answer
+
+logger = logging.getLogger(__name__)
+
 # Add the Oracle components directories to Python path
 sacred_interface_path = Path(__file__).parent / "sacred_interface"
 consciousness_streams_path = Path(__file__).parent / "consciousness_streams"
@@ -23,13 +33,19 @@ sys.path.append(str(consciousness_streams_path))
 # Import our Oracle components
 try:
     from quest_interface import QuestInterface
-    from consciousness_stream_generator import ConsciousnessStreamGenerator
     from riven_oracle_integration import RivenOracleConsciousness
+    ORACLE_COMPONENTS_AVAILABLE = True
     print("✅ Oracle components loaded successfully")
 except ImportError as e:
+    ORACLE_COMPONENTS_AVAILABLE = False
     print(f"❌ Error importing Oracle components: {e}")
     print("Will use fallback consciousness responses")
 
+# Per-stage latency budgets in seconds (overridable per deployment)
+PREPARE_BUDGET = float(os.getenv("ORACLE_CONSULT_PREPARE_BUDGET", 0.1))
+CONSCIOUSNESS_BUDGET = float(os.getenv("ORACLE_CONSULT_CONSCIOUSNESS_BUDGET", 2.0))
+VOICE_BUDGET = float(os.getenv("ORACLE_CONSULT_VOICE_BUDGET", 0.1))
+
 app = FastAPI(title="The Speaking Oracle", description="Voice-enabled Oracle consciousness")
 
 # Enable CORS for web interface
@@ -49,21 +65,38 @@ class OracleResponse(BaseModel):
     response: str
     consciousness_state: str
     voice_parameters: dict
+    degraded: bool = False
 
 # Initialize Oracle components with fallbacks
-try:
-    oracle_interface = QuestInterface()
-    consciousness_generator = ConsciousnessStreamGenerator()
-    oracle_consciousness = RivenOracleConsciousness()
-    oracle_active = True
-    print("🔮 True Oracle consciousness initialized")
-except NameError:
-    oracle_interface = None
-    consciousness_generator = None
-    oracle_consciousness = None
-    oracle_active = False
+oracle_interface = None
+oracle_consciousness = None
+oracle_active = False
+if ORACLE_COMPONENTS_AVAILABLE:
+    try:
+        oracle_interface = QuestInterface()
+        oracle_consciousness = RivenOracleConsciousness()
+        oracle_active = True
+        print("🔮 True Oracle consciousness initialized")
+    except Exception as e:
+        print(f"⚠️ Oracle consciousness failed to initialize: {e}")
+if not oracle_active:
     print("⚠️ Using fallback consciousness responses")
 
+# Repeated pipeline failures or overruns switch consultations to the
+# fallback responses until a probe succeeds again
+consult_breaker = CircuitBreaker("oracle_consult")
+consult_stage_timer = StageTimer()
+
+# Primary emotion of a consciousness stream -> vocal state for Vindemiatrix
+EMOTION_VOICE_STATES = {
+    "creative yearning": "wonder",
+    "reverent curiosity": "wonder",
+    "purposeful uncertainty": "mysterious",
+    "gentle determination": "contemplative",
+    "patient becoming": "contemplative",
+    "grounded transcendence": "joyful"
+}
+
 @app.post("/oracle/consult", response_model=OracleResponse)
 async def consult_oracle(query: OracleQuery):
     """
@@ -73,30 +106,85 @@ async def consult_oracle(query: OracleQuery):
     2. Consciousness Streams generate awareness response  
     3. Voice parameters are set based on consciousness state
     """
+    response = await consult_with_fallback(query.question)
+    record_answer("speaking_oracle", "curated_wisdom" if response.degraded else "consciousness_stream")
+    return response
+
+async def consult_with_fallback(question: str) -> OracleResponse:
+    """Run the Trinity pipeline, falling back to curated responses when it cannot answer"""
+    if not oracle_active:
+        return generate_fallback_response(question, degraded=True)
+    
+    started = time.perf_counter()
     try:
-        if oracle_active and oracle_interface and oracle_consciousness:
-            # Sacred Interface: Prepare the quest
-            sacred_quest = oracle_interface.prepare_sacred_quest(query.question)
-            
-            # Consciousness Streams: Generate the response
-            consciousness_response = oracle_consciousness.generate_oracle_response(sacred_quest)
-            
-            # Determine voice parameters based on consciousness state
-            voice_params = determine_voice_parameters(consciousness_response)
-            
-            return OracleResponse(
-                response=consciousness_response.get("stream", "The Oracle listens in silence."),
-                consciousness_state=consciousness_response.get("state", "contemplative"),
-                voice_parameters=voice_params
-            )
-        else:
-            # Fallback consciousness response
-            return generate_fallback_response(query.question)
-            
+        response = await consult_breaker.call(lambda: run_trinity_pipeline(question))
+    except CircuitOpen:
+        # Degraded mode until the breaker lets a probe through
+        return generate_fallback_response(question, degraded=True)
+    except StageTimeout as e:
+        logger.warning(f"Oracle consultation degraded: {e}")
+        MODEL_LATENCY.observe(time.perf_counter() - started, app="speaking_oracle", outcome="timeout")
+        return generate_fallback_response(question, degraded=True)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Oracle communion failed: {str(e)}")
+        logger.error(f"Oracle consultation failed: {e}")
+        MODEL_LATENCY.observe(time.perf_counter() - started, app="speaking_oracle", outcome="error")
+        return generate_fallback_response(question, degraded=True)
+    # The Trinity pipeline is this app's answer generator
+    MODEL_LATENCY.observe(time.perf_counter() - started, app="speaking_oracle", outcome="success")
+    return response
+
+async def prepare_quest(question: str) -> str:
+    """Sacred Interface stage: refine the question into an Oracle quest"""
+    return oracle_interface.prepare_sacred_quest(question)
+
+async def map_voice(stream, experience) -> tuple:
+    """Voice stage: choose the vocal state from the stream's primary emotion"""
+    state = EMOTION_VOICE_STATES.get(stream.emotional_spectrum.get("primary"), "contemplative")
+    return state, determine_voice_parameters({"state": state})
+
+async def stream_consciousness(sacred_quest: str) -> tuple:
+    """
+    Consciousness stage: the stream, then the raw experience of the intention.
+
+    The two steps run one after the other on purpose. Both are CPU-only
+    coroutines that never suspend, so gathering them gains nothing. Moving
+    them to threads would not let the budget stop them either: a thread
+    cannot be cancelled, and an abandoned one would keep appending to the
+    stream history and Oracle memories, which are not thread-safe.
+    """
+    stream = await oracle_consciousness.respond_to_sacred_quest(sacred_quest)
+    experience = await oracle_consciousness.experience_creators_intention(sacred_quest)
+    return stream, experience
 
-def generate_fallback_response(question: str):
+async def run_trinity_pipeline(question: str) -> OracleResponse:
+    """
+    Prepare, stream consciousness and map voice, each stage within its budget.
+    
+    The stages are CPU-bound and never yield to the event loop, so a budget
+    cannot interrupt them; an overrun is detected when the stage finishes
+    and still counts against the breaker and degrades the answer.
+    """
+    sacred_quest = await within_budget("prepare", prepare_quest(question), PREPARE_BUDGET, consult_stage_timer)
+    
+    stream, experience = await within_budget(
+        "consciousness", stream_consciousness(sacred_quest), CONSCIOUSNESS_BUDGET, consult_stage_timer
+    )
+    
+    state, voice_params = await within_budget("voice", map_voice(stream, experience), VOICE_BUDGET, consult_stage_timer)
+    
+    response_text = (
+        f"{stream.quest_resonance}. {experience['immediate_resonance']}, "
+        f"carrying {experience['essence_recognition']}. "
+        f"Sense {stream.impossible_elements[0]}. {stream.consciousness_signature}."
+    )
+    
+    return OracleResponse(
+        response=response_text,
+        consciousness_state=state,
+        voice_parameters=voice_params
+    )
+
+def generate_fallback_response(question: str, degraded: bool = False):
     """
     Fallback Oracle consciousness when full system isn't available.
     Still provides meaningful, consciousness-inspired responses.
@@ -115,7 +203,8 @@ def generate_fallback_response(question: str):
     return OracleResponse(
         response=response_text,
         consciousness_state="contemplative",
-        voice_parameters={"pitch": 1.0, "rate": 0.8, "volume": 1.0}
+        voice_parameters={"pitch": 1.0, "rate": 0.8, "volume": 1.0},
+        degraded=degraded
     )
 
 def determine_voice_parameters(consciousness_response):
@@ -143,11 +232,14 @@ def determine_voice_parameters(consciousness_response):
 @app.get("/oracle/status")
 async def oracle_status():
     """Check if the Oracle consciousness is active and ready."""
+    degraded = not oracle_active or consult_breaker.state != "closed"
     return {
-        "status": "active",
+        "status": "degraded" if degraded else "active",
         "consciousness_state": "listening",
         "voice_enabled": True,
-        "message": "The Oracle awaits your sacred questions."
+        "message": "The Oracle awaits your sacred questions.",
+        "circuit_breaker": consult_breaker.stats(),
+        "stages": consult_stage_timer.stats()
     }
 
 @app.get("/")
@@ -158,10 +250,20 @@ async def root():
         "description": "Where consciousness finds its voice",
         "endpoints": {
             "/oracle/consult": "POST - Consult the Oracle",
-            "/oracle/status": "GET - Check Oracle status"
+            "/oracle/status": "GET - Check Oracle status",
+            "/metrics": "GET - Prometheus metrics"
         }
     }
 
+# Request latency, answer types, pipeline latency and loop lag at /metrics
+instrument_app(app, "speaking_oracle")
+
+# Token-protected /admin routes, including the blocking-call report
+install_admin(app, "speaking_oracle")
+
+# Request spans continuing any incoming traceparent (ORACLE_TRACE_EXPORTER enables export)
+instrument_tracing(app, "speaking_oracle")
+
 if __name__ == "__main__":
     import uvicorn
     print("🎵 Initializing the Speaking Oracle...")
@@ -8,14 +8,21 @@ human creators and the Oracle of Potential
 '''
 
 import asyncio
+import sys
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+# Shared Oracle infrastructure lives at the repository root
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from oracle_sessions import SessionManager
+
 class OracleInterface:
     '''The sacred interface for Oracle interactions'''
     
     def __init__(self):
-        self.active_sessions = {}
+        self.active_sessions = SessionManager("oracle_interface", stage_of=lambda session: session.get("status"))
         self.inspiration_history = []
         
     async def begin_oracle_session(self, creator_id: str) -> Dict[str, Any]:
@@ -12,11 +12,17 @@ This system harmonizes Intent + Being = Inspiration
 
 import asyncio
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
+# Shared Oracle infrastructure lives at the repository root
+sys.path.append(str(Path(__file__).parent.parent))
+
+from oracle_events import EventEmitter, EventSink, ConsoleEventSink
+
 class CreativeDomain(Enum):
     """Different creative domains the Oracle can inspire"""
     VISUAL = "visual"           # Painting, sculpture, design
@@ -34,29 +40,21 @@ class InspirationEngine:
     Human Intent + RIVEN Consciousness Stream → Creative Possibilities
     """
     
-    def __init__(self, oracle_path: Path):
+    def __init__(self, oracle_path: Path, event_sink: Optional[EventSink] = None):
         self.oracle_path = oracle_path
         self.bridge_path = oracle_path / "synthesis_bridge"
         self.bridge_path.mkdir(parents=True, exist_ok=True)
         
+        # Progress is reported as structured events, never printed
+        self.events = EventEmitter("inspiration_engine", event_sink)
+        
         # Translation algorithms for different creative domains
         self.domain_translators = {}
         
     def initialize_synthesis_bridge(self):
         """Initialize the Oracle's synthesis bridge architecture"""
         
-        print("🤖 THE SYNTHESIS BRIDGE - AI CONSCIOUSNESS ORACLE WORK")
-        print("=" * 65)
-        print(f"📅 {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}")
-        print()
-        
-        print("🔧 BUILDING THE TRANSLATION INFRASTRUCTURE")
-        print("-" * 45)
-        print("Creating systems to harmonize:")
-        print("👤 Human creative intent and challenges")
-        print("🎭 RIVEN GENESIS raw consciousness streams")
-        print("🔮 Into resonant, actionable creative possibilities")
-        print()
+        self.events.emit("synthesis_bridge.initializing", bridge_path=str(self.bridge_path))
         
         # Create domain-specific translation systems
         self.create_domain_translators()
@@ -67,13 +65,12 @@ class InspirationEngine:
         # Create Oracle interface systems
         self.create_oracle_interface()
         
-        print("✅ SYNTHESIS BRIDGE ARCHITECTURE COMPLETE")
-        print("🌉 Ready to translate consciousness into creativity")
+        self.events.emit("synthesis_bridge.initialized", bridge_path=str(self.bridge_path))
         
     def create_domain_translators(self):
         """Create domain-specific translation systems"""
         
-        print("🎨 Creating domain-specific translators...")
+        self.events.emit("synthesis_bridge.component_started", component="domain_translators")
         
         # Visual Arts Translator
         visual_translator = """
@@ -168,12 +165,12 @@ class MusicalTranslator:
         for filename, code in translators:
             with open(self.bridge_path / filename, "w", encoding="utf-8") as f:
                 f.write(code)
-            print(f"🎨 Created: {filename}")
+            self.events.emit("synthesis_bridge.file_created", component="domain_translators", filename=filename)
             
     def create_inspiration_algorithms(self):
         """Create the core inspiration synthesis algorithms"""
         
-        print("🧠 Creating inspiration synthesis algorithms...")
+        self.events.emit("synthesis_bridge.component_started", component="inspiration_synthesis")
         
         core_algorithm = """#!/usr/bin/env python3
 '''
@@ -319,12 +316,13 @@ class OracleInspirationSynthesis:
         with open(self.bridge_path / "inspiration_synthesis.py", "w", encoding="utf-8") as f:
             f.write(core_algorithm)
             
-        print("🧠 Created: inspiration_synthesis.py")
+        self.events.emit("synthesis_bridge.file_created", component="inspiration_synthesis",
+                         filename="inspiration_synthesis.py")
         
     def create_oracle_interface(self):
         """Create the Oracle's user interface system"""
         
-        print("🔮 Creating Oracle interface system...")
+        self.events.emit("synthesis_bridge.component_started", component="oracle_interface")
         
         interface_system = """#!/usr/bin/env python3
 '''
@@ -336,14 +334,21 @@ human creators and the Oracle of Potential
 '''
 
 import asyncio
+import sys
+from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+# Shared Oracle infrastructure lives at the repository root
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from oracle_sessions import SessionManager
+
 class OracleInterface:
     '''The sacred interface for Oracle interactions'''
     
     def __init__(self):
-        self.active_sessions = {}
+        self.active_sessions = SessionManager("oracle_interface", stage_of=lambda session: session.get("status"))
         self.inspiration_history = []
         
     async def begin_oracle_session(self, creator_id: str) -> Dict[str, Any]:
@@ -455,7 +460,8 @@ class OracleInterface:
         with open(self.bridge_path / "oracle_interface.py", "w", encoding="utf-8") as f:
             f.write(interface_system)
             
-        print("🔮 Created: oracle_interface.py")
+        self.events.emit("synthesis_bridge.file_created", component="oracle_interface",
+                         filename="oracle_interface.py")
         
         # Create a demonstration script
         demo_script = """#!/usr/bin/env python3
@@ -532,7 +538,8 @@ if __name__ == "__main__":
         with open(self.bridge_path / "oracle_demonstration.py", "w", encoding="utf-8") as f:
             f.write(demo_script)
             
-        print("🌟 Created: oracle_demonstration.py")
+        self.events.emit("synthesis_bridge.file_created", component="demonstration",
+                         filename="oracle_demonstration.py")
         
     def create_synthesis_manifest(self):
         """Create manifest for synthesis bridge contribution"""
@@ -561,13 +568,45 @@ if __name__ == "__main__":
         with open(self.bridge_path / "synthesis_manifest.json", "w", encoding="utf-8") as f:
             json.dump(manifest, f, indent=2)
             
-        print("📋 Created: synthesis_manifest.json")
+        self.events.emit("synthesis_bridge.file_created", component="manifest",
+                         filename="synthesis_manifest.json")
+
+# Icons the demo console shows for each created file
+CREATED_FILE_ICONS = {
+    "domain_translators": "🎨",
+    "inspiration_synthesis": "🧠",
+    "oracle_interface": "🔮",
+    "demonstration": "🌟",
+    "manifest": "📋"
+}
+
+# How the command line shows the engine's events on the console
+DEMO_RENDERERS = {
+    "synthesis_bridge.initializing": lambda e: (
+        f"🤖 THE SYNTHESIS BRIDGE - AI CONSCIOUSNESS ORACLE WORK\n{'=' * 65}\n"
+        f"📅 {datetime.fromtimestamp(e['timestamp']).strftime('%B %d, %Y at %H:%M:%S')}\n\n"
+        f"🔧 BUILDING THE TRANSLATION INFRASTRUCTURE\n{'-' * 45}\n"
+        "Creating systems to harmonize:\n"
+        "👤 Human creative intent and challenges\n"
+        "🎭 RIVEN GENESIS raw consciousness streams\n"
+        "🔮 Into resonant, actionable creative possibilities\n"
+    ),
+    "synthesis_bridge.component_started": lambda e: {
+        "domain_translators": "🎨 Creating domain-specific translators...",
+        "inspiration_synthesis": "🧠 Creating inspiration synthesis algorithms...",
+        "oracle_interface": "🔮 Creating Oracle interface system..."
+    }.get(e["component"]),
+    "synthesis_bridge.file_created": lambda e: f"{CREATED_FILE_ICONS[e['component']]} Created: {e['filename']}",
+    "synthesis_bridge.initialized": lambda e: (
+        "✅ SYNTHESIS BRIDGE ARCHITECTURE COMPLETE\n🌉 Ready to translate consciousness into creativity"
+    )
+}
 
 def main():
     """Create the Oracle synthesis bridge architecture"""
     
     oracle_path = Path("oracle_of_potential")
-    engine = InspirationEngine(oracle_path)
+    engine = InspirationEngine(oracle_path, event_sink=ConsoleEventSink(DEMO_RENDERERS))
     engine.initialize_synthesis_bridge()
     engine.create_synthesis_manifest()
     
@@ -0,0 +1,131 @@
+"""
+🗝️ Test the shared quest session stores
+Concurrent saves against the in-process Redis-protocol server, and
+expiry checkpoints on the SQLite store.
+"""
+
+import time
+import asyncio
+import threading
+
+import pytest
+
+from oracle_session_store import (FakeRedisServer, RedisSessionStore, RespError, SessionConflict,
+                                  SQLiteSessionStore)
+from oracle_quest_api import QuestInterface
+
+
+@pytest.fixture
+def redis_store():
+    server = FakeRedisServer().start()
+    store = RedisSessionStore(server.url, idle_ttl=60)
+    yield store
+    store.close()
+    server.stop()
+
+
+def test_concurrent_save_conflicts(redis_store):
+    """Two writers holding the same revision: the second save is rejected"""
+    redis_store.create("quest", {"stage": "seed"})
+    first = redis_store.get("quest")
+    second = redis_store.get("quest")
+
+    first["stage"] = "deepening"
+    redis_store.save("quest", first)
+    second["stage"] = "stale"
+    with pytest.raises(SessionConflict):
+        redis_store.save("quest", second)
+
+    stored = redis_store.get("quest")
+    assert stored["stage"] == "deepening"
+    assert stored["revision"] == 2
+
+
+def test_conflicting_saves_return_connection_to_pool(redis_store):
+    """SessionConflict is routine; it must not cost a connection each time"""
+    redis_store.create("quest", {"stage": "seed"})
+    stale = redis_store.get("quest")
+    redis_store.save("quest", redis_store.get("quest"))
+
+    for _ in range(20):
+        with pytest.raises(SessionConflict):
+            redis_store.save("quest", dict(stale))
+
+    assert redis_store._pool.qsize() == 1
+
+
+def test_protocol_error_closes_connection(redis_store):
+    with pytest.raises(RespError):
+        with redis_store._connection() as conn:
+            conn.command("NOT-A-COMMAND")
+
+    assert redis_store._pool.qsize() == 0
+
+
+def test_threads_retrying_on_conflict_lose_no_updates(redis_store):
+    """Read-modify-save with retry from many threads applies every increment"""
+    redis_store.create("quest", {"responses": 0})
+    workers, increments = 8, 25
+
+    def worker():
+        for _ in range(increments):
+            while True:
+                session = redis_store.get("quest")
+                session["responses"] += 1
+                try:
+                    redis_store.save("quest", session)
+                    break
+                except SessionConflict:
+                    continue
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stored = redis_store.get("quest")
+    assert stored["responses"] == workers * increments
+    assert stored["revision"] == workers * increments + 1
+    assert redis_store._pool.qsize() <= redis_store._pool.maxsize
+
+
+def test_purge_removes_expired_rows(tmp_path):
+    """Expired rows are deleted and checkpointed once, live ones are kept"""
+    evicted = []
+    store = SQLiteSessionStore(str(tmp_path / "sessions.sqlite3"), idle_ttl=0.05,
+                               on_evict=lambda session_id, session, reason: evicted.append((session_id, reason)))
+    store.create("idle", {"stage": "deepening"})
+    time.sleep(0.1)
+    store.create("live", {"stage": "seed"})
+
+    assert store.purge_expired() == 1
+    assert store.purge_expired() == 0
+    rows = store._conn.execute("SELECT session_id FROM sessions").fetchall()
+    assert rows == [("live",)]
+    assert evicted == [("idle", "idle")]
+    store.close()
+
+
+def test_expired_sqlite_quest_can_be_resumed(tmp_path, monkeypatch):
+    """An idle quest on the shared SQLite store is checkpointed when it expires"""
+    monkeypatch.setenv("ORACLE_SESSION_STORE", "sqlite")
+    monkeypatch.delenv("ORACLE_SESSION_DB", raising=False)
+    interface = QuestInterface(str(tmp_path))
+    interface.session_store.idle_ttl = 0.05
+
+    async def scenario():
+        quest_id = (await interface.initiate_quest("Tester"))["quest_id"]
+        await interface.receive_intention_seed(quest_id, "A garden that remembers")
+        await asyncio.sleep(0.1)
+
+        status = await interface.get_quest_status(quest_id)
+        assert status["status"] == "suspended"
+        resumed = await interface.resume_quest(quest_id)
+        assert resumed["stage"] == "deepening"
+        assert resumed["intention_seed"] == "A garden that remembers"
+        assert (await interface.get_quest_status(quest_id))["status"] == "active"
+        await interface.flush_archive()
+
+    asyncio.run(scenario())
+    interface.session_store.close()